@@ -30,17 +30,38 @@ except ImportError:
     pass
 
 import gc
+import struct
+from array import array
+from io import BytesIO
 from fontio import Glyph
-from .glyph_cache import GlyphCache
+from .glyph_cache import GlyphCache, unpack_bitmap
+
+try:
+    from bitmaptools import readinto as _bitmap_readinto
+except ImportError:
+    _bitmap_readinto = None  # pylint: disable=invalid-name
+
+try:
+    from binascii import unhexlify as _unhexlify
+except ImportError:
+    _unhexlify = bytes.fromhex  # pylint: disable=invalid-name
 
 __version__ = "2.1.2"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
 
+# Sidecar index layout: header, then ``count`` code points followed by
+# ``count`` STARTCHAR byte offsets, both as little endian uint32 arrays.
+_INDEX_MAGIC = b"BDFX"
+_INDEX_VERSION = 1
+_INDEX_HEADER = "<4sHII"
+
 
 class BDF(GlyphCache):
     """Loads glyphs from a BDF file in the given bitmap_class."""
 
-    def __init__(self, f: FileIO, bitmap_class: Bitmap) -> None:
+    def __init__(
+        self, f: FileIO, bitmap_class: Bitmap, index_file: Optional[str] = None
+    ) -> None:
         super().__init__()
         self.file = f
         self.name = f
@@ -55,6 +76,9 @@ class BDF(GlyphCache):
         self.y_resolution = None
         self._ascent = None
         self._descent = None
+        self._index_file = index_file
+        self._index_code_points = None
+        self._index_offsets = None
 
     @property
     def descent(self) -> Optional[int]:
@@ -120,16 +144,138 @@ class BDF(GlyphCache):
         """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
         return self._boundingbox
 
+    def _find_offset(self, code_point: int) -> Optional[int]:
+        """Binary search the code point index for the STARTCHAR offset of a glyph"""
+        code_points = self._index_code_points
+        low = 0
+        high = len(code_points)
+        while low < high:
+            mid = (low + high) // 2
+            if code_points[mid] < code_point:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(code_points) and code_points[low] == code_point:
+            return self._index_offsets[low]
+        return None
+
+    def _file_size(self) -> int:
+        self.file.seek(0, 2)
+        return self.file.tell()
+
+    def _build_index(self) -> None:
+        """Walk the file once, recording the byte offset of every STARTCHAR by
+        its ENCODING so later loads can seek straight to the requested glyphs."""
+        if self._index_file and self._read_index_file():
+            return
+
+        code_points = array("I")
+        offsets = array("I")
+        in_order = True
+        last_code_point = -1
+        char_offset = 0
+        position = 0
+        self.file.seek(0)
+        while True:
+            line = self.file.readline()
+            if not line:
+                break
+            if line.startswith(b"STARTCHAR"):
+                char_offset = position
+            elif line.startswith(b"ENCODING"):
+                code_point = int(line.split()[1])
+                if code_point >= 0:
+                    if code_point < last_code_point:
+                        in_order = False
+                    last_code_point = code_point
+                    code_points.append(code_point)
+                    offsets.append(char_offset)
+            elif line.startswith(b"SIZE"):
+                _, self.point_size, self.x_resolution, self.y_resolution = line.split()
+            position += len(line)
+
+        if not in_order:
+            pairs = sorted(zip(code_points, offsets))
+            code_points = array("I", (pair[0] for pair in pairs))
+            offsets = array("I", (pair[1] for pair in pairs))
+            del pairs
+
+        self._index_code_points = code_points
+        self._index_offsets = offsets
+        if self._index_file:
+            self.save_index(self._index_file)
+
+    def _read_index_file(self) -> bool:
+        """Load the code point index from a sidecar file. Returns False when the
+        file is missing or was built for a different version of the font."""
+        try:
+            index_file = open(  # pylint: disable=consider-using-with
+                self._index_file, "rb"
+            )
+        except OSError:
+            return False
+
+        try:
+            header = index_file.read(struct.calcsize(_INDEX_HEADER))
+            if len(header) != struct.calcsize(_INDEX_HEADER):
+                return False
+            magic, version, font_size, count = struct.unpack(_INDEX_HEADER, header)
+            if (
+                magic != _INDEX_MAGIC
+                or version != _INDEX_VERSION
+                or font_size != self._file_size()
+            ):
+                return False
+            # The initial contents are placeholders overwritten by readinto.
+            code_points = array("I", range(count))
+            offsets = array("I", range(count))
+            if index_file.readinto(code_points) != 4 * count:
+                return False
+            if index_file.readinto(offsets) != 4 * count:
+                return False
+        finally:
+            index_file.close()
+
+        self._index_code_points = code_points
+        self._index_offsets = offsets
+        self._read_size()
+        return True
+
+    def _read_size(self) -> None:
+        self.file.seek(0)
+        while True:
+            line = self.file.readline()
+            if not line or line.startswith(b"CHARS "):
+                break
+            if line.startswith(b"SIZE"):
+                _, self.point_size, self.x_resolution, self.y_resolution = line.split()
+                break
+
+    def save_index(self, filename: str) -> bool:
+        """Write the code point index to a sidecar file so it does not have to be
+        rebuilt the next time the font is loaded. Returns False if the file could
+        not be written, for example because the filesystem is read-only."""
+        if self._index_code_points is None:
+            self._build_index()
+        try:
+            with open(filename, "wb") as index_file:
+                index_file.write(
+                    struct.pack(
+                        _INDEX_HEADER,
+                        _INDEX_MAGIC,
+                        _INDEX_VERSION,
+                        self._file_size(),
+                        len(self._index_code_points),
+                    )
+                )
+                index_file.write(self._index_code_points)
+                index_file.write(self._index_offsets)
+        except OSError:
+            return False
+        return True
+
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
         # pylint: disable=too-many-statements,too-many-branches,too-many-nested-blocks,too-many-locals
-        metadata = True
-        character = False
-        code_point = None
-        bytes_per_row = 1
-        desired_character = False
-        current_info = {}
-        current_y = 0
-        rounded_x = 1
         if isinstance(code_points, int):
             remaining = set()
             remaining.add(code_points)
@@ -140,33 +286,41 @@ class BDF(GlyphCache):
         else:
             remaining = set(code_points)
         for code_point in remaining.copy():
-            if code_point in self._glyphs and self._glyphs[code_point]:
+            if self._is_loaded(code_point):
                 remaining.remove(code_point)
         if not remaining:
             return
 
-        x, _, _, _ = self._boundingbox
+        if self._index_code_points is None:
+            self._build_index()
 
-        self.file.seek(0)
+        offsets = []
+        for code_point in remaining:
+            offset = self._find_offset(code_point)
+            if offset is not None:
+                offsets.append(offset)
+        # Visit the glyphs in file order so the reads tend to move forward.
+        offsets.sort()
+
+        gc.collect()
+        for offset in offsets:
+            self.file.seek(offset)
+            self._load_glyph()
+
+    def _load_glyph(self) -> None:
+        """Parse the glyph starting at the current file position"""
+        code_point = None
+        current_info = {"bitmap": None, "bounds": None, "shift": None}
         while True:
             line = self.file.readline()
             if not line:
                 break
-            if line.startswith(b"CHARS "):
-                metadata = False
-            elif line.startswith(b"SIZE"):
-                _, self.point_size, self.x_resolution, self.y_resolution = line.split()
-            elif line.startswith(b"COMMENT"):
-                pass
-            elif line.startswith(b"STARTCHAR"):
-                character = True
-            elif line.startswith(b"ENDCHAR"):
-                character = False
-                if desired_character:
-                    bounds = current_info["bounds"]
-                    shift = current_info["shift"]
-                    gc.collect()
-                    self._glyphs[code_point] = Glyph(
+            if line.startswith(b"ENDCHAR"):
+                bounds = current_info["bounds"]
+                shift = current_info["shift"]
+                self._add_glyph(
+                    code_point,
+                    Glyph(
                         current_info["bitmap"],
                         0,
                         bounds[0],
@@ -175,59 +329,46 @@ class BDF(GlyphCache):
                         bounds[3],
                         shift[0],
                         shift[1],
-                    )
-                    remaining.remove(code_point)
-                    if not remaining:
-                        return
-                desired_character = False
-            elif line.startswith(b"BBX"):
-                if desired_character:
-                    _, x, y, x_offset, y_offset = line.split()
-                    x = int(x)
-                    y = int(y)
-                    x_offset = int(x_offset)
-                    y_offset = int(y_offset)
-                    current_info["bounds"] = (x, y, x_offset, y_offset)
-                    current_info["bitmap"] = self.bitmap_class(x, y, 2)
+                    ),
+                )
+                return
+            if line.startswith(b"BBX"):
+                _, x, y, x_offset, y_offset = line.split()
+                x = int(x)
+                y = int(y)
+                x_offset = int(x_offset)
+                y_offset = int(y_offset)
+                current_info["bounds"] = (x, y, x_offset, y_offset)
+                current_info["bitmap"] = self.bitmap_class(x, y, 2)
             elif line.startswith(b"BITMAP"):
-                if desired_character:
-                    rounded_x = x // 8
-                    if x % 8 > 0:
-                        rounded_x += 1
-                    bytes_per_row = rounded_x
-                    if bytes_per_row % 4 > 0:
-                        bytes_per_row += 4 - bytes_per_row % 4
-                    current_y = 0
+                self._read_bitmap(current_info["bitmap"], *current_info["bounds"][:2])
             elif line.startswith(b"ENCODING"):
                 _, code_point = line.split()
                 code_point = int(code_point)
-                if code_point in remaining:
-                    desired_character = True
-                    current_info = {"bitmap": None, "bounds": None, "shift": None}
             elif line.startswith(b"DWIDTH"):
-                if desired_character:
-                    _, shift_x, shift_y = line.split()
-                    shift_x = int(shift_x)
-                    shift_y = int(shift_y)
-                    current_info["shift"] = (shift_x, shift_y)
-            elif line.startswith(b"SWIDTH"):
-                pass
-            elif character:
-                if desired_character:
-                    bits = int(line.strip(), 16)
-                    width = current_info["bounds"][0]
-                    start = current_y * width
-                    x = 0
-                    for i in range(rounded_x):
-                        val = (bits >> ((rounded_x - i - 1) * 8)) & 0xFF
-                        for j in range(7, -1, -1):
-                            if x >= width:
-                                break
-                            bit = 0
-                            if val & (1 << j) != 0:
-                                bit = 1
-                            current_info["bitmap"][start + x] = bit
-                            x += 1
-                    current_y += 1
-            elif metadata:
-                pass
+                _, shift_x, shift_y = line.split()
+                shift_x = int(shift_x)
+                shift_y = int(shift_y)
+                current_info["shift"] = (shift_x, shift_y)
+
+    def _read_bitmap(self, bitmap: Bitmap, width: int, height: int) -> None:
+        """Decode the hex rows following a BITMAP line into the bitmap"""
+        row_bytes = (width + 7) // 8
+        data = bytearray(row_bytes * height)
+        start = 0
+        for _ in range(height):
+            line = self.file.readline().strip()
+            data[start : start + row_bytes] = _unhexlify(line[: 2 * row_bytes])
+            start += row_bytes
+
+        if _bitmap_readinto:
+            _bitmap_readinto(
+                bitmap,
+                BytesIO(data),
+                bits_per_pixel=1,
+                element_size=1,
+                reverse_pixels_in_element=True,
+            )
+            return
+
+        unpack_bitmap(bitmap, data, width, height)
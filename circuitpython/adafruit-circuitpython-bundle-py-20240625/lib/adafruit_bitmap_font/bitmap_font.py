@@ -28,6 +28,7 @@ try:
     from . import bdf
     from . import pcf
     from . import ttf
+    from . import pbf
 except ImportError:
     pass
 
@@ -36,9 +37,12 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
 
 
 def load_font(
-    filename: str, bitmap: Optional[Bitmap] = None
-) -> Union[bdf.BDF, pcf.PCF, ttf.TTF]:
-    """Loads a font file. Returns None if unsupported."""
+    filename: str, bitmap: Optional[Bitmap] = None, index: bool = False
+) -> Union[bdf.BDF, pcf.PCF, ttf.TTF, pbf.PBF]:
+    """Loads a font file. Returns None if unsupported.
+
+    When ``index`` is True, BDF fonts keep their code point offset table in a
+    ``.idx`` sidecar file next to the font so that it is only built once."""
     # pylint: disable=import-outside-toplevel, redefined-outer-name, consider-using-with
     if not bitmap:
         import displayio
@@ -49,7 +53,7 @@ def load_font(
     if filename.endswith("bdf") and first_four == b"STAR":
         from . import bdf
 
-        return bdf.BDF(font_file, bitmap)
+        return bdf.BDF(font_file, bitmap, filename + ".idx" if index else None)
     if filename.endswith("pcf") and first_four == b"\x01fcp":
         from . import pcf
 
@@ -58,5 +62,9 @@ def load_font(
         from . import ttf
 
         return ttf.TTF(font_file, bitmap)
+    if filename.endswith("pbf") and first_four == b"PBF\x00":
+        from . import pbf
+
+        return pbf.PBF(font_file, bitmap)
 
     raise ValueError("Unknown magic number %r" % first_four)
@@ -23,34 +23,163 @@ Implementation Notes
 """
 
 try:
-    from typing import Union, Iterable
+    from typing import Union, Iterable, Optional
     from fontio import Glyph
+    from displayio import Bitmap
 except ImportError:
     pass
 
 import gc
+from micropython import const
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    # Small builds lack OrderedDict, the glyph cache then evicts an arbitrary
+    # glyph instead of the least recently used one
+    OrderedDict = dict  # pylint: disable=invalid-name
 
 __version__ = "2.1.2"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
 
+# Rough heap cost of a cache entry besides its bitmap pixels: the Glyph and
+# Bitmap objects plus the dict slot. Missing glyphs are charged this too.
+_ENTRY_BYTES = const(64)
+
+# Set bit positions (MSB first) of every byte value, built on first use.
+_SET_BITS = None
+
+
+def unpack_bitmap(bitmap: Bitmap, data: bytes, width: int, height: int) -> None:
+    """Unpacks 1 bit per pixel rows, MSB first and padded to whole bytes, into
+    a cleared bitmap. Used by loaders when bitmaptools is unavailable."""
+    global _SET_BITS  # pylint: disable=global-statement
+    if _SET_BITS is None:
+        _SET_BITS = tuple(
+            tuple(k for k in range(8) if byte & (0x80 >> k)) for byte in range(256)
+        )
+    set_bits = _SET_BITS
+    start = 0
+    i = 0
+    for _ in range(height):
+        for x in range(0, width, 8):
+            byte = data[i]
+            i += 1
+            if byte:
+                for k in set_bits[byte]:
+                    if x + k < width:
+                        bitmap[start + x + k] = 1
+        start += width
+
+
+def _glyph_bytes(glyph: Optional[Glyph]) -> int:
+    if glyph is None:
+        return _ENTRY_BYTES
+    # 1 bit per pixel with each row padded to 32 bits
+    return _ENTRY_BYTES + (glyph.width + 31) // 32 * 4 * glyph.height
+
 
 class GlyphCache:
-    """Caches glyphs loaded by a subclass."""
+    """Caches glyphs loaded by a subclass.
+
+    The cache is unbounded unless limited with `set_cache_limits`, after which
+    the least recently used glyphs are evicted. Glyphs loaded with `pin` are
+    never evicted. `hits`, `misses` and `evictions` count cache activity."""
 
     def __init__(self) -> None:
-        self._glyphs = {}
+        self._glyphs = OrderedDict()
+        self._pinned = {}
+        self._max_glyphs = None
+        self._max_bytes = None
+        self._cache_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
         """Loads displayio.Glyph objects into the GlyphCache from the font."""
 
+    def set_cache_limits(
+        self, max_glyphs: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """Bounds the number of cached glyphs and/or their approximate heap use in
+        bytes, evicting least recently used glyphs as needed. ``None`` means no
+        limit. Pinned glyphs are not counted."""
+        self._max_glyphs = max_glyphs
+        self._max_bytes = max_bytes
+        self._evict()
+
+    @property
+    def cache_bytes(self) -> int:
+        """Approximate heap use of the evictable cached glyphs"""
+        return self._cache_bytes
+
+    def pin(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        """Loads the given code points and keeps them cached regardless of the
+        cache limits, e.g. for a character set that is always on screen."""
+        if isinstance(code_points, int):
+            code_points = (code_points,)
+        elif isinstance(code_points, str):
+            code_points = [ord(c) for c in code_points]
+        else:
+            code_points = list(code_points)
+        for code_point in code_points:
+            if code_point in self._pinned:
+                continue
+            glyph = None
+            if code_point in self._glyphs:
+                glyph = self._glyphs.pop(code_point)
+                self._cache_bytes -= _glyph_bytes(glyph)
+            self._pinned[code_point] = glyph
+        self.load_glyphs(code_points)
+
+    def _is_loaded(self, code_point: int) -> bool:
+        """Whether a glyph for the code point has been loaded, for subclasses
+        deciding what load_glyphs still has to read."""
+        return bool(self._pinned.get(code_point) or self._glyphs.get(code_point))
+
+    def _add_glyph(self, code_point: int, glyph: Optional[Glyph]) -> None:
+        """Stores a glyph loaded by a subclass, evicting older glyphs if the
+        cache is over its limits."""
+        if code_point in self._pinned:
+            self._pinned[code_point] = glyph
+            return
+        if code_point in self._glyphs:
+            self._cache_bytes -= _glyph_bytes(self._glyphs.pop(code_point))
+        self._glyphs[code_point] = glyph
+        self._cache_bytes += _glyph_bytes(glyph)
+        self._evict(code_point)
+
+    def _evict(self, keep: Optional[int] = None) -> None:
+        # The most recently added glyph always stays so get_glyph can return it.
+        # It is skipped explicitly as the plain dict fallback may iterate it first.
+        while len(self._glyphs) > 1 and (
+            (self._max_glyphs is not None and len(self._glyphs) > self._max_glyphs)
+            or (self._max_bytes is not None and self._cache_bytes > self._max_bytes)
+        ):
+            for oldest in self._glyphs:
+                if oldest != keep:
+                    break
+            self._cache_bytes -= _glyph_bytes(self._glyphs.pop(oldest))
+            self.evictions += 1
+
     def get_glyph(self, code_point: int) -> Glyph:
         """Returns a displayio.Glyph for the given code point or None is unsupported."""
+        if code_point in self._pinned:
+            self.hits += 1
+            return self._pinned[code_point]
         if code_point in self._glyphs:
-            return self._glyphs[code_point]
+            self.hits += 1
+            # Reinsert to mark it as the most recently used.
+            glyph = self._glyphs.pop(code_point)
+            self._glyphs[code_point] = glyph
+            return glyph
 
+        self.misses += 1
         code_points = set()
         code_points.add(code_point)
-        self._glyphs[code_point] = None
+        # Remembers a missing glyph until it is evicted like any other entry.
+        self._add_glyph(code_point, None)
         self.load_glyphs(code_points)
         gc.collect()
-        return self._glyphs[code_point]
+        return self._glyphs.get(code_point)
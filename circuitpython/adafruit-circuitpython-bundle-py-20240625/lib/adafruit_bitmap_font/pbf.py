@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2024 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.pbf`
+====================================================
+
+Loads packed bitmap fonts (PBF), a precompiled binary format that is read
+with a handful of seeks instead of being parsed. Use
+`adafruit_bitmap_font.pbf_writer` to convert BDF and PCF fonts.
+
+The file is little endian:
+
+* a fixed header (see ``_HEADER``): magic, version, bounding box, ascent,
+  descent, glyph count and the offset of the glyph data
+* the code points of every glyph as a sorted ``uint32`` array
+* one metrics record per glyph in the same order (see ``_METRICS``):
+  width, height, dx, dy, shift_x, shift_y and the offset of its bitmap
+  relative to the start of the glyph data
+* the glyph bitmaps, 1 bit per pixel, MSB first, rows padded to whole bytes
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Union, Optional, Tuple, Iterable
+    from io import FileIO
+    from displayio import Bitmap
+except ImportError:
+    pass
+
+import gc
+import struct
+from array import array
+from fontio import Glyph
+from .glyph_cache import GlyphCache, unpack_bitmap
+
+try:
+    from bitmaptools import readinto as _bitmap_readinto
+except ImportError:
+    _bitmap_readinto = None  # pylint: disable=invalid-name
+
+__version__ = "2.1.2"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+MAGIC = b"PBF\x00"
+VERSION = 1
+_HEADER = "<4sHH6hII"
+_METRICS = "<6hI"
+
+
+class PBF(GlyphCache):
+    """Loads glyphs from a packed bitmap font file in the given bitmap_class."""
+
+    def __init__(self, f: FileIO, bitmap_class: Bitmap) -> None:
+        super().__init__()
+        self.file = f
+        self.name = f
+        f.seek(0)
+        self.bitmap_class = bitmap_class
+        self.buffer = bytearray(struct.calcsize(_HEADER))
+        f.readinto(self.buffer)
+        (
+            magic,
+            version,
+            _,
+            width,
+            height,
+            x_offset,
+            y_offset,
+            self._ascent,
+            self._descent,
+            glyph_count,
+            self._bitmap_offset,
+        ) = struct.unpack_from(_HEADER, self.buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Unsupported file version")
+        self._bounding_box = (width, height, x_offset, y_offset)
+
+        # The initial contents are placeholders overwritten by readinto.
+        self._code_points = array("I", range(glyph_count))
+        f.readinto(self._code_points)
+        self._metrics_offset = f.tell()
+        self._metrics_size = struct.calcsize(_METRICS)
+
+    @property
+    def ascent(self) -> int:
+        """The number of pixels above the baseline of a typical ascender"""
+        return self._ascent
+
+    @property
+    def descent(self) -> int:
+        """The number of pixels below the baseline of a typical descender"""
+        return self._descent
+
+    def get_bounding_box(self) -> Tuple[int, int, int, int]:
+        """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
+        return self._bounding_box
+
+    def _find_index(self, code_point: int) -> Optional[int]:
+        code_points = self._code_points
+        low = 0
+        high = len(code_points)
+        while low < high:
+            mid = (low + high) // 2
+            if code_points[mid] < code_point:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(code_points) and code_points[low] == code_point:
+            return low
+        return None
+
+    def _read_metrics(self, index: int) -> Tuple[int, int, int, int, int, int, int]:
+        if len(self.buffer) != self._metrics_size:
+            self.buffer = bytearray(self._metrics_size)
+        self.file.seek(self._metrics_offset + self._metrics_size * index)
+        self.file.readinto(self.buffer)
+        return struct.unpack_from(_METRICS, self.buffer)
+
+    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        if isinstance(code_points, int):
+            code_points = (code_points,)
+        elif isinstance(code_points, str):
+            code_points = [ord(c) for c in code_points]
+
+        indices = []
+        for code_point in code_points:
+            if self._is_loaded(code_point):
+                continue
+            index = self._find_index(code_point)
+            if index is not None:
+                indices.append(index)
+        if not indices:
+            return
+        # Code points are stored sorted, so this keeps the reads moving forward.
+        indices.sort()
+
+        gc.collect()
+        for index in indices:
+            width, height, dx, dy, shift_x, shift_y, offset = self._read_metrics(
+                index
+            )
+            bitmap = self.bitmap_class(width, height, 2)
+            self.file.seek(self._bitmap_offset + offset)
+            if _bitmap_readinto:
+                _bitmap_readinto(
+                    bitmap,
+                    self.file,
+                    bits_per_pixel=1,
+                    element_size=1,
+                    reverse_pixels_in_element=True,
+                )
+            else:
+                unpack_bitmap(
+                    bitmap, self.file.read((width + 7) // 8 * height), width, height
+                )
+            self._add_glyph(
+                self._code_points[index],
+                Glyph(bitmap, 0, width, height, dx, dy, shift_x, shift_y),
+            )
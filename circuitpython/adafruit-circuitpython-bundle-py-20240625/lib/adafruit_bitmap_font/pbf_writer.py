@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2024 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.pbf_writer`
+====================================================
+
+Converts BDF and PCF fonts to the packed bitmap font format read by
+`adafruit_bitmap_font.pbf`. Meant to be run on a host computer::
+
+    python -m adafruit_bitmap_font.pbf_writer font.bdf font.pbf [characters]
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Python 3 with Adafruit Blinka's ``fontio``, or CircuitPython
+
+"""
+
+try:
+    from typing import Iterable, Optional, Union
+    from .bdf import BDF
+    from .pcf import PCF
+except ImportError:
+    pass
+
+import struct
+import sys
+from . import bitmap_font
+from .pbf import MAGIC, VERSION, _HEADER, _METRICS
+
+__version__ = "2.1.2"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+
+class _Bitmap:
+    """Minimal stand-in for displayio.Bitmap so conversion needs no display."""
+
+    def __init__(self, width: int, height: int, _value_count: int) -> None:
+        self.width = width
+        self.height = height
+        self._pixels = bytearray(width * height)
+
+    def _index(self, index: Union[int, tuple]) -> int:
+        if isinstance(index, tuple):
+            return index[1] * self.width + index[0]
+        return index
+
+    def __getitem__(self, index: Union[int, tuple]) -> int:
+        return self._pixels[self._index(index)]
+
+    def __setitem__(self, index: Union[int, tuple], value: int) -> None:
+        self._pixels[self._index(index)] = value
+
+
+def _font_code_points(font: Union[BDF, PCF]) -> Iterable[int]:
+    """Every code point the font has a glyph for, as far as it can tell."""
+    # pylint: disable=protected-access
+    if hasattr(font, "_build_index"):
+        if font._index_code_points is None:
+            font._build_index()
+        return font._index_code_points
+    # Only cells of the PCF encoding table that point to a glyph
+    from .pcf import _PCF_BDF_ENCODINGS  # pylint: disable=import-outside-toplevel
+
+    encoding = font._encoding
+    columns = encoding.max_byte2 - encoding.min_byte2 + 1
+    cells = (encoding.max_byte1 - encoding.min_byte1 + 1) * columns
+    font.file.seek(font.tables[_PCF_BDF_ENCODINGS].offset + 14)
+    indices = struct.unpack(">%dH" % cells, font.file.read(2 * cells))
+    return [
+        (encoding.min_byte1 + cell // columns) << 8
+        | (encoding.min_byte2 + cell % columns)
+        for cell, index in enumerate(indices)
+        if index != 0xFFFF
+    ]
+
+
+def _pack_rows(bitmap, width: int, height: int) -> bytearray:
+    row_bytes = (width + 7) // 8
+    data = bytearray(row_bytes * height)
+    for y in range(height):
+        for x in range(width):
+            if bitmap[x, y]:
+                data[y * row_bytes + x // 8] |= 0x80 >> (x % 8)
+    return data
+
+
+def write_font(
+    font: Union[BDF, PCF],
+    filename: str,
+    code_points: Optional[Union[str, Iterable[int]]] = None,
+) -> int:
+    """Writes the glyphs of a loaded font to a packed bitmap font file. By default
+    every glyph in the font is written; pass ``code_points`` (a string or
+    iterable of ints) to keep only a subset. Returns the number of glyphs."""
+    if code_points is None:
+        code_points = _font_code_points(font)
+    elif isinstance(code_points, str):
+        code_points = [ord(c) for c in code_points]
+    code_points = sorted(set(code_points))
+
+    font.load_glyphs(code_points)
+    # get_glyph() would try to load every missing code point again, one at a time
+    loaded = font._glyphs  # pylint: disable=protected-access
+    glyphs = [
+        (code_point, loaded[code_point])
+        for code_point in code_points
+        if loaded.get(code_point) is not None
+    ]
+
+    header_size = struct.calcsize(_HEADER)
+    metrics_size = struct.calcsize(_METRICS)
+    bitmap_offset = header_size + (4 + metrics_size) * len(glyphs)
+
+    metrics = bytearray()
+    data = bytearray()
+    for _, glyph in glyphs:
+        metrics += struct.pack(
+            _METRICS,
+            glyph.width,
+            glyph.height,
+            glyph.dx,
+            glyph.dy,
+            glyph.shift_x,
+            glyph.shift_y,
+            len(data),
+        )
+        data += _pack_rows(glyph.bitmap, glyph.width, glyph.height)
+
+    width, height, x_offset, y_offset = font.get_bounding_box()
+    with open(filename, "wb") as out:
+        out.write(
+            struct.pack(
+                _HEADER,
+                MAGIC,
+                VERSION,
+                0,
+                width,
+                height,
+                x_offset,
+                y_offset,
+                font.ascent or 0,
+                font.descent or 0,
+                len(glyphs),
+                bitmap_offset,
+            )
+        )
+        out.write(struct.pack("<%dI" % len(glyphs), *(cp for cp, _ in glyphs)))
+        out.write(metrics)
+        out.write(data)
+    return len(glyphs)
+
+
+def convert(
+    source: str,
+    destination: str,
+    code_points: Optional[Union[str, Iterable[int]]] = None,
+) -> int:
+    """Converts a BDF or PCF font file to a packed bitmap font file"""
+    font = bitmap_font.load_font(source, _Bitmap)
+    return write_font(font, destination, code_points)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print("usage: pbf_writer.py SOURCE.bdf|pcf DESTINATION.pbf [CHARACTERS]")
+        sys.exit(2)
+    count = convert(*sys.argv[1:])
+    print("Wrote %d glyphs to %s" % (count, sys.argv[2]))
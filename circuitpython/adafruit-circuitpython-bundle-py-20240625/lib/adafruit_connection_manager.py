@@ -26,9 +26,43 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ConnectionManager
 
 import errno
 import sys
+import time
 
 WIZNET5K_SSL_SUPPORT_VERSION = (9, 1)
 
+# Errors a read on a closed socket raises, as opposed to one that would block.
+_CLOSED_SOCKET_ERRORS = (
+    errno.EBADF,
+    errno.ECONNABORTED,
+    errno.ECONNRESET,
+    errno.ENOTCONN,
+)
+
+# Connect errors that closing another socket can cure
+_OUT_OF_MEMORY_ERRORS = (errno.ENOMEM, getattr(errno, "ENOBUFS", errno.ENOMEM))
+
+
+try:
+    # Connect timeouts of CPython have no errno
+    _TIMEOUT_ERROR = TimeoutError
+except NameError:
+    _TIMEOUT_ERROR = ()
+
+
+def _may_be_out_of_memory(error: Exception) -> bool:
+    """Whether a connect error may be caused by other sockets using up memory."""
+    if isinstance(error, MemoryError):
+        return True
+    if not isinstance(error, OSError) or isinstance(error, _TIMEOUT_ERROR):
+        return False
+    # A TLS handshake that runs out of memory on CircuitPython raises an OSError
+    # without errno ("Failed SSL handshake") or with a negative mbedtls error code
+    code = error.args[0] if error.args else None
+    if not isinstance(code, int):
+        return True
+    return code < 0 or code in _OUT_OF_MEMORY_ERRORS
+
+
 if not sys.implementation.name == "circuitpython":
     from typing import List, Optional, Tuple
 
@@ -197,17 +231,51 @@ def get_radio_ssl_context(radio):
 
 
 class ConnectionManager:
-    """A library for managing sockets across multiple hardware platforms and libraries."""
+    """A library for managing sockets across multiple hardware platforms and libraries.
+
+    Sockets are pooled per ``(host, port, proto, session_id)``. Up to
+    ``max_sockets_per_host`` sockets may be open for the same key at once, and freed
+    sockets are kept open so that later requests can reuse them without connecting
+    (and doing a TLS handshake) again.
+
+    :param SocketpoolModuleType socket_pool: the socket pool to create sockets with
+    :param int max_sockets_per_host: how many sockets may be open to the same host
+      at once. Defaults to ``1``.
+    :param Optional[float] idle_timeout: how long, in seconds, a freed socket may sit
+      unused before it is closed. ``None`` (the default) keeps freed sockets until
+      the radio runs out of sockets.
+    :param float dns_cache_ttl: how long, in seconds, a resolved address is reused
+      before the host is looked up again. ``0`` disables the DNS cache.
+    :param float dns_cache_negative_ttl: how long, in seconds, a failed lookup is
+      remembered, so that retry loops do not hammer the resolver
+    :param int dns_cache_size: the most hosts to keep resolved addresses for
+    """
 
     def __init__(
         self,
         socket_pool: SocketpoolModuleType,
+        *,
+        max_sockets_per_host: int = 1,
+        idle_timeout: Optional[float] = None,
+        dns_cache_ttl: float = 300,
+        dns_cache_negative_ttl: float = 5,
+        dns_cache_size: int = 8,
     ) -> None:
         self._socket_pool = socket_pool
-        # Hang onto open sockets so that we can reuse them.
-        self._available_sockets = set()
+        self.max_sockets_per_host = max_sockets_per_host
+        self.idle_timeout = idle_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.dns_cache_negative_ttl = dns_cache_negative_ttl
+        self.dns_cache_size = dns_cache_size
+        # (host, port) -> (expiry time, address info or the lookup error)
+        self._dns_cache = {}
+        # Hang onto open sockets so that we can reuse them. Available sockets map to
+        # the time they were freed, so the least recently used can be closed first.
+        self._available_sockets = {}
         self._key_by_managed_socket = {}
         self._managed_socket_by_key = {}
+        self._opened_socket_count = 0
+        self._reused_socket_count = 0
 
     def _free_sockets(self, force: bool = False) -> None:
         # cloning lists since items are being removed
@@ -215,45 +283,147 @@ class ConnectionManager:
         for socket in available_sockets:
             self.close_socket(socket)
         if force:
-            open_sockets = list(self._managed_socket_by_key.values())
+            open_sockets = list(self._key_by_managed_socket)
             for socket in open_sockets:
                 self.close_socket(socket)
 
+    def _close_idle_sockets(self) -> None:
+        if self.idle_timeout is None or not self._available_sockets:
+            return
+        expired = time.monotonic() - self.idle_timeout
+        for socket, freed in list(self._available_sockets.items()):
+            if freed < expired:
+                self.close_socket(socket)
+
+    def _close_least_recently_used(self) -> bool:
+        """Close the socket that has been available the longest, if there is one."""
+        if not self._available_sockets:
+            return False
+        oldest = None
+        oldest_freed = None
+        for socket, freed in self._available_sockets.items():
+            if oldest_freed is None or freed < oldest_freed:
+                oldest = socket
+                oldest_freed = freed
+        self.close_socket(oldest)
+        return True
+
+    def _getaddrinfo(self, host: str, port: int):
+        """Resolve host, answering from the DNS cache while the entry is fresh."""
+        if self.dns_cache_ttl <= 0:
+            return self._socket_pool.getaddrinfo(
+                host, port, 0, self._socket_pool.SOCK_STREAM
+            )[0]
+
+        now = time.monotonic()
+        key = (host, port)
+        entry = self._dns_cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                if isinstance(entry[1], Exception):
+                    raise entry[1]
+                return entry[1]
+            del self._dns_cache[key]
+
+        try:
+            result = self._socket_pool.getaddrinfo(
+                host, port, 0, self._socket_pool.SOCK_STREAM
+            )[0]
+            expires = now + self.dns_cache_ttl
+        except (OSError, RuntimeError) as error:
+            if self.dns_cache_negative_ttl <= 0:
+                raise
+            result = error
+            expires = now + self.dns_cache_negative_ttl
+
+        while self._dns_cache and len(self._dns_cache) >= self.dns_cache_size:
+            # Make room by dropping the entry closest to expiring.
+            oldest = None
+            for cached_key, (cached_expires, _) in self._dns_cache.items():
+                if oldest is None or cached_expires < self._dns_cache[oldest][0]:
+                    oldest = cached_key
+            del self._dns_cache[oldest]
+        if self.dns_cache_size > 0:
+            self._dns_cache[key] = (expires, result)
+
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def invalidate_dns_cache(self, host: Optional[str] = None) -> None:
+        """Forget cached DNS results for ``host``, or for every host if it is ``None``.
+
+        :param Optional[str] host: the host to look up again on its next connection
+        """
+        if host is None:
+            self._dns_cache.clear()
+            return
+        for key in list(self._dns_cache):
+            if key[0] == host:
+                del self._dns_cache[key]
+
     def _register_connected_socket(self, key, socket):
         """Register a socket as managed."""
         self._key_by_managed_socket[socket] = key
-        self._managed_socket_by_key[key] = socket
-
-    def _get_connected_socket(  # pylint: disable=too-many-arguments
+        if key in self._managed_socket_by_key:
+            self._managed_socket_by_key[key].append(socket)
+        else:
+            self._managed_socket_by_key[key] = [socket]
+        self._opened_socket_count += 1
+
+    def _get_available_socket(self, key, timeout: float):
+        """Take the most recently freed healthy socket for the key, if there is one."""
+        while True:
+            newest = None
+            newest_freed = None
+            for socket in self._managed_socket_by_key.get(key, ()):
+                freed = self._available_sockets.get(socket)
+                if freed is not None and (newest_freed is None or freed > newest_freed):
+                    newest = socket
+                    newest_freed = freed
+            if newest is None:
+                return None
+            if _socket_is_healthy(newest):
+                del self._available_sockets[newest]
+                newest.settimeout(timeout)
+                self._reused_socket_count += 1
+                return newest
+            self.close_socket(newest)
+
+    def _get_new_socket(
         self,
         addr_info: List[Tuple[int, int, int, str, Tuple[str, int]]],
         host: str,
-        port: int,
-        timeout: float,
         is_ssl: bool,
         ssl_context: Optional[SSLContextType] = None,
-    ):
-
+    ) -> CircuitPythonSocketType:
         socket = self._socket_pool.socket(addr_info[0], addr_info[1])
 
         if is_ssl:
             socket = ssl_context.wrap_socket(socket, server_hostname=host)
-            connect_host = host
-        else:
-            connect_host = addr_info[-1][0]
+        return socket
+
+    def _connect_socket(  # pylint: disable=too-many-arguments
+        self,
+        socket: CircuitPythonSocketType,
+        addr_info: List[Tuple[int, int, int, str, Tuple[str, int]]],
+        host: str,
+        port: int,
+        timeout: float,
+        is_ssl: bool,
+    ) -> None:
+        connect_host = host if is_ssl else addr_info[-1][0]
 
         # Set socket read and connect timeout.
         socket.settimeout(timeout)
 
         try:
             socket.connect((connect_host, port))
-        except (MemoryError, OSError):
+        except (MemoryError, OSError, RuntimeError):
             # If any connect problems, clean up and re-raise the problem exception.
             socket.close()
             raise
 
-        return socket
-
     @property
     def available_socket_count(self) -> int:
         """Get the count of available (freed) managed sockets."""
@@ -262,7 +432,17 @@ class ConnectionManager:
     @property
     def managed_socket_count(self) -> int:
         """Get the count of managed sockets."""
-        return len(self._managed_socket_by_key)
+        return len(self._key_by_managed_socket)
+
+    @property
+    def opened_socket_count(self) -> int:
+        """Get the count of sockets connected by this manager since it was created."""
+        return self._opened_socket_count
+
+    @property
+    def reused_socket_count(self) -> int:
+        """Get the count of requests served with an already connected socket."""
+        return self._reused_socket_count
 
     def close_socket(self, socket: SocketType) -> None:
         """
@@ -270,19 +450,21 @@ class ConnectionManager:
 
         - **socket_pool** *(SocketType)* – The socket you want to close
         """
-        if socket not in self._managed_socket_by_key.values():
+        if socket not in self._key_by_managed_socket:
             raise RuntimeError("Socket not managed")
         socket.close()
         key = self._key_by_managed_socket.pop(socket)
-        del self._managed_socket_by_key[key]
-        if socket in self._available_sockets:
-            self._available_sockets.remove(socket)
+        sockets = self._managed_socket_by_key[key]
+        sockets.remove(socket)
+        if not sockets:
+            del self._managed_socket_by_key[key]
+        self._available_sockets.pop(socket, None)
 
     def free_socket(self, socket: SocketType) -> None:
         """Mark a managed socket as available so it can be reused. The socket is not closed."""
-        if socket not in self._managed_socket_by_key.values():
+        if socket not in self._key_by_managed_socket:
             raise RuntimeError("Socket not managed")
-        self._available_sockets.add(socket)
+        self._available_sockets[socket] = time.monotonic()
 
     # pylint: disable=too-many-arguments
     def get_socket(
@@ -299,6 +481,12 @@ class ConnectionManager:
         """
         Get a new socket and connect to the given host.
 
+        A freed socket for the same host is reused when there is one that is still
+        connected. Otherwise a new socket is opened, as long as fewer than
+        ``max_sockets_per_host`` are already open to the host; if the radio is out
+        of sockets or memory, the least recently used freed socket is closed to make
+        room and the new socket is tried once more.
+
         :param str host: host to connect to, such as ``"www.example.org"``
         :param int port: port to use for connection, such as ``80`` or ``443``
         :param str proto: connection protocol: ``"http:"``, ``"https:"``, etc.
@@ -313,13 +501,14 @@ class ConnectionManager:
             session_id = str(session_id)
         key = (host, port, proto, session_id)
 
+        self._close_idle_sockets()
+
         # Do we have already have a socket available for the requested connection?
-        if key in self._managed_socket_by_key:
-            socket = self._managed_socket_by_key[key]
-            if socket in self._available_sockets:
-                self._available_sockets.remove(socket)
-                return socket
+        socket = self._get_available_socket(key, timeout)
+        if socket is not None:
+            return socket
 
+        if len(self._managed_socket_by_key.get(key, ())) >= self.max_sockets_per_host:
             raise RuntimeError(
                 f"An existing socket is already connected to {proto}//{host}:{port}"
             )
@@ -329,28 +518,60 @@ class ConnectionManager:
         if is_ssl and not ssl_context:
             raise ValueError("ssl_context must be provided if using ssl")
 
-        addr_info = self._socket_pool.getaddrinfo(
-            host, port, 0, self._socket_pool.SOCK_STREAM
-        )[0]
-
-        try:
-            socket = self._get_connected_socket(
-                addr_info, host, port, timeout, is_ssl, ssl_context
-            )
+        addr_info = self._getaddrinfo(host, port)
+
+        # Only running out of sockets or memory is cured by closing the least recently
+        # used available socket, and only one is closed. Other errors, like a
+        # connection timeout, are raised right away.
+        for retry in (False, True):
+            try:
+                socket = self._get_new_socket(addr_info, host, is_ssl, ssl_context)
+            except (MemoryError, OSError, RuntimeError):
+                # Could not get a new socket (or two, if SSL).
+                if retry or not self._close_least_recently_used():
+                    raise
+                continue
+            try:
+                self._connect_socket(socket, addr_info, host, port, timeout, is_ssl)
+            except (MemoryError, OSError, RuntimeError) as error:
+                if (
+                    retry
+                    or not _may_be_out_of_memory(error)
+                    or not self._close_least_recently_used()
+                ):
+                    # The cached address may be stale, so look it up again next time.
+                    self.invalidate_dns_cache(host)
+                    raise
+                continue
             self._register_connected_socket(key, socket)
             return socket
-        except (MemoryError, OSError, RuntimeError):
-            # Could not get a new socket (or two, if SSL).
-            # If there are any available sockets, free them all and try again.
-            if self.available_socket_count:
-                self._free_sockets()
-                socket = self._get_connected_socket(
-                    addr_info, host, port, timeout, is_ssl, ssl_context
-                )
-                self._register_connected_socket(key, socket)
-                return socket
-            # Re-raise exception if no sockets could be freed.
-            raise
+
+
+def _socket_is_healthy(socket: SocketType) -> bool:
+    """Check that an idle socket is still connected and has no unread data."""
+    # The software socket pools (ESP32SPI, WIZnet5k) can ask the radio directly.
+    # _FakeSSLSocket wraps one of those.
+    # CPython's SSLSocket also has a _connected attribute, but it is a bool.
+    raw_socket = getattr(socket, "_socket", socket)
+    connected = getattr(raw_socket, "_connected", None)
+    available = getattr(raw_socket, "_available", None)
+    if callable(connected) and callable(available):
+        try:
+            return connected() and not available()
+        except (OSError, RuntimeError, TypeError, AttributeError):
+            return False
+
+    # Everything else supports non-blocking reads: with nothing to read, an open
+    # socket raises while a closed one returns 0.
+    try:
+        socket.settimeout(0)
+        socket.recv_into(bytearray(1), 1)
+    except OSError as error:
+        return error.errno not in _CLOSED_SOCKET_ERRORS
+    except (TypeError, AttributeError):
+        return False
+    # Either the other end closed the connection or sent data nobody asked for.
+    return False
 
 
 def connection_manager_close_all(
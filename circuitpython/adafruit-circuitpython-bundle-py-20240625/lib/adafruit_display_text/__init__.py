@@ -13,12 +13,159 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
 from displayio import Group, Palette
 
 try:
-    from typing import Optional, List, Tuple
+    from typing import Optional, List, Tuple, Callable, Iterable, Iterator
     from fontio import FontProtocol
 except ImportError:
     pass
 
 
+# Advance width of every character measured so far, for the last few fonts used
+_advance_widths = {}
+_MAX_MEASURED_FONTS = 2
+# How many word widths wrapping remembers before starting over
+_MAX_WORD_WIDTHS = 64
+
+
+def _measurer(font: Optional[FontProtocol], text: str) -> Callable[[str], int]:
+    """Return a function measuring text in pixels with ``font`` (or in characters
+    when ``font`` is None), after loading any glyphs in ``text`` it has not seen."""
+    if font is None:
+        return len
+
+    advances = _advance_widths.get(font)
+    if advances is None:
+        # Forget another font, so fonts that are no longer used can be freed
+        while len(_advance_widths) >= _MAX_MEASURED_FONTS:
+            _advance_widths.pop(next(iter(_advance_widths)))
+        advances = _advance_widths[font] = {}
+    missing = [char for char in set(text) if char not in advances]
+    if missing:
+        if hasattr(font, "load_glyphs"):
+            font.load_glyphs("".join(missing))
+        for char in missing:
+            this_glyph = font.get_glyph(ord(char))
+            advances[char] = this_glyph.shift_x if this_glyph else 0
+
+    def measure(text):
+        total_len = 0
+        for char in text:
+            advance = advances.get(char)
+            if advance is None:
+                this_glyph = font.get_glyph(ord(char))
+                advance = advances[char] = this_glyph.shift_x if this_glyph else 0
+            total_len += advance
+        return total_len
+
+    return measure
+
+
+def _split_words(chunks: Iterable[str]) -> Iterator[Optional[str]]:
+    """Yield the words of the text split on spaces, with None marking the end of
+    each line, like ``[line.split(" ") for line in text.split("\\n")]`` would."""
+    word = ""
+    for chunk in chunks:
+        start = 0
+        for index, char in enumerate(chunk):
+            if char in " \n":
+                word += chunk[start:index]
+                yield word
+                word = ""
+                if char == "\n":
+                    yield None
+                start = index + 1
+        word += chunk[start:]
+    yield word
+    yield None
+
+
+def _wrap_words(
+    words: Iterable[Optional[str]],
+    max_width: int,
+    measure: Callable[[str], int],
+    indent0: str,
+    indent1: str,
+) -> Iterator[str]:
+    # pylint: disable=too-many-branches, too-many-locals, too-many-statements
+    word_widths = {}
+    partial = [indent0]
+    width = measure(indent0)
+    swidth = measure(" ")
+    dash_width = measure("-")
+    firstword = True
+    newline = True
+    index = 0
+    for word in words:
+        if word is None:  # end of an input line
+            yield "".join(partial)
+            partial = [indent1]
+            width = measure(indent1)
+            newline = True
+            index = 0
+            continue
+
+        wwidth = word_widths.get(word)
+        if wwidth is None:
+            if len(word_widths) >= _MAX_WORD_WIDTHS:
+                word_widths.clear()
+            wwidth = word_widths[word] = measure(word)
+        word_parts = []
+        cur_part = ""
+
+        if wwidth > max_width:
+            partial_width = measure("".join(partial))
+            cur_width = 0
+            for char in word:
+                if newline:
+                    extraspace = 0
+                    leadchar = ""
+                else:
+                    extraspace = swidth
+                    leadchar = " "
+                char_width = measure(char)
+                if (
+                    partial_width + cur_width + char_width + dash_width + extraspace
+                    > max_width
+                ):
+                    if cur_part:
+                        word_parts.append("".join(partial) + leadchar + cur_part + "-")
+
+                    else:
+                        word_parts.append("".join(partial))
+                    cur_part = char
+                    cur_width = char_width
+                    partial = [indent1]
+                    partial_width = measure(indent1)
+                    newline = True
+                else:
+                    cur_part += char
+                    cur_width += char_width
+            if cur_part:
+                word_parts.append(cur_part)
+            for line in word_parts[:-1]:
+                yield line
+            partial.append(word_parts[-1])
+            width = measure(word_parts[-1])
+            if firstword:
+                firstword = False
+        else:
+            if firstword:
+                partial.append(word)
+                firstword = False
+                width += wwidth
+            elif width + swidth + wwidth < max_width:
+                if index > 0:
+                    partial.append(" ")
+                partial.append(word)
+                width += wwidth + swidth
+            else:
+                yield "".join(partial)
+                partial = [indent1, word]
+                width = measure(indent1) + wwidth
+        if newline:
+            newline = False
+        index += 1
+
+
 def wrap_text_to_pixels(
     string: str,
     max_width: int,
@@ -26,8 +173,6 @@ def wrap_text_to_pixels(
     indent0: str = "",
     indent1: str = "",
 ) -> List[str]:
-    # pylint: disable=too-many-branches, too-many-locals, too-many-nested-blocks, too-many-statements
-
     """wrap_text_to_pixels function
     A helper that will return a list of lines with word-break wrapping.
     Leading and trailing whitespace in your string will be removed. If
@@ -46,93 +191,50 @@ def wrap_text_to_pixels(
     :rtype: List[str]
 
     """
-    if font is None:
+    measure = _measurer(font, string)
+    return list(
+        _wrap_words(_split_words((string,)), max_width, measure, indent0, indent1)
+    )
 
-        def measure(text):
-            return len(text)
 
-    else:
-        if hasattr(font, "load_glyphs"):
-            font.load_glyphs(string)
-
-        def measure(text):
-            total_len = 0
-            for char in text:
-                this_glyph = font.get_glyph(ord(char))
-                if this_glyph:
-                    total_len += this_glyph.shift_x
-            return total_len
+def iter_wrap_text_to_pixels(
+    chunks: Iterable[str],
+    max_width: int,
+    font: Optional[FontProtocol] = None,
+    indent0: str = "",
+    indent1: str = "",
+) -> Iterator[str]:
+    """iter_wrap_text_to_pixels function
+    Like `wrap_text_to_pixels`, but takes the text as an iterable of chunks (for
+    example blocks read from a file) and yields the wrapped lines as soon as they
+    are known, so long text can be paginated without holding all of it in memory.
+
+    :param chunks: The text to be wrapped, in pieces of any size.
+    :type chunks: Iterable[str]
+    :param int max_width: The maximum number of pixels on a line before wrapping.
+    :param font: The font to use for measuring the text.
+    :type font: ~fontio.FontProtocol
+    :param str indent0: Additional character(s) to add to the first line.
+    :param str indent1: Additional character(s) to add to all other lines.
 
-    lines = []
-    partial = [indent0]
-    width = measure(indent0)
-    swidth = measure(" ")
-    firstword = True
-    for line_in_input in string.split("\n"):
-        newline = True
-        for index, word in enumerate(line_in_input.split(" ")):
-            wwidth = measure(word)
-            word_parts = []
-            cur_part = ""
-
-            if wwidth > max_width:
-                for char in word:
-                    if newline:
-                        extraspace = 0
-                        leadchar = ""
-                    else:
-                        extraspace = swidth
-                        leadchar = " "
-                    if (
-                        measure("".join(partial))
-                        + measure(cur_part)
-                        + measure(char)
-                        + measure("-")
-                        + extraspace
-                        > max_width
-                    ):
-                        if cur_part:
-                            word_parts.append(
-                                "".join(partial) + leadchar + cur_part + "-"
-                            )
-
-                        else:
-                            word_parts.append("".join(partial))
-                        cur_part = char
-                        partial = [indent1]
-                        newline = True
-                    else:
-                        cur_part += char
-                if cur_part:
-                    word_parts.append(cur_part)
-                for line in word_parts[:-1]:
-                    lines.append(line)
-                partial.append(word_parts[-1])
-                width = measure(word_parts[-1])
-                if firstword:
-                    firstword = False
-            else:
-                if firstword:
-                    partial.append(word)
-                    firstword = False
-                    width += wwidth
-                elif width + swidth + wwidth < max_width:
-                    if index > 0:
-                        partial.append(" ")
-                    partial.append(word)
-                    width += wwidth + swidth
-                else:
-                    lines.append("".join(partial))
-                    partial = [indent1, word]
-                    width = measure(indent1) + wwidth
-            if newline:
-                newline = False
+    :return: An iterator over the lines resulting from wrapping the
+        input text at ``max_width`` pixels size
+    :rtype: Iterator[str]
 
-        lines.append("".join(partial))
-        partial = [indent1]
-        width = measure(indent1)
+    """
 
-    return lines
+    def measured_chunks():
+        for chunk in chunks:
+            _measurer(font, chunk)
+            yield chunk
+
+    return _wrap_words(
+        _split_words(measured_chunks()),
+        max_width,
+        _measurer(font, ""),
+        indent0,
+        indent1,
+    )
 
 
 def wrap_text_to_lines(string: str, max_chars: int) -> List[str]:
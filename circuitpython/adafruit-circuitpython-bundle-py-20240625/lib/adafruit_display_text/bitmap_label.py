@@ -26,6 +26,13 @@ Implementation Notes
 __version__ = "3.1.2"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Text.git"
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    # Small builds lack OrderedDict, the glyph run cache then evicts an arbitrary
+    # line instead of the least recently used one
+    OrderedDict = dict  # pylint: disable=invalid-name
+
 import displayio
 from adafruit_display_text import LabelBase
 
@@ -33,7 +40,7 @@ try:
     import bitmaptools
 except ImportError:
     # We have a slower fallback for bitmaptools
-    pass
+    bitmaptools = None  # pylint: disable=invalid-name
 
 try:
     from typing import Optional, Tuple
@@ -41,6 +48,22 @@ try:
 except ImportError:
     pass
 
+# Pre-rendered lines of text shared by every label with cache_glyph_runs set.
+# Keyed by (font, line), in least recently used order. Each entry holds the
+# rendered Bitmap, its offset from the pen position at the start of the line
+# to its top-left corner, the pen advance and the dx of the first glyph.
+_glyph_runs = OrderedDict()
+_glyph_runs_max = 32
+
+
+def set_glyph_run_cache_size(size: int) -> None:
+    """Set how many rendered lines of text are kept for labels created with
+    ``cache_glyph_runs=True``. Defaults to 32; 0 disables the cache."""
+    global _glyph_runs_max  # pylint: disable=global-statement
+    _glyph_runs_max = size
+    while len(_glyph_runs) > size:
+        _glyph_runs.pop(next(iter(_glyph_runs)))
+
 
 # pylint: disable=too-many-instance-attributes
 class Label(LabelBase):
@@ -88,6 +111,9 @@ class Label(LabelBase):
      configurations possibles ``LTR``-Left-To-Right ``RTL``-Right-To-Left
      ``UPD``-Upside Down ``UPR``-Upwards ``DWR``-Downwards. It defaults to ``LTR``
     :param bool verbose: print debugging information in some internal functions. Default to False
+    :param bool cache_glyph_runs: Set True to render each line of text once into a bitmap that
+     is kept in a cache shared by all labels and blitted in one call when the same line is
+     shown again with the same font. See `set_glyph_run_cache_size`. Default to False
 
     """
 
@@ -100,10 +126,17 @@ class Label(LabelBase):
         "RTL": (False, False, False),
     }
 
-    def __init__(self, font: FontProtocol, save_text: bool = True, **kwargs) -> None:
+    def __init__(
+        self,
+        font: FontProtocol,
+        save_text: bool = True,
+        cache_glyph_runs: bool = False,
+        **kwargs,
+    ) -> None:
         self._bitmap = None
         self._tilegrid = None
         self._prev_label_direction = None
+        self._cache_glyph_runs = cache_glyph_runs
 
         super().__init__(font, **kwargs)
 
@@ -374,12 +407,30 @@ class Label(LabelBase):
         # when copying glyph bitmaps (this is important for slanted text
         # where rectangular glyph boxes overlap)
     ) -> Tuple[int, int, int, int]:
-        # pylint: disable=too-many-arguments, too-many-locals
+        # pylint: disable=too-many-arguments
 
         # placeText - Writes text into a bitmap at the specified location.
         #
         # Note: scale is pushed up to Group level
 
+        if self._cache_glyph_runs and _glyph_runs_max > 0:
+            return self._place_glyph_runs(
+                bitmap, text, font, xposition, yposition, skip_index
+            )
+        return self._place_glyphs(bitmap, text, font, xposition, yposition, skip_index)
+
+    def _place_glyphs(
+        self,
+        bitmap: displayio.Bitmap,
+        text: str,
+        font: FontProtocol,
+        xposition: int,
+        yposition: int,
+        skip_index: int,
+    ) -> Tuple[int, int, int, int]:
+        """Same as ``_place_text`` but blits the text glyph by glyph"""
+        # pylint: disable=too-many-arguments, too-many-locals
+
         x_start = xposition  # starting x position (left margin)
         y_start = yposition
 
@@ -461,6 +512,123 @@ class Label(LabelBase):
         # bounding_box
         return left, top, right - left, bottom - top
 
+    def _place_glyph_runs(
+        self,
+        bitmap: displayio.Bitmap,
+        text: str,
+        font: FontProtocol,
+        xposition: int,
+        yposition: int,
+        skip_index: int,
+    ) -> Tuple[int, int, int, int]:
+        """Same as ``_place_text`` but blits each line from the glyph run cache"""
+        # pylint: disable=too-many-arguments, too-many-locals
+
+        x_start = xposition
+        y_start = yposition
+
+        left = None
+        right = x_start
+        top = bottom = y_start
+        line_spacing_ypixels = self._line_spacing_ypixels(font, self._line_spacing)
+
+        for line in text.split("\n"):
+            run = self._get_glyph_run(font, line)
+            if run is not None:
+                run_bitmap, run_x, run_y, advance, first_dx = run
+                left = 0 if left is None else min(left, first_dx)
+                right = max(
+                    right, xposition + advance, xposition + run_x + run_bitmap.width
+                )
+                if yposition == y_start:
+                    top = min(top, run_y)
+                bottom = max(bottom, yposition + run_y + run_bitmap.height)
+
+                x = xposition + run_x
+                y = yposition + run_y
+                if x < 0:
+                    # Glyphs starting left of the bitmap are moved right, not clipped,
+                    # which can only be done glyph by glyph
+                    self._place_glyphs(
+                        bitmap, line, font, xposition, yposition, skip_index
+                    )
+                else:
+                    # Clip the run where it would start above the bitmap
+                    self._blit(
+                        bitmap,
+                        x,
+                        max(y, 0),
+                        run_bitmap,
+                        x_1=0,
+                        y_1=max(-y, 0),
+                        x_2=run_bitmap.width,
+                        y_2=run_bitmap.height,
+                        skip_index=skip_index,
+                    )
+            yposition += line_spacing_ypixels
+
+        if left is None:
+            left = 0
+        return left, top, right - left, bottom - top
+
+    def _get_glyph_run(self, font: FontProtocol, line: str) -> Optional[tuple]:
+        """Return the cached rendering of a line of text, rendering it if needed"""
+        key = (font, line)
+        run = _glyph_runs.pop(key, None)
+        if run is None:
+            run = self._render_glyph_run(font, line)
+            if run is None:
+                return None
+            while len(_glyph_runs) >= _glyph_runs_max:
+                _glyph_runs.pop(next(iter(_glyph_runs)))
+        # (Re)insert as the most recently used
+        _glyph_runs[key] = run
+        return run
+
+    def _render_glyph_run(self, font: FontProtocol, line: str) -> Optional[tuple]:
+        # pylint: disable=too-many-locals
+        glyphs = []
+        min_x = min_y = max_x = max_y = None
+        pen = 0
+        for char in line:
+            my_glyph = font.get_glyph(ord(char))
+            if my_glyph is None:
+                print("Glyph not found: {}".format(repr(char)))
+                continue
+            glyph_x = pen + my_glyph.dx
+            glyph_y = -my_glyph.height - my_glyph.dy
+            if min_x is None:
+                min_x, min_y = glyph_x, glyph_y
+                max_x, max_y = glyph_x + my_glyph.width, -my_glyph.dy
+            else:
+                min_x = min(min_x, glyph_x)
+                min_y = min(min_y, glyph_y)
+                max_x = max(max_x, glyph_x + my_glyph.width)
+                max_y = max(max_y, -my_glyph.dy)
+            glyphs.append((my_glyph, glyph_x, glyph_y))
+            pen += my_glyph.shift_x
+
+        if not glyphs:
+            return None
+
+        run_bitmap = displayio.Bitmap(
+            max(max_x - min_x, 1), max(max_y - min_y, 1), len(self._palette)
+        )
+        for my_glyph, glyph_x, glyph_y in glyphs:
+            glyph_offset_x = my_glyph.tile_index * my_glyph.width
+            self._blit(
+                run_bitmap,
+                glyph_x - min_x,
+                glyph_y - min_y,
+                my_glyph.bitmap,
+                x_1=glyph_offset_x,
+                y_1=0,
+                x_2=glyph_offset_x + my_glyph.width,
+                y_2=my_glyph.height,
+                skip_index=0,
+            )
+        return run_bitmap, min_x, min_y, pen, glyphs[0][0].dx
+
     def _blit(
         self,
         bitmap: displayio.Bitmap,  # target bitmap
@@ -501,7 +669,7 @@ class Label(LabelBase):
                 skip_source_index=skip_index,
             )
 
-        else:  # perform pixel by pixel copy of the bitmap
+        else:  # copy pixel by pixel within the clipped rectangle, Bitmap has no slices
             # Perform input checks
 
             if x_2 is None:
@@ -519,30 +687,26 @@ class Label(LabelBase):
             x_2 = min(x_2, source_bitmap.width)
             y_2 = min(y_2, source_bitmap.height)
 
-            for y_count in range(y_2 - y_1):
-                for x_count in range(x_2 - x_1):
-                    x_placement = x + x_count
-                    y_placement = y + y_count
-
-                    if (bitmap.width > x_placement >= 0) and (
-                        bitmap.height > y_placement >= 0
-                    ):  # ensure placement is within target bitmap
-                        # get the palette index from the source bitmap
-                        this_pixel_color = source_bitmap[
-                            y_1
-                            + (
-                                y_count * source_bitmap.width
-                            )  # Direct index into a bitmap array is speedier than [x,y] tuple
-                            + x_1
-                            + x_count
-                        ]
-
-                        if (skip_index is None) or (this_pixel_color != skip_index):
-                            bitmap[  # Direct index into a bitmap array is speedier than [x,y] tuple
-                                y_placement * bitmap.width + x_placement
-                            ] = this_pixel_color
-                    elif y_placement > bitmap.height:
-                        break
+            # Clip to the target bitmap once instead of checking every pixel
+            if x < 0:
+                x_1 -= x
+                x = 0
+            if y < 0:
+                y_1 -= y
+                y = 0
+            columns = min(x_2 - x_1, bitmap.width - x)
+            rows = min(y_2 - y_1, bitmap.height - y)
+
+            source_width = source_bitmap.width
+            target_width = bitmap.width
+            # Direct index into a bitmap array is speedier than [x,y] tuple
+            for row in range(rows):
+                source_index = (y_1 + row) * source_width + x_1
+                target_index = (y + row) * target_width + x
+                for column in range(columns):
+                    this_pixel_color = source_bitmap[source_index + column]
+                    if this_pixel_color != skip_index:
+                        bitmap[target_index + column] = this_pixel_color
 
     def _set_line_spacing(self, new_line_spacing: float) -> None:
         if self._save_text:
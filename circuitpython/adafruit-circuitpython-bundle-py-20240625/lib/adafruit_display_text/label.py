@@ -79,11 +79,18 @@ class Label(LabelBase):
      tab character
     :param str label_direction: string defining the label text orientation. There are 5
      configurations possibles ``LTR``-Left-To-Right ``RTL``-Right-To-Left
-     ``TTB``-Top-To-Bottom ``UPR``-Upwards ``DWR``-Downwards. It defaults to ``LTR``"""
+     ``TTB``-Top-To-Bottom ``UPR``-Upwards ``DWR``-Downwards. It defaults to ``LTR``
+    :param bool incremental: Set `True` to keep the layout state after every character
+     so that a text change only lays out the glyphs after the unchanged prefix, reusing
+     the existing TileGrids. Costs some memory per character. Defaults to `False`"""
 
-    def __init__(self, font: FontProtocol, **kwargs) -> None:
+    def __init__(self, font: FontProtocol, incremental: bool = False, **kwargs) -> None:
         self._background_palette = Palette(1)
         self._added_background_tilegrid = False
+        self._incremental = incremental
+        # Layout state before each character of the current text, plus the
+        # final state, recorded when incremental is set. None when invalid.
+        self._layout_checkpoints = None
 
         super().__init__(font, **kwargs)
 
@@ -256,7 +263,7 @@ class Label(LabelBase):
             i = 1
         else:
             i = 0
-        tilegrid_count = i
+        first_tilegrid = tilegrid_count = i
         if self._base_alignment:
             self._y_offset = 0
         else:
@@ -272,7 +279,28 @@ class Label(LabelBase):
             top = right = left = 0
             bottom = 0
 
-        for character in new_text:
+        checkpoints = None
+        start = 0
+        if self._incremental:
+            checkpoints = self._layout_checkpoints
+            if checkpoints is not None:
+                # Resume after the prefix shared with the current text, whose
+                # glyphs keep their TileGrids and bounds.
+                old_text = self._text
+                limit = min(len(old_text), len(new_text), len(checkpoints) - 1)
+                while start < limit and old_text[start] == new_text[start]:
+                    start += 1
+                x, y, left, right, top, bottom, tilegrid_count = checkpoints[start]
+                tilegrid_count += first_tilegrid
+                del checkpoints[start:]
+            else:
+                checkpoints = []
+
+        for character in new_text[start:]:
+            if checkpoints is not None:
+                checkpoints.append(
+                    (x, y, left, right, top, bottom, tilegrid_count - first_tilegrid)
+                )
             if character == "\n":
                 y += int(self._height * self._line_spacing)
                 x = 0
@@ -390,6 +418,12 @@ class Label(LabelBase):
 
             i += 1
 
+        if checkpoints is not None:
+            checkpoints.append(
+                (x, y, left, right, top, bottom, tilegrid_count - first_tilegrid)
+            )
+        self._layout_checkpoints = checkpoints
+
         if self._label_direction == "LTR" and left is None:
             left = 0
         if self._label_direction == "RTL" and right is None:
@@ -427,6 +461,7 @@ class Label(LabelBase):
         old_text = self._text
         current_anchored_position = self.anchored_position
         self._text = ""
+        self._layout_checkpoints = None
         self._font = new_font
         self._height = self._font.get_bounding_box()[1]
         self._update_text(str(old_text))
@@ -434,6 +469,7 @@ class Label(LabelBase):
 
     def _set_line_spacing(self, new_line_spacing: float) -> None:
         self._line_spacing = new_line_spacing
+        self._layout_checkpoints = None
         self.text = self._text  # redraw the box
 
     def _set_text(self, new_text: str, scale: int) -> None:
@@ -441,6 +477,7 @@ class Label(LabelBase):
 
     def _set_label_direction(self, new_label_direction: str) -> None:
         self._label_direction = new_label_direction
+        self._layout_checkpoints = None
         self._update_text(str(self._text))
 
     def _get_valid_label_directions(self) -> Tuple[str, ...]:
@@ -31,6 +31,13 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_framebuf.git"
 import os
 import struct
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    # Small builds lack OrderedDict, the glyph cache then evicts an arbitrary glyph
+    # instead of the least recently used one
+    OrderedDict = dict  # pylint: disable=invalid-name
+
 # Framebuf format constants:
 MVLSB = 0  # Single bit displays (like SSD1306 OLED)
 RGB565 = 1  # 16-bit color displays
@@ -39,6 +46,10 @@ MHMSB = 3  # Single bit displays like the Sharp Memory
 RGB888 = 4  # Neopixels and Dotstars
 GS2_HMSB = 5  # 2-bit color displays like the HT16K33 8x8 Matrix
 
+# Changed areas closer than this many pixels of extra area are merged
+_DIRTY_SLACK = 64
+_MAX_DIRTY_RECTS = 4
+
 
 class GS2HMSBFormat:
     """GS2HMSBFormat"""
@@ -135,6 +146,114 @@ class MHMSBFormat:
                     (color != 0) << offset
                 )
 
+    @staticmethod
+    def blit(framebuf, source, x, y, src_x, src_y, width, height, key):
+        """Copy a clipped area of another MHMSB FrameBuffer a byte at a time. Returns False
+        if the strides are not whole bytes and the copy has to go pixel by pixel."""
+        # pylint: disable=too-many-arguments,too-many-locals
+        if framebuf.stride & 7 or source.stride & 7:
+            return False
+        buf = framebuf.buf
+        src = source.buf
+        src_len = len(src)
+        x_end = x + width
+        first = x >> 3
+        last = (x_end - 1) >> 3
+        # Source column that lands on the first column of each destination byte
+        src_col = src_x - (x & 7)
+        shift = src_col & 7
+        for row in range(height):
+            dst_row = ((y + row) * framebuf.stride) >> 3
+            src_row = ((src_y + row) * source.stride) >> 3
+            src_index = src_row + (src_col >> 3)
+            if not shift and key == -1 and last - first > 1:
+                # Aligned: copy the whole bytes in between the partial edge bytes
+                buf[dst_row + first + 1 : dst_row + last] = src[
+                    src_index + 1 : src_index + last - first
+                ]
+                columns = (first, last)
+            else:
+                columns = range(first, last + 1)
+            for column in columns:
+                index = src_index + column - first
+                # Bits outside the source are masked off below
+                word = (src[index] << 8 if 0 <= index < src_len else 0) | (
+                    src[index + 1] if index + 1 < src_len else 0
+                )
+                bits = (word << shift) >> 8 & 0xFF
+                mask = 0xFF
+                if column == first:
+                    mask >>= x & 7
+                if column == last:
+                    mask &= 0xFF << (7 - ((x_end - 1) & 7)) & 0xFF
+                index = dst_row + column
+                if key == 0:
+                    buf[index] |= bits & mask
+                elif key == 1:
+                    buf[index] &= bits | ~mask & 0xFF
+                else:
+                    buf[index] = buf[index] & ~mask | bits & mask
+        return True
+
+    @staticmethod
+    def scroll(framebuf, delta_x, delta_y):
+        """Shift the pixels a byte at a time, moving whole rows with slice assignment.
+        Returns False if the stride is not whole bytes and the pixels have to be moved one
+        by one."""
+        # pylint: disable=too-many-locals,too-many-branches
+        if framebuf.stride & 7:
+            return False
+        buf = framebuf.buf
+        row_bytes = framebuf.stride >> 3
+        # Destination area, the rest keeps its previous contents
+        x_start = max(delta_x, 0)
+        x_end = framebuf.width + min(delta_x, 0)
+        first = x_start >> 3
+        last = (x_end - 1) >> 3
+        first_mask = 0xFF >> (x_start & 7)
+        last_mask = 0xFF << (7 - ((x_end - 1) & 7)) & 0xFF
+        # Source column that lands on the first column of each destination byte
+        src_col = (first << 3) - delta_x
+        shift = src_col & 7
+        src_first = src_col >> 3
+        if shift:
+            middle = None
+            columns = range(first, last + 1)
+        else:
+            # Whole bytes are moved with slice assignment, partial ones bit by bit
+            middle = (first + (first_mask != 0xFF), last + (last_mask == 0xFF))
+            columns = [first] if first_mask != 0xFF else []
+            if last_mask != 0xFF and last not in columns:
+                columns.append(last)
+        rows = range(max(delta_y, 0), framebuf.height + min(delta_y, 0))
+        if delta_y > 0:
+            rows = range(rows.stop - 1, rows.start - 1, -1)
+        for row in rows:
+            dst_row = row * row_bytes
+            # A copy, so the source row is not overwritten while it is read
+            src_row = (row - delta_y) * row_bytes
+            src = bytes(buf[src_row : src_row + row_bytes])
+            if middle and middle[0] < middle[1]:
+                start = src_first + middle[0] - first
+                buf[dst_row + middle[0] : dst_row + middle[1]] = src[
+                    start : start + middle[1] - middle[0]
+                ]
+            for column in columns:
+                index = src_first + column - first
+                # Bytes outside the row only feed bits that are masked off below
+                word = (src[index] << 8 if 0 <= index < row_bytes else 0) | (
+                    src[index + 1] if 0 <= index + 1 < row_bytes else 0
+                )
+                bits = (word << shift) >> 8 & 0xFF
+                mask = 0xFF
+                if column == first:
+                    mask = first_mask
+                if column == last:
+                    mask &= last_mask
+                index = dst_row + column
+                buf[index] = buf[index] & ~mask | bits & mask
+        return True
+
 
 class MVLSBFormat:
     """MVLSBFormat"""
@@ -180,6 +299,95 @@ class MVLSBFormat:
             y += 1
             height -= 1
 
+    @staticmethod
+    def blit(framebuf, source, x, y, src_x, src_y, width, height, key):
+        """Copy a clipped area of another MVLSB FrameBuffer a page of 8 rows at a
+        time."""
+        # pylint: disable=too-many-arguments,too-many-locals
+        buf = framebuf.buf
+        src = source.buf
+        src_len = len(src)
+        stride = framebuf.stride
+        src_stride = source.stride
+        y_end = y + height
+        for page in range(y >> 3, ((y_end - 1) >> 3) + 1):
+            top = max(y, page << 3) - (page << 3)
+            bottom = min(y_end, (page + 1) << 3) - (page << 3)
+            mask = (0xFF >> (8 - bottom)) & (0xFF << top) & 0xFF
+            # Source row that lands on the first row of this page
+            src_row = src_y - y + (page << 3)
+            shift = src_row & 7
+            dst_index = page * stride + x
+            src_index = (src_row >> 3) * src_stride + src_x
+            if not shift and mask == 0xFF and key == -1:
+                buf[dst_index : dst_index + width] = src[src_index : src_index + width]
+                continue
+            next_index = src_index + src_stride
+            for column in range(width):
+                # Bits outside the source are masked off below
+                index = src_index + column
+                word = src[index] if 0 <= index < src_len else 0
+                if shift:
+                    index = next_index + column
+                    if 0 <= index < src_len:
+                        word |= src[index] << 8
+                bits = (word >> shift) & mask
+                index = dst_index + column
+                if key == 0:
+                    buf[index] |= bits
+                elif key == 1:
+                    buf[index] &= bits | ~mask & 0xFF
+                else:
+                    buf[index] = buf[index] & ~mask | bits
+        return True
+
+    @staticmethod
+    def scroll(framebuf, delta_x, delta_y):
+        """Shift the pixels a page of 8 rows at a time. Whole pages move with slice
+        assignment, otherwise the bits of two source pages are combined."""
+        # pylint: disable=too-many-locals
+        buf = framebuf.buf
+        stride = framebuf.stride
+        pages = (framebuf.height + 7) >> 3
+        # Destination area, the rest keeps its previous contents
+        x_start = max(delta_x, 0)
+        width = framebuf.width - abs(delta_x)
+        y_start = max(delta_y, 0)
+        y_end = framebuf.height + min(delta_y, 0)
+        page_shift = delta_y >> 3
+        shift = delta_y & 7
+        # Read each source byte before it is overwritten
+        columns = range(width)
+        if delta_x > 0:
+            columns = range(width - 1, -1, -1)
+        dst_pages = range(y_start >> 3, ((y_end - 1) >> 3) + 1)
+        if delta_y > 0:
+            dst_pages = range(dst_pages.stop - 1, dst_pages.start - 1, -1)
+        for page in dst_pages:
+            top = max(y_start, page << 3) - (page << 3)
+            bottom = min(y_end, (page + 1) << 3) - (page << 3)
+            mask = (0xFF >> (8 - bottom)) & (0xFF << top) & 0xFF
+            dst_index = page * stride + x_start
+            # Row Y of the page comes from row Y - shift of page - page_shift, or from
+            # the page above that for the rows above shift
+            src_page = page - page_shift
+            src_index = src_page * stride + x_start - delta_x
+            if not shift and mask == 0xFF:
+                buf[dst_index : dst_index + width] = bytes(
+                    buf[src_index : src_index + width]
+                )
+                continue
+            # Pages outside the buffer only feed bits that are masked off below
+            has_page = 0 <= src_page < pages
+            has_page_above = shift and 0 < src_page <= pages
+            for column in columns:
+                word = buf[src_index + column] << shift if has_page else 0
+                if has_page_above:
+                    word |= buf[src_index - stride + column] >> (8 - shift)
+                index = dst_index + column
+                buf[index] = buf[index] & ~mask | word & mask
+        return True
+
 
 class RGB565Format:
     """
@@ -231,6 +439,19 @@ class RGB565Format:
                 index = offset2 + _x
                 framebuf.buf[index : index + 2] = rgb565_color
 
+    def blit(self, framebuf, source, x, y, src_x, src_y, width, height, key):
+        """Copy a clipped area of another RGB565 FrameBuffer a row at a time."""
+        # pylint: disable=too-many-arguments
+        key = None if key == -1 else self.color_to_rgb565(key)
+        _blit_rows(framebuf, source, x, y, src_x, src_y, width, height, key, 2)
+        return True
+
+    @staticmethod
+    def scroll(framebuf, delta_x, delta_y):
+        """Shift the pixels a row at a time."""
+        _scroll_rows(framebuf, delta_x, delta_y, 2)
+        return True
+
 
 class RGB888Format:
     """RGB888Format"""
@@ -274,6 +495,74 @@ class RGB888Format:
                 index = (_y * framebuf.stride + _x) * 3
                 framebuf.buf[index : index + 3] = bytes(fill)
 
+    @staticmethod
+    def blit(framebuf, source, x, y, src_x, src_y, width, height, key):
+        """Copy a clipped area of another RGB888 FrameBuffer a row at a time."""
+        # pylint: disable=too-many-arguments
+        if key == -1:
+            key = None
+        elif isinstance(key, tuple):
+            key = bytes(key)
+        else:
+            key = bytes(((key >> 16) & 255, (key >> 8) & 255, key & 255))
+        _blit_rows(framebuf, source, x, y, src_x, src_y, width, height, key, 3)
+        return True
+
+    @staticmethod
+    def scroll(framebuf, delta_x, delta_y):
+        """Shift the pixels a row at a time."""
+        _scroll_rows(framebuf, delta_x, delta_y, 3)
+        return True
+
+
+def _blit_rows(framebuf, source, x, y, src_x, src_y, width, height, key, size):
+    """Copy rows of pixels of ``size`` bytes. Without a ``key`` each row is a single
+    slice copy, otherwise every run of pixels that are not ``key`` is."""
+    # pylint: disable=too-many-arguments,too-many-locals
+    buf = framebuf.buf
+    src = source.buf
+    row_size = width * size
+    for row in range(height):
+        dst_index = ((y + row) * framebuf.stride + x) * size
+        src_index = ((src_y + row) * source.stride + src_x) * size
+        if key is None:
+            buf[dst_index : dst_index + row_size] = src[
+                src_index : src_index + row_size
+            ]
+            continue
+        run = None
+        for offset in range(0, row_size + size, size):
+            index = src_index + offset
+            # Compares the first, second and last byte, which covers 2 and 3 byte pixels
+            if offset < row_size and (
+                src[index] != key[0]
+                or src[index + 1] != key[1]
+                or src[index + size - 1] != key[-1]
+            ):
+                if run is None:
+                    run = offset
+            elif run is not None:
+                buf[dst_index + run : dst_index + offset] = src[
+                    src_index + run : src_index + offset
+                ]
+                run = None
+
+
+def _scroll_rows(framebuf, delta_x, delta_y, size):
+    """Shift rows of pixels of ``size`` bytes with one slice assignment per row."""
+    buf = framebuf.buf
+    row_size = (framebuf.width - abs(delta_x)) * size
+    rows = range(max(delta_y, 0), framebuf.height + min(delta_y, 0))
+    if delta_y > 0:
+        rows = range(rows.stop - 1, rows.start - 1, -1)
+    for row in rows:
+        dst_index = (row * framebuf.stride + max(delta_x, 0)) * size
+        src_index = ((row - delta_y) * framebuf.stride + max(-delta_x, 0)) * size
+        # Copied first, as the areas overlap and buf may be a memoryview
+        buf[dst_index : dst_index + row_size] = bytes(
+            buf[src_index : src_index + row_size]
+        )
+
 
 class FrameBuffer:
     """FrameBuffer object.
@@ -316,6 +605,10 @@ class FrameBuffer:
         else:
             raise ValueError("invalid format")
         self._rotation = 0
+        self._ring_offset = 0
+        # [x, y, x_end, y_end] of the areas of buf changed since clear_dirty(), or None
+        # if changes are not tracked
+        self._dirty = None
 
     @property
     def rotation(self):
@@ -328,9 +621,63 @@ class FrameBuffer:
             raise RuntimeError("Bad rotation setting")
         self._rotation = val
 
+    def track_dirty(self, enable=True):
+        """Start or stop tracking which areas of ``buf`` are changed by drawing, so a
+        display driver can send only those, see `dirty_rects()`."""
+        self._dirty = [] if enable else None
+        self._mark_dirty(0, 0, self.width, self.height)
+
+    def dirty_rects(self):
+        """The areas of ``buf`` changed since `clear_dirty()`, as a list of
+        ``(x, y, width, height)`` tuples in the rows and columns of ``buf``, i.e. before
+        rotation and ring offset. Nearby changes are merged into one area. None if
+        changes are not tracked."""
+        if self._dirty is None:
+            return None
+        return [(x, y, x_end - x, y_end - y) for x, y, x_end, y_end in self._dirty]
+
+    def clear_dirty(self):
+        """Forget the changed areas, usually after they were sent to the display."""
+        if self._dirty is not None:
+            self._dirty = []
+
+    def _mark_dirty(self, x, y, width, height):
+        """Record a changed area of ``buf``."""
+        dirty = self._dirty
+        if dirty is None or width <= 0 or height <= 0:
+            return
+        x_end = x + width
+        y_end = y + height
+        for rect in dirty:
+            if rect[0] <= x and rect[1] <= y and x_end <= rect[2] and y_end <= rect[3]:
+                return
+        area = [x, y, x_end, y_end]
+        merged = True
+        while merged:
+            merged = False
+            for rect in dirty:
+                if _union_growth(rect, area) <= _DIRTY_SLACK:
+                    dirty.remove(rect)
+                    area = _union(rect, area)
+                    merged = True
+                    break
+        dirty.append(area)
+        if len(dirty) > _MAX_DIRTY_RECTS:
+            # Merge the two areas that grow least
+            best = None
+            for i, rect in enumerate(dirty):
+                for other in dirty[i + 1 :]:
+                    growth = _union_growth(rect, other)
+                    if best is None or growth < best[0]:
+                        best = (growth, rect, other)
+            dirty.remove(best[1])
+            dirty.remove(best[2])
+            dirty.append(_union(best[1], best[2]))
+
     def fill(self, color):
         """Fill the entire FrameBuffer with the specified color."""
         self.format.fill(self, color)
+        self._mark_dirty(0, 0, self.width, self.height)
 
     def fill_rect(self, x, y, width, height, color):
         """Draw a rectangle at the given location, size and color. The ``fill_rect`` method draws
@@ -353,9 +700,12 @@ class FrameBuffer:
 
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return None
+        if self._ring_offset:
+            y = (y + self._ring_offset) % self.height
         if color is None:
             return self.format.get_pixel(self, x, y)
         self.format.set_pixel(self, x, y, color)
+        self._mark_dirty(x, y, 1, 1)
         return None
 
     def hline(self, x, y, width, color):
@@ -423,12 +773,28 @@ class FrameBuffer:
         x = max(x, 0)
         y = max(y, 0)
         if fill:
-            self.format.fill_rect(self, x, y, x_end - x + 1, y_end - y + 1, color)
+            self._fill_rect(x, y, x_end - x + 1, y_end - y + 1, color)
         else:
-            self.format.fill_rect(self, x, y, x_end - x + 1, 1, color)
-            self.format.fill_rect(self, x, y, 1, y_end - y + 1, color)
-            self.format.fill_rect(self, x, y_end, x_end - x + 1, 1, color)
-            self.format.fill_rect(self, x_end, y, 1, y_end - y + 1, color)
+            self._fill_rect(x, y, x_end - x + 1, 1, color)
+            self._fill_rect(x, y, 1, y_end - y + 1, color)
+            self._fill_rect(x, y_end, x_end - x + 1, 1, color)
+            self._fill_rect(x_end, y, 1, y_end - y + 1, color)
+
+    def _fill_rect(self, x, y, width, height, color):
+        """Fill a rectangle of ``buf``, wrapping around at the bottom when the rows are
+        offset by `ring_scroll()`."""
+        # pylint: disable=too-many-arguments
+        if self._ring_offset:
+            y += self._ring_offset
+            if y >= self.height:
+                y -= self.height
+            elif y + height > self.height:
+                self.format.fill_rect(self, x, y, width, self.height - y, color)
+                self._mark_dirty(x, y, width, self.height - y)
+                height -= self.height - y
+                y = 0
+        self.format.fill_rect(self, x, y, width, height, color)
+        self._mark_dirty(x, y, width, height)
 
     def line(self, x_0, y_0, x_1, y_1, color):
         # pylint: disable=too-many-arguments
@@ -458,12 +824,135 @@ class FrameBuffer:
                 y += s_y
         self.pixel(x, y, color)
 
-    def blit(self):
-        """blit is not yet implemented"""
-        raise NotImplementedError()
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        """Draw another FrameBuffer on top of this one at the given location. ``fbuf`` can
+        also be a ``(buffer, width, height, format[, stride])`` tuple. The area is clipped
+        to the bounds of this FrameBuffer.
+
+        Pixels of color ``key`` are transparent and left unchanged. If given, ``palette``
+        is a FrameBuffer one pixel high that translates the colors of ``fbuf``, e.g. to draw
+        a 1-bit sprite in color; ``key`` is then compared to the untranslated colors.
+
+        Without a palette and with no rotation, FrameBuffers of the same format are copied
+        a byte or a row at a time instead of a pixel at a time."""
+        # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+
+        # Clip the source rectangle to this FrameBuffer
+        width = self.width
+        height = self.height
+        if self.rotation in (1, 3):
+            width, height = height, width
+        src_x = max(0, -x)
+        src_y = max(0, -y)
+        x_end = min(width, x + fbuf.width)
+        y_end = min(height, y + fbuf.height)
+        x = max(x, 0)
+        y = max(y, 0)
+        if x >= x_end or y >= y_end:
+            return
+
+        if (
+            self.rotation == 0
+            and palette is None
+            and isinstance(fbuf.format, type(self.format))
+            and hasattr(self.format, "blit")
+        ):
+            if self._blit(fbuf, x, y, src_x, src_y, x_end - x, y_end - y, key):
+                return
+
+        if key != -1 and isinstance(fbuf.format, RGB565Format):
+            # Compare with the color as it reads back from the source
+            lobyte, hibyte = fbuf.format.color_to_rgb565(key)
+            key = (
+                (hibyte & 0xF8) << 16
+                | ((hibyte & 0x07) << 5 | (lobyte & 0xE0) >> 5) << 8
+                | (lobyte & 0x1F) << 3
+            )
+        elif isinstance(key, tuple):
+            key = key[0] << 16 | key[1] << 8 | key[2]
+        get_pixel = fbuf.format.get_pixel
+        for _y in range(y, y_end):
+            for _x in range(x, x_end):
+                color = get_pixel(fbuf, src_x + _x - x, src_y + _y - y)
+                if color == key:
+                    continue
+                if palette is not None:
+                    color = palette.format.get_pixel(palette, color, 0)
+                self.pixel(_x, _y, color)
+
+    def _blit(self, fbuf, x, y, src_x, src_y, width, height, key):
+        """Copy with the format's blit, wrapping around at the bottom when the rows are
+        offset by `ring_scroll()`."""
+        # pylint: disable=too-many-arguments
+        if self._ring_offset:
+            y += self._ring_offset
+            if y >= self.height:
+                y -= self.height
+            elif y + height > self.height:
+                rows = self.height - y
+                if not self.format.blit(
+                    self, fbuf, x, y, src_x, src_y, width, rows, key
+                ):
+                    return False
+                self.format.blit(
+                    self, fbuf, x, 0, src_x, src_y + rows, width, height - rows, key
+                )
+                self._mark_dirty(x, y, width, rows)
+                self._mark_dirty(x, 0, width, height - rows)
+                return True
+        if not self.format.blit(self, fbuf, x, y, src_x, src_y, width, height, key):
+            return False
+        self._mark_dirty(x, y, width, height)
+        return True
+
+    @property
+    def ring_offset(self):
+        """The row of ``buf`` that holds the top row of the image, moved by `ring_scroll()`.
+        Rows are counted before rotation."""
+        return self._ring_offset
+
+    def ring_scroll(self, delta_y):
+        """Scroll vertically without moving any pixels: ``ring_offset`` changes instead and
+        drawing keeps using the same coordinates. Rows scrolled out at one edge come back
+        in at the other, so a ticker only has to clear and draw the new line.
+
+        Whatever sends ``buf`` to the display has to start at row ``ring_offset``, like the
+        SSD1306 driver does with its display start line. Otherwise call
+        `ring_normalize()` first. Rows are counted before rotation."""
+        self._ring_offset = (self._ring_offset - delta_y) % self.height
+
+    def ring_normalize(self):
+        """Move the pixels so the image starts at the first row of ``buf`` again and
+        ``ring_offset`` is 0. Uses a temporary copy of ``buf``."""
+        offset = self._ring_offset
+        if not offset:
+            return
+        source = FrameBuffer(bytearray(self.buf), self.width, self.height, MVLSB)
+        source.format = self.format
+        source.stride = self.stride
+        rotation = self._rotation
+        self._rotation = 0
+        self._ring_offset = 0
+        try:
+            self.blit(source, 0, -offset)
+            self.blit(source, 0, self.height - offset)
+        finally:
+            self._rotation = rotation
 
     def scroll(self, delta_x, delta_y):
         """shifts framebuf in x and y direction"""
+        if abs(delta_x) >= self.width or abs(delta_y) >= self.height:
+            # Everything is shifted out
+            return
+        if self._ring_offset:
+            self.ring_normalize()
+        self._mark_dirty(0, 0, self.width, self.height)
+        if hasattr(self.format, "scroll") and self.format.scroll(
+            self, delta_x, delta_y
+        ):
+            return
         if delta_x < 0:
             shift_x = 0
             xend = self.width + delta_x
@@ -492,8 +981,10 @@ class FrameBuffer:
     # pylint: disable=too-many-arguments
     def text(self, string, x, y, color, *, font_name="font5x8.bin", size=1):
         """Place text on the screen in variables sizes. Breaks on \n to next line.
+        ``string`` can also be a list of lines.
 
-        Does not break on line going off screen.
+        Does not break on line going off screen. Lines and characters that are off screen
+        are skipped without being drawn.
         """
         # determine our effective width/height, taking rotation into account
         frame_width = self.width
@@ -501,22 +992,37 @@ class FrameBuffer:
         if self.rotation in (1, 3):
             frame_width, frame_height = frame_height, frame_width
 
-        for chunk in string.split("\n"):
-            if not self._font or self._font.font_name != font_name:
-                # load the font!
-                self._font = BitmapFont(font_name)
-            width = self._font.font_width
-            height = self._font.font_height
-            for i, char in enumerate(chunk):
-                char_x = x + (i * (width + 1)) * size
-                if (
-                    char_x + (width * size) > 0
-                    and char_x < frame_width
-                    and y + (height * size) > 0
-                    and y < frame_height
-                ):
-                    self._font.draw_char(char, char_x, y, self, color, size=size)
-            y += height * size
+        font = self._load_font(font_name)
+        size = max(size, 1)
+        width = font.font_width * size
+        height = font.font_height * size
+        advance = width + size
+        lines = string.split("\n") if isinstance(string, str) else string
+        for chunk in lines:
+            if y >= frame_height:
+                break
+            if y + height > 0:
+                # Only the characters that are at least partly on screen
+                first = max(0, (-x - width) // advance + 1)
+                last = min(len(chunk), (frame_width - x + advance - 1) // advance)
+                for i in range(first, last):
+                    font.draw_char(chunk[i], x + i * advance, y, self, color, size=size)
+            y += height
+
+    def text_size(self, string, *, font_name="font5x8.bin", size=1):
+        """The width and height in pixels of text drawn with `text()`, including the
+        space after the last character of the longest line."""
+        font = self._load_font(font_name)
+        size = max(size, 1)
+        lines = string.split("\n") if isinstance(string, str) else string
+        width = max((font.width(line) for line in lines), default=0)
+        return width * size, len(lines) * font.font_height * size
+
+    def _load_font(self, font_name):
+        if not self._font or self._font.font_name != font_name:
+            # load the font!
+            self._font = BitmapFont(font_name)
+        return self._font
 
     # pylint: enable=too-many-arguments
 
@@ -541,6 +1047,9 @@ class FrameBuffer:
             )
         # Grab all the pixels from the image, faster than getpixel.
         pixels = img.load()
+        # Every pixel is redrawn, so the rows can go back where they belong
+        self._ring_offset = 0
+        self._mark_dirty(0, 0, self.width, self.height)
         # Clear buffer
         for i in range(len(self.buf)):  # pylint: disable=consider-using-enumerate
             self.buf[i] = 0
@@ -553,6 +1062,25 @@ class FrameBuffer:
                     self.pixel(x, y, 1)  # only write if pixel is true
 
 
+def _union(rect, other):
+    return [
+        min(rect[0], other[0]),
+        min(rect[1], other[1]),
+        max(rect[2], other[2]),
+        max(rect[3], other[3]),
+    ]
+
+
+def _union_growth(rect, other):
+    """How much larger the union of two areas is than both of them."""
+    union = _union(rect, other)
+    return (
+        (union[2] - union[0]) * (union[3] - union[1])
+        - (rect[2] - rect[0]) * (rect[3] - rect[1])
+        - (other[2] - other[0]) * (other[3] - other[1])
+    )
+
+
 # MicroPython basic bitmap font renderer.
 # Author: Tony DiCola
 # License: MIT License (https://opensource.org/licenses/MIT)
@@ -561,7 +1089,7 @@ class BitmapFont:
     file to display in a framebuffer. We use file access so we dont waste 1KB
     of RAM on a font!"""
 
-    def __init__(self, font_name="font5x8.bin"):
+    def __init__(self, font_name="font5x8.bin", cache_size=64):
         # Specify the drawing area width and height, and the pixel function to
         # call when drawing pixels (should take an x and y param at least).
         # Optionally specify font_name to override the font file to use (default
@@ -572,7 +1100,11 @@ class BitmapFont:
         # - x bytes: font data, in ASCII order covering all 255 characters.
         #            Each character should have a byte for each pixel column of
         #            data (i.e. a 5x8 font has 5 bytes per character).
+        # The columns of the cache_size most recently drawn characters are kept in
+        # RAM, so drawing them again does not read the file.
         self.font_name = font_name
+        self.cache_size = cache_size
+        self._glyphs = OrderedDict()
 
         # Open the font file and grab the character width and height values.
         # Note that only fonts up to 8 pixels tall are currently supported.
@@ -605,11 +1137,39 @@ class BitmapFont:
         """cleanup on exit"""
         self.deinit()
 
+    def _glyph(self, char):
+        """Return the column bytes of a character, from the cache if possible."""
+        code = ord(char)
+        glyph = self._glyphs.get(code)
+        if glyph is not None:
+            if len(self._glyphs) > 1:
+                # Reinsert to mark it as the most recently used.
+                self._glyphs[code] = self._glyphs.pop(code)
+            return glyph
+        self._font.seek(2 + code * self.font_width)
+        glyph = self._font.read(self.font_width)
+        if len(glyph) < self.font_width:
+            # maybe character isnt there? draw nothing
+            glyph = bytes(self.font_width)
+        if self.cache_size > 0:
+            while len(self._glyphs) >= self.cache_size:
+                self._glyphs.pop(next(iter(self._glyphs)))
+            self._glyphs[code] = glyph
+        return glyph
+
     def draw_char(
         self, char, x, y, framebuffer, color, size=1
     ):  # pylint: disable=too-many-arguments
         """Draw one character at position (x,y) to a framebuffer in a given color"""
         size = max(size, 1)
+        glyph = self._glyph(char)
+        if (
+            size == 1
+            and isinstance(framebuffer.format, MVLSBFormat)
+            and framebuffer.rotation == 0
+            and self._draw_mvlsb(glyph, x, y, framebuffer, color)
+        ):
+            return
         # Don't draw the character if it will be clipped off the visible area.
         # if x < -self.font_width or x >= framebuffer.width or \
         #   y < -self.font_height or y >= framebuffer.height:
@@ -617,11 +1177,7 @@ class BitmapFont:
         # Go through each column of the character.
         for char_x in range(self.font_width):
             # Grab the byte for the current column of font data.
-            self._font.seek(2 + (ord(char) * self.font_width) + char_x)
-            try:
-                line = struct.unpack("B", self._font.read(1))[0]
-            except RuntimeError:
-                continue  # maybe character isnt there? go to next
+            line = glyph[char_x]
             # Go through each row in the column byte.
             for char_y in range(self.font_height):
                 # Draw a pixel for each bit that's flipped on.
@@ -630,6 +1186,52 @@ class BitmapFont:
                         x + char_x * size, y + char_y * size, size, size, color
                     )
 
+    def _draw_mvlsb(self, glyph, x, y, framebuffer, color):
+        """Draw a character by writing each column of the font into the page bytes it
+        covers. Returns False if the rows wrap around at the ring offset."""
+        # pylint: disable=too-many-arguments
+        height = framebuffer.height
+        glyph_mask = 0xFF >> (8 - self.font_height)
+        offset = framebuffer.ring_offset
+        if offset:
+            if y < 0 or y + self.font_height > height:
+                return False
+            y += offset
+            if y >= height:
+                y -= height
+            elif y + self.font_height > height:
+                return False
+        # Rows below the frame buffer, in its last partial page, are masked off
+        pages = ((y, (0xFF << (y & 7)) & 0xFF, y & 7, 0),)
+        if y & 7:
+            pages += ((y + 8, 0xFF >> (8 - (y & 7)), 0, 8 - (y & 7)),)
+        buf = framebuffer.buf
+        stride = framebuffer.stride
+        columns = range(max(0, -x), min(self.font_width, framebuffer.width - x))
+        # pylint: disable=protected-access
+        framebuffer._mark_dirty(
+            x + columns.start,
+            max(y, 0),
+            len(columns),
+            min(y + self.font_height, height) - max(y, 0),
+        )
+        last_page = (height - 1) >> 3
+        for row, page_mask, left, right in pages:
+            page = row >> 3
+            if page < 0 or page > last_page:
+                continue
+            if page == last_page:
+                page_mask &= 0xFF >> (7 - ((height - 1) & 7))
+            index = page * stride + x
+            for column in columns:
+                bits = ((glyph[column] & glyph_mask) << left >> right) & page_mask
+                if bits:
+                    if color:
+                        buf[index + column] |= bits
+                    else:
+                        buf[index + column] &= ~bits
+        return True
+
     def width(self, text):
         """Return the pixel width of the specified text message."""
         return len(text) * (self.font_width + 1)
@@ -78,6 +78,7 @@ from .status import (
     ACCEPTED_202,
     NO_CONTENT_204,
     PARTIAL_CONTENT_206,
+    NOT_MODIFIED_304,
     MOVED_PERMANENTLY_301,
     FOUND_302,
     TEMPORARY_REDIRECT_307,
@@ -87,6 +88,7 @@ from .status import (
     FORBIDDEN_403,
     NOT_FOUND_404,
     METHOD_NOT_ALLOWED_405,
+    RANGE_NOT_SATISFIABLE_416,
     TOO_MANY_REQUESTS_429,
     INTERNAL_SERVER_ERROR_500,
     NOT_IMPLEMENTED_501,
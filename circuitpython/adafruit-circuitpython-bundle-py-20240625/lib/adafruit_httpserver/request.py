@@ -8,7 +8,17 @@
 """
 
 try:
-    from typing import List, Dict, Tuple, Union, Any, TYPE_CHECKING
+    from typing import (
+        List,
+        Dict,
+        Tuple,
+        Union,
+        Any,
+        Callable,
+        Iterable,
+        Optional,
+        TYPE_CHECKING,
+    )
 
     if TYPE_CHECKING:
         from .server import Server
@@ -16,6 +26,8 @@ except ImportError:
     pass
 
 import json
+from errno import EAGAIN, ENOTCONN, ETIMEDOUT
+from time import monotonic
 
 from .headers import Headers
 from .interfaces import _ISocket, _IFieldStorage, _IXSSSafeFieldStorage
@@ -150,6 +162,133 @@ class Files(_IFieldStorage):
         return super().get_list(field_name)
 
 
+_PREAMBLE = 0
+_DELIMITER = 1
+_HEADERS = 2
+_CONTENT = 3
+_EPILOGUE = 4
+
+
+class _MultipartParser:
+    """
+    Parses ``multipart/form-data`` as it arrives in chunks, adding the fields to a `FormData`.
+
+    Only a delimiter's length of data is held back between chunks. File parts are either kept
+    in memory as `File` objects or, with a ``file_handler``, written to the object it returns.
+    """
+
+    def __init__(
+        self,
+        form_data: "FormData",
+        boundary: str,
+        file_handler: "Optional[Callable[[str, str, str], Any]]" = None,
+    ) -> None:
+        self._form_data = form_data
+        self._first_delimiter = b"--" + boundary.encode()
+        self._delimiter = b"\r\n" + self._first_delimiter
+        self._file_handler = file_handler
+        self._state = _PREAMBLE
+        self._part = None
+        self._file = None
+        self._content = None
+        self._write = None
+
+    def parse(self, chunks: "Iterable[Union[bytes, bytearray, memoryview]]") -> None:
+        """Parses the body, given as an iterable of chunks."""
+        pending = bytearray()
+        for chunk in chunks:
+            # Chunks that are views of a reused buffer have to be copied before returning
+            if pending or isinstance(chunk, memoryview):
+                pending.extend(chunk)
+                del pending[: self._feed(pending)]
+            else:
+                pending.extend(memoryview(chunk)[self._feed(chunk) :])
+
+    def _feed(self, data: Union[bytes, bytearray]) -> int:
+        """Parses as much of ``data`` as possible and returns how much of it was used."""
+        start = 0
+        while True:
+            if self._state == _PREAMBLE:
+                index = data.find(self._first_delimiter, start)
+                if index < 0:
+                    return max(start, len(data) - len(self._first_delimiter) + 1)
+                start = index + len(self._first_delimiter)
+                self._state = _DELIMITER
+
+            elif self._state == _DELIMITER:
+                if len(data) - start < 2:
+                    return start
+                if data[start : start + 2] == b"--":
+                    self._state = _EPILOGUE
+                    return len(data)
+                start += 2
+                self._state = _HEADERS
+
+            elif self._state == _HEADERS:
+                index = data.find(b"\r\n\r\n", start)
+                if index < 0:
+                    return start
+                self._start_part(Headers(str(data[start:index], "utf-8").strip()))
+                start = index + 4
+                self._state = _CONTENT
+
+            elif self._state == _CONTENT:
+                index = data.find(self._delimiter, start)
+                if index < 0:
+                    # The end might be the beginning of a delimiter, keep it for later
+                    end = max(start, len(data) - len(self._delimiter) + 1)
+                    self._write(memoryview(data)[start:end])
+                    return end
+                self._write(memoryview(data)[start:index])
+                self._end_part()
+                start = index + len(self._delimiter)
+                self._state = _DELIMITER
+
+            else:
+                return len(data)
+
+    def _start_part(self, headers: Headers) -> None:
+        field_name = headers.get_parameter("Content-Disposition", "name")
+        filename = headers.get_parameter("Content-Disposition", "filename")
+        content_type = headers.get_directive("Content-Type", "text/plain")
+        charset = headers.get_parameter("Content-Type", "charset", "utf-8")
+        self._part = (field_name, filename, content_type, charset)
+
+        self._file = None
+        self._content = None
+        if filename is not None and self._file_handler is not None:
+            self._file = self._file_handler(field_name, filename, content_type)
+            self._write = (
+                self._file.write if self._file is not None else lambda data: None
+            )
+        else:
+            self._content = bytearray()
+            self._write = self._content.extend
+
+    def _end_part(self) -> None:
+        field_name, filename, content_type, charset = self._part
+
+        if self._content is None:
+            if self._file is not None and hasattr(self._file, "close"):
+                self._file.close()
+            return
+
+        content = bytes(self._content)
+        self._content = None
+        value = content.decode(charset) if content_type == "text/plain" else content
+
+        # TODO: Other text content types (e.g. application/json) should be decoded as well and
+
+        if filename is not None:
+            self._form_data.files._add_field_value(  # pylint: disable=protected-access
+                field_name, File(filename, content_type, value)
+            )
+        else:
+            self._form_data._add_field_value(  # pylint: disable=protected-access
+                field_name, value
+            )
+
+
 class FormData(_IXSSSafeFieldStorage):
     """
     Class for parsing and storing form data from POST requests.
@@ -193,15 +332,18 @@ class FormData(_IXSSSafeFieldStorage):
         if debug and not self._check_is_supported_content_type(self.content_type):
             _debug_unsupported_form_content_type(self.content_type)
 
+        if content_length < len(data):
+            data = data[:content_length]
+
         if self.content_type == "application/x-www-form-urlencoded":
-            self._parse_x_www_form_urlencoded(data[:content_length])
+            self._parse_x_www_form_urlencoded(data)
 
         elif self.content_type == "multipart/form-data":
             boundary = headers.get_parameter("Content-Type", "boundary")
-            self._parse_multipart_form_data(data[:content_length], boundary)
+            self._parse_multipart_form_data(data, boundary)
 
         elif self.content_type == "text/plain":
-            self._parse_text_plain(data[:content_length])
+            self._parse_text_plain(data)
 
     def _parse_x_www_form_urlencoded(self, data: bytes) -> None:
         if not (decoded_data := data.decode("utf-8").strip("&")):
@@ -214,28 +356,7 @@ class FormData(_IXSSSafeFieldStorage):
             self._add_field_value(field_name, value)
 
     def _parse_multipart_form_data(self, data: bytes, boundary: str) -> None:
-        blocks = data.split(b"--" + boundary.encode())[1:-1]
-
-        for block in blocks:
-            header_bytes, content_bytes = block.split(b"\r\n\r\n", 1)
-            headers = Headers(header_bytes.decode("utf-8").strip())
-
-            field_name = headers.get_parameter("Content-Disposition", "name")
-            filename = headers.get_parameter("Content-Disposition", "filename")
-            content_type = headers.get_directive("Content-Type", "text/plain")
-            charset = headers.get_parameter("Content-Type", "charset", "utf-8")
-
-            content = content_bytes[:-2]  # remove trailing \r\n
-            value = content.decode(charset) if content_type == "text/plain" else content
-
-            # TODO: Other text content types (e.g. application/json) should be decoded as well and
-
-            if filename is not None:
-                self.files._add_field_value(  # pylint: disable=protected-access
-                    field_name, File(filename, content_type, value)
-                )
-            else:
-                self._add_field_value(field_name, value)
+        _MultipartParser(self, boundary).parse((data,))
 
     def _parse_text_plain(self, data: bytes) -> None:
         lines = data.decode("utf-8").split("\r\n")[:-1]
@@ -335,6 +456,12 @@ class Request:  # pylint: disable=too-many-instance-attributes
         self.raw_request = raw_request
         self._form_data = None
         self._cookies = None
+        # Set by a server in non-blocking mode when the client can send more requests
+        # on the same connection.
+        self._keep_alive = False
+        # Length of the part of the body that is still in the socket
+        self._body_remaining = 0
+        self._header_end = None
 
         if raw_request is None:
             raise ValueError("raw_request cannot be None")
@@ -353,6 +480,8 @@ class Request:  # pylint: disable=too-many-instance-attributes
     @property
     def body(self) -> bytes:
         """Body of the request, as bytes."""
+        if self._body_remaining:
+            self._receive_remaining_body()
         return self._raw_body_bytes
 
     @body.setter
@@ -436,6 +565,93 @@ class Request:  # pylint: disable=too-many-instance-attributes
             self._form_data = FormData(self.body, self.headers, debug=self.server.debug)
         return self._form_data
 
+    def stream_form_data(
+        self, file_handler: "Callable[[str, str, str], Any]"
+    ) -> Union[FormData, None]:
+        """
+        Parses ``multipart/form-data`` POST data while it is being received, passing the
+        content of uploaded files to ``file_handler`` instead of keeping it in memory.
+
+        ``file_handler`` is called with the field name, filename and content type of each
+        uploaded file and should return an object with a ``write`` method, such as an open
+        file, which receives the content in chunks and is closed at the end of the file.
+        Returning ``None`` skips the file. Other fields are available in the returned
+        `FormData` as usual, while uploaded files are not in its ``files``.
+
+        To handle uploads larger than the available memory, set
+        ``Server.max_buffered_body_size`` so that the body is not received before the
+        handler is called. Other content types are parsed like `form_data`.
+
+        Example::
+
+            def save_file(field_name, filename, content_type):
+                return open("/sd/" + filename, "wb")
+
+            form_data = request.stream_form_data(save_file)
+        """
+        if self._form_data is not None or self.method != "POST":
+            return self._form_data
+        if self.headers.get_directive("Content-Type") != "multipart/form-data":
+            return self.form_data
+
+        self._form_data = FormData(b"", self.headers, debug=self.server.debug)
+        boundary = self.headers.get_parameter("Content-Type", "boundary")
+        _MultipartParser(self._form_data, boundary, file_handler).parse(
+            self._body_chunks()
+        )
+        return self._form_data
+
+    def _receive_body_into(self, buffer: memoryview) -> int:
+        """Receives part of the body that is still in the socket into ``buffer``."""
+        nbytes = min(len(buffer), self._body_remaining)
+        start_time = monotonic()
+        while True:
+            try:
+                length = self.connection.recv_into(buffer, nbytes)
+                break
+            except OSError as error:
+                # Connections of a server in non-blocking mode have to be waited on
+                if (
+                    error.errno != EAGAIN
+                    or self.server.socket_timeout < monotonic() - start_time
+                ):
+                    raise
+        if length == 0:
+            raise OSError(ENOTCONN)
+        self._body_remaining -= length
+        return length
+
+    def _receive_remaining_body(self) -> None:
+        received = len(self.raw_request)
+        raw_request = bytearray(received + self._body_remaining)
+        raw_request[:received] = self.raw_request
+        view = memoryview(raw_request)
+        while self._body_remaining:
+            try:
+                received += self._receive_body_into(view[received:])
+            except OSError as error:
+                if error.errno not in (ETIMEDOUT, ENOTCONN):
+                    raise
+                self._body_remaining = 0
+        self.raw_request = bytes(view[:received])
+
+    def _body_chunks(self) -> "Iterable[Union[bytes, memoryview]]":
+        """Yields the body as it is received. Views of the buffer are only valid until the
+        next one is yielded."""
+        yield self._raw_body_bytes
+        view = memoryview(self.server._buffer)  # pylint: disable=protected-access
+        while self._body_remaining:
+            yield view[: self._receive_body_into(view)]
+
+    def _discard_body(self) -> None:
+        """Receives and drops the part of the body the handler did not read."""
+        view = memoryview(self.server._buffer)  # pylint: disable=protected-access
+        while self._body_remaining:
+            try:
+                self._receive_body_into(view)
+            except OSError:
+                self._body_remaining = 0
+
     def json(self) -> Union[dict, None]:
         """
         Body of the request, as a JSON-decoded dictionary.
@@ -447,19 +663,21 @@ class Request:  # pylint: disable=too-many-instance-attributes
             else None
         )
 
+    @property
+    def _empty_line_index(self) -> int:
+        if self._header_end is None:
+            self._header_end = self.raw_request.find(b"\r\n\r\n")
+        return self._header_end
+
     @property
     def _raw_header_bytes(self) -> bytes:
         """Returns headers bytes."""
-        empty_line_index = self.raw_request.find(b"\r\n\r\n")
-
-        return self.raw_request[:empty_line_index]
+        return self.raw_request[: self._empty_line_index]
 
     @property
     def _raw_body_bytes(self) -> bytes:
         """Returns body bytes."""
-        empty_line_index = self.raw_request.find(b"\r\n\r\n")
-
-        return self.raw_request[empty_line_index + 4 :]
+        return self.raw_request[self._empty_line_index + 4 :]
 
     @staticmethod
     def _parse_request_header(
@@ -16,6 +16,7 @@ import os
 import json
 from binascii import b2a_base64
 from errno import EAGAIN, ECONNRESET, ETIMEDOUT, ENOTCONN
+from time import monotonic
 
 try:
     try:
@@ -39,14 +40,105 @@ from .status import (
     Status,
     SWITCHING_PROTOCOLS_101,
     OK_200,
+    PARTIAL_CONTENT_206,
     MOVED_PERMANENTLY_301,
     FOUND_302,
+    NOT_MODIFIED_304,
     TEMPORARY_REDIRECT_307,
     PERMANENT_REDIRECT_308,
+    RANGE_NOT_SATISFIABLE_416,
 )
 from .headers import Headers
 from .interfaces import _ISocket
 
+try:
+    from time import gmtime
+except ImportError:
+    from time import localtime as gmtime
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+# Unmasking XORs whole words at a time where ints are not limited to a single machine word
+try:
+    _WIDE_INTS = int.from_bytes(b"\xff" * 9, "big") >> 64 == 0xFF
+except OverflowError:
+    _WIDE_INTS = False
+_UNMASK_WORD_SIZE = 256
+
+
+def _unmask(payload: memoryview, mask: memoryview) -> None:
+    """XORs ``payload`` in place with the repeating 4 byte websocket ``mask``."""
+    length = len(payload)
+    if not _WIDE_INTS:
+        for index in range(length):
+            payload[index] ^= mask[index & 3]
+        return
+    if length == 0:
+        return
+
+    # Word size is a multiple of 4, so the mask lines up with every word
+    word_size = min(length, _UNMASK_WORD_SIZE)
+    repeated_mask = bytes(mask) * (word_size // 4 + 1)
+    wide_mask = int.from_bytes(repeated_mask[:word_size], "little")
+    for start in range(0, length, word_size):
+        end = min(start + word_size, length)
+        if end - start < word_size:
+            wide_mask = int.from_bytes(repeated_mask[: end - start], "little")
+        payload[start:end] = (
+            int.from_bytes(payload[start:end], "little") ^ wide_mask
+        ).to_bytes(end - start, "little")
+
+
+_VALIDATORS_CACHE_SIZE = 16
+_validators_cache: "Dict[str, Tuple[int, int, str, Optional[str]]]" = {}
+
+
+def _get_file_validators(file_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Returns the ``ETag`` and ``Last-Modified`` values for the file at ``file_path``.
+
+    Formatting the date is not free, so the values are cached per path and only
+    regenerated when the size or modification time of the file changes.
+    """
+    stat = os.stat(file_path)
+    size, mtime = stat[6], stat[8]
+
+    cached = _validators_cache.get(file_path)
+    if cached is not None and cached[0] == size and cached[1] == mtime:
+        return cached[2], cached[3]
+
+    etag = f'"{size:x}-{mtime:x}"'
+    if 0 < mtime:
+        year, month, day, hour, minute, second, weekday = gmtime(mtime)[:7]
+        last_modified = (
+            f"{_WEEKDAYS[weekday]}, {day:02d} {_MONTHS[month - 1]} {year} "
+            f"{hour:02d}:{minute:02d}:{second:02d} GMT"
+        )
+    else:
+        last_modified = None  # Filesystem without timestamps
+
+    if file_path not in _validators_cache and _VALIDATORS_CACHE_SIZE <= len(
+        _validators_cache
+    ):
+        _validators_cache.pop(next(iter(_validators_cache)))
+    _validators_cache[file_path] = (size, mtime, etag, last_modified)
+
+    return etag, last_modified
+
 
 class Response:  # pylint: disable=too-few-public-methods
     """
@@ -90,6 +182,8 @@ class Response:  # pylint: disable=too-few-public-methods
         self._cookies = cookies.copy() if cookies else {}
         self._content_type = content_type
         self._size = 0
+        self._keep_alive = False
+        self._dropped = False
 
     def _send_headers(
         self,
@@ -106,7 +200,14 @@ class Response:  # pylint: disable=too-few-public-methods
             "Content-Type", content_type or self._content_type or MIMETypes.DEFAULT
         )
         headers.setdefault("Content-Length", content_length)
-        headers.setdefault("Connection", "close")
+
+        # The connection can only be reused if the client can tell where the body ends.
+        keep_alive = self._request._keep_alive and (  # pylint: disable=protected-access
+            headers.get("Content-Length") is not None
+            or "chunked" in (headers.get("Transfer-Encoding") or "")
+        )
+        headers.setdefault("Connection", "keep-alive" if keep_alive else "close")
+        self._keep_alive = keep_alive and headers.get("Connection") == "keep-alive"
 
         for cookie_name, cookie_value in self._cookies.items():
             headers.add("Set-Cookie", f"{cookie_name}={cookie_value}")
@@ -137,18 +238,31 @@ class Response:  # pylint: disable=too-few-public-methods
         bytes_sent: int = 0
         bytes_to_send = len(buffer)
         view = memoryview(buffer)
-        while bytes_sent < bytes_to_send:
+        start_time = monotonic()
+        while bytes_sent < bytes_to_send and not self._dropped:
             try:
                 bytes_sent += conn.send(view[bytes_sent:])
+                start_time = monotonic()
             except OSError as exc:
                 if exc.errno == EAGAIN:
+                    # A client that stopped reading must not stall the whole server
+                    if self._request.server.socket_timeout < monotonic() - start_time:
+                        self._drop_connection()
                     continue
                 if exc.errno == ECONNRESET:
                     return
                 raise
         self._size += bytes_sent
 
+    def _drop_connection(self) -> None:
+        """Closes the connection and skips sending the rest of the response."""
+        self._dropped = True
+        self._keep_alive = False
+        self._close_connection()
+
     def _close_connection(self) -> None:
+        if self._keep_alive:
+            return
         try:
             self._request.connection.close()
         except (BrokenPipeError, OSError):
@@ -165,6 +279,12 @@ class FileResponse(Response):  # pylint: disable=too-few-public-methods
     If browsers should download the file instead of displaying it, use ``as_attachment`` and
     ``download_filename`` arguments.
 
+    Responses with the default ``200 OK`` status to ``GET`` and ``HEAD`` requests include
+    ``ETag`` and ``Last-Modified`` headers, answer conditional requests with ``304 Not Modified``
+    and single ``Range`` requests with ``206 Partial Content``. If the client accepts gzip and
+    a precompressed ``<filename>.gz`` file exists next to the file, it is sent instead with
+    ``Content-Encoding: gzip``.
+
     Example::
 
         @server.route(path, method)
@@ -227,6 +347,7 @@ class FileResponse(Response):  # pylint: disable=too-few-public-methods
         self._buffer_size = buffer_size
         self._head_only = head_only
         self._safe = safe
+        self._range = None
 
         if as_attachment:
             self._headers.setdefault(
@@ -234,6 +355,99 @@ class FileResponse(Response):  # pylint: disable=too-few-public-methods
                 f"attachment; filename={download_filename or self._filename.split('/')[-1]}",
             )
 
+        if self._status == OK_200 and request.method in ("GET", "HEAD"):
+            self._use_gzipped_sibling()
+            self._apply_validators()
+            self._apply_range()
+
+    def _use_gzipped_sibling(self) -> None:
+        """
+        Serves ``<filename>.gz`` instead of the file itself when it exists and the client
+        accepts gzip. The content type stays the one of the uncompressed file.
+        """
+        if "gzip" not in (self._request.headers.get("Accept-Encoding") or ""):
+            return
+        self._headers.setdefault("Vary", "Accept-Encoding")
+
+        try:
+            self._file_length = self._get_file_length(self._full_file_path + ".gz")
+        except FileNotExistsError:
+            return
+        self._full_file_path += ".gz"
+        self._headers.setdefault("Content-Encoding", "gzip")
+
+    def _apply_validators(self) -> None:
+        """
+        Adds ``ETag`` and ``Last-Modified`` headers and turns the response into
+        ``304 Not Modified`` if the client already has the current version of the file.
+        """
+        etag, last_modified = _get_file_validators(self._full_file_path)
+        self._headers.setdefault("ETag", etag)
+        if last_modified is not None:
+            self._headers.setdefault("Last-Modified", last_modified)
+        self._headers.setdefault("Accept-Ranges", "bytes")
+
+        if_none_match = self._request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            not_modified = if_none_match.strip() == "*" or etag in (
+                tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")
+            )
+        else:
+            not_modified = (
+                last_modified is not None
+                and self._request.headers.get("If-Modified-Since") == last_modified
+            )
+
+        if not_modified:
+            self._status = NOT_MODIFIED_304
+            self._head_only = True
+
+    def _apply_range(self) -> None:
+        """
+        Limits the response to the part of the file requested in the ``Range`` header.
+
+        Only a single ``bytes`` range is supported, multiple ranges are answered with
+        the whole file, as allowed by the specification.
+        """
+        range_header = self._request.headers.get("Range")
+        if (
+            self._status != OK_200
+            or range_header is None
+            or not range_header.startswith("bytes=")
+            or "," in range_header
+        ):
+            return
+
+        # A range only applies to the version of the file the client already has part of
+        if_range = self._request.headers.get("If-Range")
+        if if_range is not None and if_range not in (
+            self._headers.get("ETag"),
+            self._headers.get("Last-Modified"),
+        ):
+            return
+
+        start, _, end = range_header[6:].strip().partition("-")
+        try:
+            if not start:
+                start, end = max(self._file_length - int(end), 0), self._file_length - 1
+            else:
+                start = int(start)
+                end = min(int(end), self._file_length - 1) if end else self._file_length - 1
+        except ValueError:
+            return
+
+        if start < 0 or end < start or self._file_length <= start:
+            self._status = RANGE_NOT_SATISFIABLE_416
+            self._headers.setdefault("Content-Range", f"bytes */{self._file_length}")
+            self._file_length = 0
+            self._head_only = True
+            return
+
+        self._status = PARTIAL_CONTENT_206
+        self._headers.setdefault("Content-Range", f"bytes {start}-{end}/{self._file_length}")
+        self._range = start
+        self._file_length = end - start + 1
+
     @staticmethod
     def _verify_file_path_is_valid(file_path: str):
         """
@@ -283,8 +497,18 @@ class FileResponse(Response):  # pylint: disable=too-few-public-methods
 
         if not self._head_only:
             with open(self._full_file_path, "rb") as file:
-                while bytes_read := file.read(self._buffer_size):
-                    self._send_bytes(self._request.connection, bytes_read)
+                if self._range:
+                    file.seek(self._range)
+
+                buffer = bytearray(min(self._buffer_size, self._file_length) or 1)
+                view = memoryview(buffer)
+                bytes_left = self._file_length
+                while 0 < bytes_left:
+                    bytes_read = file.readinto(view[: min(len(buffer), bytes_left)])
+                    if not bytes_read:
+                        break
+                    self._send_bytes(self._request.connection, view[:bytes_read])
+                    bytes_left -= bytes_read
         self._close_connection()
 
 
@@ -462,7 +686,7 @@ class Redirect(Response):  # pylint: disable=too-few-public-methods
         self._headers.update({"Location": url})
 
     def _send(self) -> None:
-        self._send_headers()
+        self._send_headers(0)
         self._close_connection()
 
 
@@ -605,7 +829,7 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
     FIN = 0b10000000  # FIN bit indicating the final fragment
 
     # opcodes
-    CONT = 0  # Continuation frame, TODO: Currently not supported
+    CONT = 0  # Continuation frame, continues a fragmented message
     TEXT = 1  # Frame contains UTF-8 text
     BINARY = 2  # Frame contains binary data
     CLOSE = 8  # Frame closes the connection
@@ -663,6 +887,13 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
         self._headers.setdefault("Sec-WebSocket-Accept", sec_accept_key)
         self._headers.setdefault("Content-Type", None)
         self._buffer_size = buffer_size
+        self._buffer = bytearray(buffer_size)
+        self._buffer_view = memoryview(self._buffer)
+        self._send_buffer = bytearray(max(buffer_size, 10))
+        self._send_view = memoryview(self._send_buffer)
+        self._header_buffer = bytearray(14)
+        self._fragments: Optional[bytearray] = None
+        self._fragments_opcode: int = None
         self.closed = False
 
         request.connection.setblocking(False)
@@ -681,45 +912,66 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
 
         return fin, opcode, has_mask, length
 
-    def _read_frame(self):
-        buffer = bytearray(self._buffer_size)
+    def _receive_into(self, buffer: memoryview) -> None:
+        """
+        Fills whole ``buffer`` with the rest of a frame that has already started arriving.
 
-        header_length = self._request.connection.recv_into(buffer, 2)
-        header_bytes = buffer[:header_length]
+        The socket is non-blocking, so it has to be waited on, but only up to the server's
+        socket timeout. Giving up in the middle of a frame leaves the stream out of sync,
+        so that and a disconnected client are both reported as ``ENOTCONN``.
+        """
+        received = 0
+        start_time = None
+        while received < len(buffer):
+            try:
+                length = self._request.connection.recv_into(buffer[received:])
+            except OSError as error:
+                if error.errno != EAGAIN:
+                    raise OSError(ENOTCONN)  # pylint: disable=raise-missing-from
+                if start_time is None:
+                    start_time = monotonic()
+                elif self._request.server.socket_timeout < monotonic() - start_time:
+                    raise OSError(ENOTCONN)  # pylint: disable=raise-missing-from
+                continue
+            if length == 0:
+                raise OSError(ENOTCONN)
+            received += length
 
-        fin, opcode, has_mask, length = self._parse_frame_header(header_bytes)
+    def _read_frame(self):
+        header = memoryview(self._header_buffer)
 
-        # TODO: Handle continuation frames, currently not supported
-        if fin != Websocket.FIN and opcode == Websocket.CONT:
-            return Websocket.CONT, None
+        # Only the first read may find no data, the rest of the frame is waited for
+        header_length = self._request.connection.recv_into(header, 2)
+        if header_length == 0:
+            raise OSError(ENOTCONN)
+        if header_length == 1:
+            self._receive_into(header[1:2])
 
-        payload = bytes()
-        if fin == Websocket.FIN and opcode == Websocket.CLOSE:
-            return Websocket.CLOSE, payload
+        fin, opcode, has_mask, length = self._parse_frame_header(header)
 
         if length < 0:
-            length = self._request.connection.recv_into(buffer, -length)
-            length = int.from_bytes(buffer[:length], "big")
+            self._receive_into(header[2 : 2 - length])
+            length = int.from_bytes(header[2 : 2 - length], "big")
 
         if has_mask:
-            mask_length = self._request.connection.recv_into(buffer, 4)
-            mask = buffer[:mask_length]
+            self._receive_into(header[10:14])
 
-        while 0 < length:
-            payload_length = self._request.connection.recv_into(buffer, length)
-            payload += buffer[: min(payload_length, length)]
-            length -= min(payload_length, length)
+        # Small payloads go through the reusable buffer, larger ones get their own
+        if length <= len(self._buffer):
+            payload = self._buffer_view[:length]
+        else:
+            payload = memoryview(bytearray(length))
+        if length:
+            self._receive_into(payload)
 
         if has_mask:
-            payload = bytes(byte ^ mask[idx % 4] for idx, byte in enumerate(payload))
+            _unmask(payload, header[10:14])
 
-        return opcode, payload
-
-    def _handle_frame(self, opcode: int, payload: bytes) -> Union[str, bytes, None]:
-        # TODO: Handle continuation frames, currently not supported
-        if opcode == Websocket.CONT:
-            return None
+        return fin, opcode, payload
 
+    def _handle_frame(
+        self, fin: int, opcode: int, payload: memoryview
+    ) -> Union[str, bytes, None]:
         if opcode == Websocket.CLOSE:
             self.close()
             return None
@@ -727,9 +979,24 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
         if opcode == Websocket.PONG:
             return None
         if opcode == Websocket.PING:
+            payload = bytes(payload)
             self.send_message(payload, Websocket.PONG)
             return payload
 
+        # Fragments are collected until the final one, control frames may come in between
+        if opcode == Websocket.CONT:
+            if self._fragments is None:
+                return None
+            self._fragments.extend(payload)
+            if not fin:
+                return None
+            opcode, payload = self._fragments_opcode, self._fragments
+            self._fragments = None
+        elif not fin:
+            self._fragments_opcode, self._fragments = opcode, bytearray(payload)
+            return None
+
+        payload = bytes(payload)
         try:
             payload = payload.decode() if opcode == Websocket.TEXT else payload
         except UnicodeError:
@@ -741,6 +1008,8 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
         """
         Receive a message from the client.
 
+        Messages sent in multiple fragments are returned whole, once the last fragment arrives.
+
         :param bool fail_silently: If True, no error will be raised if the connection is closed.
         """
         if self.closed:
@@ -751,8 +1020,8 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
             )
 
         try:
-            opcode, payload = self._read_frame()
-            frame_data = self._handle_frame(opcode, payload)
+            fin, opcode, payload = self._read_frame()
+            frame_data = self._handle_frame(fin, opcode, payload)
 
             return frame_data
         except OSError as error:
@@ -765,30 +1034,29 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
                 return None
             raise error
 
-    @staticmethod
-    def _prepare_frame(opcode: int, message: bytes) -> bytearray:
-        frame = bytearray()
-
-        frame.append(Websocket.FIN | opcode)  # Setting FIN bit
+    def _prepare_frame_header(self, opcode: int, payload_length: int) -> int:
+        """
+        Writes the frame header into the reusable send buffer and returns its length.
+        """
+        header = self._send_buffer
 
-        payload_length = len(message)
+        header[0] = Websocket.FIN | opcode  # Setting FIN bit
 
         # Message under 126 bytes, use 1 byte for length
         if payload_length < 126:
-            frame.append(payload_length)
+            header[1] = payload_length
+            return 2
 
         # Message between 126 and 65535 bytes, use 2 bytes for length
-        elif payload_length < 65536:
-            frame.append(126)
-            frame.extend(payload_length.to_bytes(2, "big"))
+        if payload_length < 65536:
+            header[1] = 126
+            header[2:4] = payload_length.to_bytes(2, "big")
+            return 4
 
         # Message over 65535 bytes, use 8 bytes for length
-        else:
-            frame.append(127)
-            frame.extend(payload_length.to_bytes(8, "big"))
-
-        frame.extend(message)
-        return frame
+        header[1] = 127
+        header[2:10] = payload_length.to_bytes(8, "big")
+        return 10
 
     def send_message(
         self,
@@ -813,13 +1081,24 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
             Websocket.TEXT if isinstance(message, str) else Websocket.BINARY
         )
 
-        if determined_opcode == Websocket.TEXT:
+        if isinstance(message, str):
             message = message.encode()
 
-        frame = self._prepare_frame(determined_opcode, message)
+        header_length = self._prepare_frame_header(determined_opcode, len(message))
+        frame_length = header_length + len(message)
 
         try:
-            self._send_bytes(self._request.connection, frame)
+            # Small messages are sent in one piece, larger ones without copying the payload
+            if frame_length <= len(self._send_buffer):
+                self._send_buffer[header_length:frame_length] = message
+                self._send_bytes(
+                    self._request.connection, self._send_view[:frame_length]
+                )
+            else:
+                self._send_bytes(
+                    self._request.connection, self._send_view[:header_length]
+                )
+                self._send_bytes(self._request.connection, message)
         except BrokenPipeError as error:
             if fail_silently:
                 return
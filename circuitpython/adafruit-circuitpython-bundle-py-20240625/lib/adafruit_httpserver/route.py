@@ -8,7 +8,17 @@
 """
 
 try:
-    from typing import Callable, Iterable, Union, Tuple, Literal, Dict, TYPE_CHECKING
+    from typing import (
+        Callable,
+        Iterable,
+        Union,
+        Tuple,
+        Literal,
+        Dict,
+        List,
+        Optional,
+        TYPE_CHECKING,
+    )
 
     if TYPE_CHECKING:
         from .response import Response
@@ -56,6 +66,7 @@ class Route:
             set(methods) if isinstance(methods, (set, list, tuple)) else set([methods])
         )
         self.handler = handler
+        self.append_slash = append_slash
         self.parameters_names = [
             name[1:-1] for name in re.compile(r"/[^<>]*/?").split(path) if name != ""
         ]
@@ -143,6 +154,132 @@ class Route:
         return f"<Route {path=}, {methods=}, {handler=}>"
 
 
+class _RouteNode:  # pylint: disable=too-few-public-methods
+    """One path segment in the `_Routes` trie."""
+
+    def __init__(self) -> None:
+        self.static: "Dict[str, _RouteNode]" = {}
+        self.parameter: "_RouteNode" = None  # <name>
+        self.wildcard: "_RouteNode" = None  # ...
+        self.multi_wildcard: "_RouteNode" = None  # ....
+        self.routes: "List[Route]" = []
+
+    def child(self, segment: str) -> "_RouteNode":
+        """Returns the child node for a route path segment, creating it if needed."""
+        if segment.startswith("<"):
+            if self.parameter is None:
+                self.parameter = _RouteNode()
+            return self.parameter
+        if segment == "...":
+            if self.wildcard is None:
+                self.wildcard = _RouteNode()
+            return self.wildcard
+        if segment == "....":
+            if self.multi_wildcard is None:
+                self.multi_wildcard = _RouteNode()
+            return self.multi_wildcard
+        if segment not in self.static:
+            self.static[segment] = _RouteNode()
+        return self.static[segment]
+
+
+class _Routes:
+    """
+    Routes registered in a server, stored as a trie of path segments per method.
+
+    Finding a handler walks the path one segment at a time, so it does not get slower as
+    routes are added. Static segments are tried before URL parameters, URL parameters
+    before ``...`` and ``...`` before ``....``. Among routes with the same path the one
+    added first wins.
+    """
+
+    _HANDLER_CACHE_SIZE = 16
+
+    def __init__(self) -> None:
+        self._roots: "Dict[str, _RouteNode]" = {}
+        # Handlers for recently requested (method, path) pairs
+        self._handlers: "Dict[Tuple[str, str], Optional[Callable]]" = {}
+
+    def add(self, route: Route) -> None:
+        """Adds a route to the trie."""
+        segments = route.path.split("/")[1:]
+        for method in route.methods:
+            if method not in self._roots:
+                self._roots[method] = _RouteNode()
+            node = self._roots[method]
+            for segment in segments:
+                node = node.child(segment)
+            node.routes.append(route)
+            if route.append_slash:
+                node.child("").routes.append(route)
+        self._handlers.clear()
+
+    def _match(
+        self, node: _RouteNode, segments: List[str], index: int, values: List[str]
+    ) -> Optional[Route]:
+        if index == len(segments):
+            return node.routes[0] if node.routes else None
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            route = self._match(child, segments, index + 1, values)
+            if route is not None:
+                return route
+
+        if segment:
+            if node.parameter is not None:
+                values.append(segment)
+                route = self._match(node.parameter, segments, index + 1, values)
+                if route is not None:
+                    return route
+                values.pop()
+
+            if node.wildcard is not None:
+                route = self._match(node.wildcard, segments, index + 1, values)
+                if route is not None:
+                    return route
+
+        if node.multi_wildcard is not None:
+            # Like the ".+" it stands for, match as many segments as possible first
+            for end in range(len(segments), index, -1):
+                if end - index == 1 and not segment:
+                    continue
+                route = self._match(node.multi_wildcard, segments, end, values)
+                if route is not None:
+                    return route
+
+        return None
+
+    def find_handler(self, method: str, path: str) -> Optional[Callable[..., "Response"]]:
+        """
+        Returns the handler of the route matching ``method`` and ``path``, or ``None``.
+
+        URL parameters are bound to the handler, so it only has to be called with the request.
+        """
+        key = (method, path)
+        if key in self._handlers:
+            return self._handlers[key]
+
+        handler = None
+        root = self._roots.get(method)
+        if root is not None:
+            values = []
+            route = self._match(root, path.split("/")[1:], 0, values)
+            if route is not None:
+                handler = route.handler
+                if values:
+                    url_parameters = dict(zip(route.parameters_names, values))
+
+                    def handler(request):  # pylint: disable=function-redefined
+                        return route.handler(request, **url_parameters)
+
+        if len(self._handlers) >= self._HANDLER_CACHE_SIZE:
+            self._handlers.pop(next(iter(self._handlers)))
+        self._handlers[key] = handler
+        return handler
+
+
 def as_route(
     path: str,
     methods: Union[str, Iterable[str]] = GET,
@@ -30,7 +30,7 @@ from .interfaces import _ISocketPool, _ISocket
 from .methods import GET, HEAD
 from .request import Request
 from .response import Response, FileResponse
-from .route import Route
+from .route import Route, _Routes
 from .status import BAD_REQUEST_400, UNAUTHORIZED_401, FORBIDDEN_403, NOT_FOUND_404
 
 
@@ -40,6 +40,20 @@ REQUEST_HANDLED_NO_RESPONSE = "request_handled_no_response"
 REQUEST_HANDLED_RESPONSE_SENT = "request_handled_response_sent"
 
 
+class _Connection:  # pylint: disable=too-few-public-methods
+    """A client connection kept open by a `Server` in non-blocking mode."""
+
+    def __init__(self, sock: _ISocket, client_address: Tuple[str, int]) -> None:
+        self.socket = sock
+        self.client_address = client_address
+        self.data = bytearray()
+        # Index of the empty line ending the headers once it has been received
+        self.header_end = None
+        self.scanned = 0
+        self.request: Request = None
+        self.last_activity = monotonic()
+
+
 class Server:  # pylint: disable=too-many-instance-attributes
     """A basic socket-based HTTP server."""
 
@@ -53,7 +67,12 @@ class Server:  # pylint: disable=too-many-instance-attributes
     """Root directory to serve files from. ``None`` if serving files is disabled."""
 
     def __init__(
-        self, socket_source: _ISocketPool, root_path: str = None, *, debug: bool = False
+        self,
+        socket_source: _ISocketPool,
+        root_path: str = None,
+        *,
+        debug: bool = False,
+        max_connections: int = None,
     ) -> None:
         """Create a server, and get it ready to run.
 
@@ -61,11 +80,22 @@ class Server:  # pylint: disable=too-many-instance-attributes
           in CircuitPython or the `socket` module in CPython.
         :param str root_path: Root directory to serve files from
         :param bool debug: Enables debug messages useful during development
+        :param int max_connections: Enables non-blocking mode, in which ``.poll()`` never
+          waits for a client. Up to this many connections are read from in turn, requests
+          are handled as soon as they have been fully received and HTTP/1.1 connections
+          are kept open for further requests. By default a single connection is handled
+          at a time and ``.poll()`` blocks until its whole request is received.
         """
+        if max_connections is not None and max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        self._max_connections = max_connections
+        self._connections: "List[_Connection]" = []
         self._auths = []
-        self._buffer = bytearray(1024)
+        self._buffer_size = 1024
+        self._buffer = bytearray(self._buffer_size)
+        self._max_buffered_body_size = None
         self._timeout = 1
-        self._routes: "List[Route]" = []
+        self._routes = _Routes()
         self._socket_source = socket_source
         self._sock = None
         self.headers = Headers()
@@ -87,7 +117,9 @@ class Server:  # pylint: disable=too-many-instance-attributes
         """
         Decorator used to add a route.
 
-        If request matches multiple routes, the first matched one added will be used.
+        If request matches multiple routes, static path segments take precedence over URL
+        parameters, and URL parameters over wildcards. Among equally specific routes the
+        first one added will be used.
 
         :param str path: URL path
         :param str methods: HTTP method(s): ``"GET"``, ``"POST"``, ``["GET", "POST"]`` etc.
@@ -132,7 +164,7 @@ class Server:  # pylint: disable=too-many-instance-attributes
         """
 
         def route_decorator(func: Callable) -> Callable:
-            self._routes.append(Route(path, methods, func, append_slash=append_slash))
+            self._routes.add(Route(path, methods, func, append_slash=append_slash))
             return func
 
         return route_decorator
@@ -157,7 +189,8 @@ class Server:  # pylint: disable=too-many-instance-attributes
                 external_route2,
             ]}
         """
-        self._routes.extend(routes)
+        for route in routes:
+            self._routes.add(route)
 
     def _verify_can_start(self, host: str, port: int) -> None:
         """Check if the server can be successfully started. Raises RuntimeError if not."""
@@ -194,6 +227,41 @@ class Server:  # pylint: disable=too-many-instance-attributes
             except Exception:  # pylint: disable=broad-except
                 pass  # Ignore exceptions in handler function
 
+    async def serve_forever_async(
+        self, host: str = "0.0.0.0", port: int = 5000, *, poll_interval: float = 0.01
+    ) -> None:
+        """
+        Same as ``.serve_forever()``, but as an ``asyncio`` task that lets other tasks run
+        between polls. Best used together with ``max_connections``, as otherwise each poll
+        blocks until a whole request is received.
+
+        Example::
+
+            server = Server(pool, "/static", max_connections=4)
+
+            async def main():
+                await asyncio.gather(
+                    server.serve_forever_async(str(wifi.radio.ipv4_address)),
+                    other_task(),
+                )
+
+            asyncio.run(main())
+
+        :param str host: host name or IP address
+        :param int port: port
+        :param float poll_interval: interval between polls in seconds
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self.start(host, port)
+
+        while not self.stopped:
+            try:
+                result = self.poll()
+            except Exception:  # pylint: disable=broad-except
+                result = None  # Ignore exceptions in handler function
+            await asyncio.sleep(poll_interval if result == NO_REQUEST else 0)
+
     @staticmethod
     def _create_server_socket(
         socket_source: _ISocketPool,
@@ -241,42 +309,66 @@ class Server:  # pylint: disable=too-many-instance-attributes
         self.stopped = True
         self._sock.close()
 
+        for connection in self._connections:
+            connection.socket.close()
+        self._connections.clear()
+
         if self.debug:
             _debug_stopped_server(self)
 
-    def _receive_header_bytes(self, sock: _ISocket) -> bytes:
-        """Receive bytes until a empty line is received."""
-        received_bytes = bytes()
-        while b"\r\n\r\n" not in received_bytes:
+    def _receive_header_bytes(self, sock: _ISocket) -> Tuple[int, int]:
+        """
+        Receive bytes into the request buffer until an empty line is received. Returns the
+        number of bytes received and the index of the empty line, ``-1`` if there was none.
+        """
+        length = 0
+        while True:
+            if length == len(self._buffer):
+                self._grow_buffer(2 * length)
             try:
-                length = sock.recv_into(self._buffer, len(self._buffer))
-                received_bytes += self._buffer[:length]
+                received = sock.recv_into(
+                    memoryview(self._buffer)[length:], len(self._buffer) - length
+                )
             except OSError as ex:
                 if ex.errno == ETIMEDOUT:
-                    break
+                    return length, self._buffer.find(b"\r\n\r\n", 0, length)
                 raise
-            except Exception as ex:
-                raise ex
-        return received_bytes
+            if received == 0:
+                return length, self._buffer.find(b"\r\n\r\n", 0, length)
+            # Only search the new bytes, plus three in case the empty line was split
+            header_end = self._buffer.find(
+                b"\r\n\r\n", max(0, length - 3), length + received
+            )
+            length += received
+            if header_end >= 0:
+                return length, header_end
 
+    @staticmethod
     def _receive_body_bytes(
-        self,
-        sock: _ISocket,
-        received_body_bytes: bytes,
-        content_length: int,
-    ) -> bytes:
-        """Receive bytes until the given content length is received."""
-        while len(received_body_bytes) < content_length:
+        sock: _ISocket, buffer: bytearray, length: int, request_end: int
+    ) -> int:
+        """
+        Receive bytes into ``buffer`` until it holds ``request_end`` bytes. Returns the number
+        of bytes received.
+        """
+        view = memoryview(buffer)
+        while length < request_end:
             try:
-                length = sock.recv_into(self._buffer, len(self._buffer))
-                received_body_bytes += self._buffer[:length]
+                received = sock.recv_into(view[length:request_end], request_end - length)
             except OSError as ex:
                 if ex.errno == ETIMEDOUT:
                     break
                 raise
-            except Exception as ex:
-                raise ex
-        return received_body_bytes[:content_length]
+            if received == 0:
+                break
+            length += received
+        return length
+
+    def _grow_buffer(self, size: int) -> None:
+        """Grows the request buffer to at least ``size``, keeping its contents."""
+        buffer = bytearray(max(size, 2 * len(self._buffer)))
+        buffer[: len(self._buffer)] = self._buffer
+        self._buffer = buffer
 
     def _receive_request(
         self,
@@ -286,25 +378,47 @@ class Server:  # pylint: disable=too-many-instance-attributes
         """Receive bytes from socket until the whole request is received."""
 
         # Receiving data until empty line
-        header_bytes = self._receive_header_bytes(sock)
+        length, header_end = self._receive_header_bytes(sock)
 
         # Return if no data received
-        if not header_bytes:
+        if not length:
             return None
 
-        request = Request(self, sock, client_address, header_bytes)
+        if header_end < 0:
+            # Let the request parser decide what to make of it
+            return Request(self, sock, client_address, bytes(self._buffer[:length]))
 
+        header_length = header_end + 4
+        request = Request(
+            self, sock, client_address, bytes(self._buffer[:header_length])
+        )
         content_length = int(request.headers.get_directive("Content-Length", 0))
-        received_body_bytes = request.body
+
+        if (
+            self._max_buffered_body_size is not None
+            and self._max_buffered_body_size < content_length
+        ):
+            # Leave the rest of the body in the socket for the handler to stream
+            length = min(length, header_length + content_length)
+            request.raw_request = bytes(self._buffer[:length])
+            request._body_remaining = (  # pylint: disable=protected-access
+                content_length - (length - header_length)
+            )
+            return request
 
         # Receiving remaining body bytes
-        request.body = self._receive_body_bytes(
-            sock, received_body_bytes, content_length
-        )
+        request_end = header_length + content_length
+        buffer = self._buffer
+        if len(buffer) < request_end:
+            # Large bodies get a buffer of their own, so the shared one stays small
+            buffer = bytearray(request_end)
+            buffer[:length] = memoryview(self._buffer)[:length]
+        length = self._receive_body_bytes(sock, buffer, length, request_end)
+        request.raw_request = bytes(memoryview(buffer)[: min(length, request_end)])
 
         return request
 
-    def _find_handler(  # pylint: disable=cell-var-from-loop
+    def _find_handler(
         self, method: str, path: str
     ) -> Union[Callable[..., "Response"], None]:
         """
@@ -321,17 +435,7 @@ class Server:  # pylint: disable=too-many-instance-attributes
                 request.path == "/example/123" # True
                 my_parameter == "123" # True
         """
-        for route in self._routes:
-            route_matches, url_parameters = route.matches(method, path)
-
-            if route_matches:
-
-                def wrapped_handler(request):
-                    return route.handler(request, **url_parameters)
-
-                return wrapped_handler
-
-        return None
+        return self._routes.find_handler(method, path)
 
     def _handle_request(
         self, request: Request, handler: Union[Callable, None]
@@ -397,6 +501,9 @@ class Server:  # pylint: disable=too-many-instance-attributes
         if self.stopped:
             raise ServerStoppedError
 
+        if self._max_connections is not None:
+            return self._poll_connections()
+
         conn = None
         try:
             conn, client_address = self._sock.accept()
@@ -414,6 +521,7 @@ class Server:  # pylint: disable=too-many-instance-attributes
 
             # Handle the request
             response = self._handle_request(request, handler)
+            request._discard_body()  # pylint: disable=protected-access
 
             if response is None:
                 conn.close()
@@ -447,6 +555,151 @@ class Server:  # pylint: disable=too-many-instance-attributes
                 conn.close()
             raise error  # Raise the exception again to be handled by the user.
 
+    def _accept_connections(self) -> None:
+        while len(self._connections) < self._max_connections:
+            try:
+                conn, client_address = self._sock.accept()
+            except OSError as error:
+                if error.errno in (EAGAIN, ECONNRESET):
+                    return
+                raise
+            conn.setblocking(False)
+            self._connections.append(_Connection(conn, client_address))
+
+    def _close_connection(self, connection: _Connection) -> None:
+        self._connections.remove(connection)
+        try:
+            connection.socket.close()
+        except OSError:
+            pass
+
+    def _buffered_request(self, connection: _Connection) -> bool:
+        """Whether a whole request is buffered, which is then in ``connection.request``."""
+        data = connection.data
+        if connection.header_end is None:
+            # Only search the new bytes, plus three in case the empty line was split
+            header_end = data.find(b"\r\n\r\n", max(0, connection.scanned - 3))
+            if header_end < 0:
+                connection.scanned = len(data)
+                return False
+            connection.header_end = header_end
+            connection.request = Request(
+                self,
+                connection.socket,
+                connection.client_address,
+                bytes(data[: header_end + 4]),
+            )
+
+        request = connection.request
+        header_length = connection.header_end + 4
+        content_length = int(request.headers.get_directive("Content-Length", 0))
+        request_end = header_length + content_length
+        if (
+            self._max_buffered_body_size is not None
+            and self._max_buffered_body_size < content_length
+        ):
+            # Leave the rest of the body in the socket for the handler to stream
+            request_end = min(len(data), request_end)
+            request._body_remaining = (  # pylint: disable=protected-access
+                content_length - (request_end - header_length)
+            )
+        elif len(data) < request_end:
+            return False
+
+        request.raw_request = bytes(data[:request_end])
+        # Anything after the request is the start of the next pipelined one
+        del data[:request_end]
+        connection.header_end = None
+        connection.scanned = 0
+        return True
+
+    def _receive_request_nonblocking(self, connection: _Connection) -> Request:
+        """
+        Reads whatever the client has sent so far, without waiting for more. Returns the
+        request once all of it has been received.
+        """
+        if not self._buffered_request(connection):
+            try:
+                length = connection.socket.recv_into(self._buffer, len(self._buffer))
+            except OSError as error:
+                if error.errno not in (EAGAIN, ETIMEDOUT):
+                    raise
+                return None
+            if length == 0:
+                raise OSError(ECONNRESET)
+
+            connection.data.extend(memoryview(self._buffer)[:length])
+            connection.last_activity = monotonic()
+            if not self._buffered_request(connection):
+                return None
+
+        request = connection.request
+        connection.request = None
+        return request
+
+    def _poll_connections(self) -> str:
+        """``.poll()`` in non-blocking mode."""
+        self._accept_connections()
+
+        result = NO_REQUEST
+        now = monotonic()
+        for connection in list(self._connections):
+            try:
+                request = self._receive_request_nonblocking(connection)
+            except (OSError, ValueError) as error:
+                # Client disconnected or sent something that is not HTTP
+                self._close_connection(connection)
+                if isinstance(error, ValueError):
+                    raise error
+                continue
+
+            if request is None:
+                if self._timeout < now - connection.last_activity:
+                    self._close_connection(connection)
+                    if result == NO_REQUEST:
+                        result = CONNECTION_TIMED_OUT
+                continue
+
+            request._keep_alive = (  # pylint: disable=protected-access
+                _wants_keep_alive(request)
+            )
+
+            response = None
+            try:
+                _debug_start_time = monotonic()
+
+                handler = self._find_handler(request.method, request.path)
+                response = self._handle_request(request, handler)
+                request._discard_body()  # pylint: disable=protected-access
+
+                if response is None:
+                    self._close_connection(connection)
+                    if result == NO_REQUEST:
+                        result = REQUEST_HANDLED_NO_RESPONSE
+                    continue
+
+                self._set_default_server_headers(response)
+                response._send()  # pylint: disable=protected-access
+
+                if self.debug:
+                    _debug_response_sent(response, monotonic() - _debug_start_time)
+            except Exception as error:  # pylint: disable=broad-except
+                if self.debug:
+                    _debug_exception_in_handler(error)
+                if connection in self._connections:
+                    self._close_connection(connection)
+                raise error
+
+            if response._keep_alive:  # pylint: disable=protected-access
+                connection.last_activity = monotonic()
+            else:
+                # The response either closed the connection or, like SSEResponse and
+                # Websocket, keeps using it outside of the server.
+                self._connections.remove(connection)
+            result = REQUEST_HANDLED_RESPONSE_SENT
+
+        return result
+
     def require_authentication(self, auths: List[Union[Basic, Token, Bearer]]) -> None:
         """
         Requires authentication for all routes and files in ``root_path``.
@@ -484,9 +737,9 @@ class Server:  # pylint: disable=too-many-instance-attributes
     @property
     def request_buffer_size(self) -> int:
         """
-        The maximum size of the incoming request buffer. If the default size isn't
-        adequate to handle your incoming data you can set this after creating the
-        server instance.
+        The initial size of the incoming request buffer. The buffer is reused between
+        requests and grows to fit larger ones, so setting it to the size of a typical
+        request avoids growing it later.
 
         Default size is 1024 bytes.
 
@@ -497,12 +750,46 @@ class Server:  # pylint: disable=too-many-instance-attributes
 
             server.serve_forever(str(wifi.radio.ipv4_address))
         """
-        return len(self._buffer)
+        return self._buffer_size
 
     @request_buffer_size.setter
     def request_buffer_size(self, value: int) -> None:
+        self._buffer_size = value
         self._buffer = bytearray(value)
 
+    @property
+    def max_buffered_body_size(self) -> Union[int, None]:
+        """
+        Largest request body that is received before the handler is called. Larger bodies are
+        left in the socket and received when the handler accesses ``request.body``, or
+        streamed with ``request.stream_form_data()`` without ever being held in memory as a
+        whole. Parts of the body the handler does not read are discarded.
+
+        Default is ``None``, which receives every body before calling the handler.
+
+        Example::
+
+            server = Server(pool, "/static")
+            server.max_buffered_body_size = 4096
+
+            @server.route("/upload", POST)
+            def upload(request: Request):
+                request.stream_form_data(lambda name, filename, content_type: open(
+                    "/sd/" + filename, "wb"
+                ))
+                return Response(request, "Uploaded")
+        """
+        return self._max_buffered_body_size
+
+    @max_buffered_body_size.setter
+    def max_buffered_body_size(self, value: Union[int, None]) -> None:
+        if value is None or (isinstance(value, int) and value >= 0):
+            self._max_buffered_body_size = value
+        else:
+            raise ValueError(
+                "Server.max_buffered_body_size must be None or a non-negative integer."
+            )
+
     @property
     def socket_timeout(self) -> int:
         """
@@ -536,6 +823,14 @@ class Server:  # pylint: disable=too-many-instance-attributes
         return f"<Server {host=}, {port=}, {root_path=}>"
 
 
+def _wants_keep_alive(request: Request) -> bool:
+    """Whether the client asked to reuse the connection for further requests."""
+    connection = (request.headers.get_directive("Connection") or "").lower()
+    if request.http_version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
 def _debug_warning_exposed_files(root_path: str):
     """Warns about exposing all files on the device."""
     print(
@@ -46,6 +46,8 @@ NO_CONTENT_204 = Status(204, "No Content")
 
 PARTIAL_CONTENT_206 = Status(206, "Partial Content")
 
+NOT_MODIFIED_304 = Status(304, "Not Modified")
+
 MOVED_PERMANENTLY_301 = Status(301, "Moved Permanently")
 
 FOUND_302 = Status(302, "Found")
@@ -64,6 +66,8 @@ NOT_FOUND_404 = Status(404, "Not Found")
 
 METHOD_NOT_ALLOWED_405 = Status(405, "Method Not Allowed")
 
+RANGE_NOT_SATISFIABLE_416 = Status(416, "Range Not Satisfiable")
+
 TOO_MANY_REQUESTS_429 = Status(429, "Too Many Requests")
 
 INTERNAL_SERVER_ERROR_500 = Status(500, "Internal Server Error")
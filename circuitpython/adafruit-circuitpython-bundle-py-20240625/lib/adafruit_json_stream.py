@@ -19,6 +19,14 @@ __version__ = "0.8.3"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_JSON_Stream.git"
 
 
+_QUOTE = ord('"')
+# Characters that matter while skipping over a value: anything else is passed by
+# with bytes.find instead of being looked at one at a time.
+_STRUCTURE = (b'"', b"{", b"[", b"}", b"]")
+_STRING_SPECIAL = (b'"', b"\\")
+_CLOSERS = (b"}", b"]")
+
+
 class _IterToStream:
     """Converts an iterator to a JSON data stream."""
 
@@ -26,36 +34,109 @@ class _IterToStream:
         self.data_iter = data_iter
         self.i = 0
         self.chunk = b""
+        # Next position of characters searched for in the current chunk, so each
+        # chunk is scanned about once per character no matter how often we look.
+        self._positions = {}
+        # Whether the last value read ended its list or object instead of being
+        # followed by a comma, and whether there was no value at all, which
+        # next_value returns as None just like null.
+        self.closed_container = False
+        self.empty = False
+
+    def _next_chunk(self):
+        """Move on to the next non-empty chunk. Returns False when there are none."""
+        while True:
+            try:
+                chunk = next(self.data_iter)
+            except StopIteration:
+                return False
+            # Skips past the end of the last chunk carry over into this one.
+            self.i -= len(self.chunk)
+            self.chunk = chunk
+            self._positions = {}
+            if self.i < len(chunk):
+                return True
 
     def read(self):
         """Read the next character from the stream."""
-        if self.i >= len(self.chunk):
-            try:
-                self.chunk = next(self.data_iter)
-            except StopIteration as exc:
-                raise EOFError from exc
-            self.i = 0
+        if self.i >= len(self.chunk) and not self._next_chunk():
+            raise EOFError
         char = self.chunk[self.i]
         self.i += 1
         return char
 
+    def _find(self, char):
+        """Position of the next ``char`` in the current chunk, or -1."""
+        pos = self._positions.get(char, -2)
+        if -1 < pos < self.i or pos == -2:
+            pos = self.chunk.find(char, self.i)
+            self._positions[char] = pos
+        return pos
+
+    def _read_until(self, chars, buf=None):
+        """Read through the stream until one of ``chars`` (1 byte ``bytes`` each)
+        and return it. Everything before it is appended to ``buf`` if given."""
+        while True:
+            chunk = self.chunk
+            if self.i >= len(chunk):
+                if not self._next_chunk():
+                    raise EOFError
+                continue
+            found = -1
+            for char in chars:
+                pos = self._find(char)
+                if pos >= 0 and (found < 0 or pos < found):
+                    found = pos
+            if found >= 0:
+                if buf is not None:
+                    buf.extend(memoryview(chunk)[self.i : found])
+                self.i = found + 1
+                return chunk[found]
+            if buf is not None:
+                buf.extend(memoryview(chunk)[self.i :])
+            self.i = len(chunk)
+
+    def _read_string(self, buf=None):
+        """Read through the rest of a string, up to and including its closing quote."""
+        while True:
+            char = self._read_until(_STRING_SPECIAL, buf)
+            if buf is not None:
+                buf.append(char)
+            if char == _QUOTE:
+                return
+            escaped = self.read()
+            if buf is not None:
+                buf.append(escaped)
+
+    def _read_non_space(self):
+        """Read the next character that is not whitespace."""
+        while True:
+            chunk = self.chunk
+            i = self.i
+            end = len(chunk)
+            while i < end and chunk[i] <= 0x20:
+                i += 1
+            self.i = i
+            if i < end:
+                self.i += 1
+                return chunk[i]
+            if not self._next_chunk():
+                raise EOFError
+
     def fast_forward(self, closer):
         """Read through the stream until the character is ``closer``, ``]``
         (ending a list) or ``}`` (ending an object.) Intermediate lists and
         objects are skipped."""
+        closer_char = closer.encode()
         closer = ord(closer)
+        outer = _STRUCTURE if closer_char in _STRUCTURE else _STRUCTURE + (closer_char,)
         close_stack = [closer]
-        count = 0
         while close_stack:
-            char = self.read()
-            count += 1
+            char = self._read_until(outer if len(close_stack) == 1 else _STRUCTURE)
             if char == close_stack[-1]:
                 close_stack.pop()
-            elif char == ord('"'):
-                close_stack.append(ord('"'))
-            elif close_stack[-1] == ord('"'):
-                # in a string so ignore [] and {}
-                pass
+            elif char == _QUOTE:
+                self._read_string()
             elif char in (ord("}"), ord("]")):
                 # Mismatched list or object means we're done and already past the last comma.
                 return True
@@ -67,31 +148,47 @@ class _IterToStream:
 
     def next_value(self, endswith=None):
         """Read and parse the next JSON data."""
-        buf = array.array("B")
-        if isinstance(endswith, str):
-            endswith = ord(endswith)
-        in_string = False
-        while True:
-            try:
-                char = self.read()
-            except EOFError:
-                char = endswith
-            if not in_string and (char == endswith or char in (ord("]"), ord("}"))):
-                if len(buf) == 0:
-                    return None
-                value_string = bytes(buf).decode("utf-8")
-                # print(f"{repr(value_string)}, {endswith=}")
-                return json.loads(value_string)
-            if char == ord("{"):
-                return TransientObject(self)
-            if char == ord("["):
-                return TransientList(self)
-
-            if not in_string:
-                in_string = char == ord('"')
-            else:
-                in_string = char != ord('"')
-            buf.append(char)
+        if endswith is None:
+            terminators = _CLOSERS
+        else:
+            if isinstance(endswith, int):
+                endswith = chr(endswith)
+            terminators = _CLOSERS + (endswith.encode(),)
+
+        self.closed_container = False
+        self.empty = True
+        try:
+            char = self._read_non_space()
+        except EOFError:
+            return None
+        if char == ord("{"):
+            self.empty = False
+            return TransientObject(self)
+        if char == ord("["):
+            self.empty = False
+            return TransientList(self)
+        if bytes((char,)) in terminators:
+            return None
+
+        self.empty = False
+        buf = bytearray((char,))
+        try:
+            if char == _QUOTE:
+                self._read_string(buf)
+            self.closed_container = bytes(
+                (self._read_until(terminators, buf),)
+            ) in _CLOSERS
+        except EOFError:
+            pass
+        value_string = str(buf, "utf-8").strip()
+        if (
+            value_string[0] == '"'
+            and value_string[-1] == '"'
+            and "\\" not in value_string
+        ):
+            # Plain strings are most of what is read and need no unescaping.
+            return value_string[1:-1]
+        return json.loads(value_string)
 
 
 class Transient:  # pylint: disable=too-few-public-methods
@@ -99,6 +196,37 @@ class Transient:  # pylint: disable=too-few-public-methods
 
     # This is helpful for checking that something is a TransientList or TransientObject.
 
+    def get_path(self, pointer):
+        """Return the value at a JSON pointer such as ``"/daily/0/temp"``, relative
+        to this object. Keys are matched as in `TransientObject` and list items are
+        selected by index. Like any other access this reads forward through the
+        stream, so only values after the last one read can be selected.
+
+        :param str pointer: ``/`` separated keys and indices, with ``~1`` for ``/``
+          and ``~0`` for ``~`` inside keys
+        """
+        value = self
+        if not pointer:
+            return value
+        if pointer[0] != "/":
+            raise ValueError("JSON pointer must start with /")
+        for token in pointer[1:].split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            if isinstance(value, TransientObject):
+                value = value[token]
+            elif isinstance(value, TransientList):
+                index = int(token)
+                items = value
+                for value in items:
+                    if index == 0:
+                        break
+                    index -= 1
+                else:
+                    raise IndexError(pointer)
+            else:
+                raise KeyError(pointer)
+        return value
+
 
 class TransientList(Transient):
     """Transient object that acts like a list through the stream."""
@@ -128,11 +256,13 @@ class TransientList(Transient):
         if self.done:
             raise StopIteration()
         next_value = self.data.next_value(",")
-        if next_value is None:
+        if self.data.empty:
             self.done = True
             raise StopIteration()
         if isinstance(next_value, Transient):
             self.active_child = next_value
+        elif self.data.closed_container:
+            self.done = True
         return next_value
 
 
@@ -173,9 +303,13 @@ class TransientObject(Transient):
                 next_value = self.data.next_value(",")
                 if isinstance(next_value, Transient):
                     self.active_child = next_value
+                elif self.data.closed_container:
+                    self.done = True
                 return next_value
-            self.data.fast_forward(",")
-        raise KeyError()
+            if self.data.fast_forward(","):
+                self.done = True
+                break
+        raise KeyError(key)
 
 
 def load(data_iter):
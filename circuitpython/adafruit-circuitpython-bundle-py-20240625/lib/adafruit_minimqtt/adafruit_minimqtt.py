@@ -38,7 +38,7 @@ from random import randint
 from adafruit_connection_manager import get_connection_manager
 
 try:
-    from typing import List, Optional, Tuple, Type, Union
+    from typing import Iterable, List, Optional, Tuple, Type, Union
 except ImportError:
     pass
 
@@ -51,6 +51,11 @@ from micropython import const
 
 from .matcher import MQTTMatcher
 
+try:
+    from .offline_queue import OfflineQueue
+except ImportError:
+    pass
+
 __version__ = "7.9.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MiniMQTT.git"
 
@@ -65,6 +70,7 @@ MQTT_TLS_PORT = const(8883)
 MQTT_PINGREQ = b"\xc0\0"
 MQTT_PINGRESP = const(0xD0)
 MQTT_PUBLISH = const(0x30)
+MQTT_PUBACK = const(0x40)
 MQTT_SUB = const(0x82)
 MQTT_UNSUB = const(0xA2)
 MQTT_DISCONNECT = b"\xe0\0"
@@ -135,6 +141,17 @@ class MQTT:
         passed as 1st argument.
     :param bool use_imprecise_time: on boards without time.monotonic_ns() one has to set
         this to True in order to operate correctly over more than 24 days or so
+    :param int recv_buffer_size: size of the buffer incoming packets are read into, in bytes.
+        Everything the socket has available is read at once, up to this size, and packets
+        are decoded from the buffer. Larger packets are received directly.
+    :param int send_buffer_size: size of the buffer outgoing PUBLISH packets are assembled in,
+        in bytes. Packets that fit are sent with a single write.
+    :param int max_inflight: how many QoS 1 messages may be waiting for their PUBACK at once.
+        With the default of 1, `publish()` waits for every PUBACK before returning.
+    :param OfflineQueue offline_queue: queue for messages that cannot be published because
+        the client is not connected or the connection fails while sending them. Queued
+        messages are published in order by `loop()` and `reconnect()`, at the queue's
+        ``replay_rate``. Without a queue, `publish()` raises instead.
 
     """
 
@@ -157,6 +174,10 @@ class MQTT:
         connect_retries: int = 5,
         user_data=None,
         use_imprecise_time: Optional[bool] = None,
+        recv_buffer_size: int = 512,
+        send_buffer_size: int = 512,
+        max_inflight: int = 1,
+        offline_queue: Optional[OfflineQueue] = None,
     ) -> None:
         self._connection_manager = get_connection_manager(socket_pool)
         self._socket_pool = socket_pool
@@ -165,6 +186,29 @@ class MQTT:
         self._backwards_compatible_sock = False
         self._use_binary_mode = use_binary_mode
 
+        # Bytes received but not consumed yet are kept in
+        # self._recv_buffer[self._recv_start:self._recv_end]
+        if recv_buffer_size < 2:
+            raise MMQTTException("recv_buffer_size must be at least 2")
+        self._recv_buffer = bytearray(recv_buffer_size)
+        self._recv_view = memoryview(self._recv_buffer)
+        self._recv_start = 0
+        self._recv_end = 0
+
+        # PUBLISH packets are assembled in self._send_buffer[:self._send_len]
+        if send_buffer_size < 16:
+            raise MMQTTException("send_buffer_size must be at least 16")
+        self._send_buffer = bytearray(send_buffer_size)
+        self._send_view = memoryview(self._send_buffer)
+        self._send_len = 0
+
+        if max_inflight < 1:
+            raise MMQTTException("max_inflight must be positive")
+        self._max_inflight = max_inflight
+        # Packet ID -> topic of QoS 1 messages waiting for PUBACK
+        self._inflight = {}
+        self._offline_queue = offline_queue
+
         self.use_monotonic_ns = False
         try:
             time.monotonic_ns()
@@ -502,7 +546,29 @@ class MQTT:
             ssl_context=self._ssl_context,
         )
         self._backwards_compatible_sock = not hasattr(self._sock, "recv_into")
+        self._recv_start = self._recv_end = 0
+        self._send_len = 0
+        self._inflight = {}
+
+        packet = self._build_connect_packet(clean_session)
+        self.logger.debug("Sending CONNECT to broker...")
+        self._sock.send(packet)
+        self._last_msg_sent_timestamp = self.get_monotonic_time()
+        self.logger.debug("Receiving CONNACK packet from broker")
+        stamp = self.get_monotonic_time()
+        while True:
+            op = self._wait_for_msg()
+            if op == 32:
+                return self._handle_connack(self._sock_exact_recv(3))
+
+            if op is None:
+                if self.get_monotonic_time() - stamp > self._recv_timeout:
+                    raise MMQTTException(
+                        f"No data received from broker for {self._recv_timeout} seconds."
+                    )
 
+    def _build_connect_packet(self, clean_session: bool) -> bytearray:
+        """Assembles the CONNECT packet [MQTT 3.1]."""
         fixed_header = bytearray([0x10])
 
         # Variable CONNECT header [MQTT 3.1.2]
@@ -532,48 +598,38 @@ class MQTT:
             var_header[7] |= self._lw_retain << 5
 
         self._encode_remaining_length(fixed_header, remaining_length)
-        self.logger.debug("Sending CONNECT to broker...")
         self.logger.debug(f"Fixed Header: {fixed_header}")
         self.logger.debug(f"Variable Header: {var_header}")
-        self._sock.send(fixed_header)
-        self._sock.send(var_header)
+        packet = fixed_header + var_header
         # [MQTT-3.1.3-4]
-        self._send_str(self.client_id)
+        self._append_str(packet, self.client_id)
         if self._lw_topic:
             # [MQTT-3.1.3-11]
-            self._send_str(self._lw_topic)
-            self._send_str(self._lw_msg)
+            self._append_str(packet, self._lw_topic)
+            self._append_str(packet, self._lw_msg)
         if self._username is not None:
-            self._send_str(self._username)
-            self._send_str(self._password)
-        self._last_msg_sent_timestamp = self.get_monotonic_time()
-        self.logger.debug("Receiving CONNACK packet from broker")
-        stamp = self.get_monotonic_time()
-        while True:
-            op = self._wait_for_msg()
-            if op == 32:
-                rc = self._sock_exact_recv(3)
-                assert rc[0] == 0x02
-                if rc[2] != 0x00:
-                    raise MMQTTException(CONNACK_ERRORS[rc[2]], code=rc[2])
-                self._is_connected = True
-                result = rc[0] & 1
-                if self.on_connect is not None:
-                    self.on_connect(self, self.user_data, result, rc[2])
-
-                return result
-
-            if op is None:
-                if self.get_monotonic_time() - stamp > self._recv_timeout:
-                    raise MMQTTException(
-                        f"No data received from broker for {self._recv_timeout} seconds."
-                    )
+            self._append_str(packet, self._username)
+            self._append_str(packet, self._password)
+        return packet
+
+    def _handle_connack(self, rc: bytearray) -> int:
+        """Processes the variable header of a CONNACK packet [MQTT 3.2]."""
+        assert rc[0] == 0x02
+        if rc[2] != 0x00:
+            raise MMQTTException(CONNACK_ERRORS[rc[2]], code=rc[2])
+        self._is_connected = True
+        result = rc[0] & 1
+        if self.on_connect is not None:
+            self.on_connect(self, self.user_data, result, rc[2])
+
+        return result
 
     def _close_socket(self):
         if self._sock:
             self.logger.debug("Closing socket")
             self._connection_manager.close_socket(self._sock)
             self._sock = None
+            self._recv_start = self._recv_end = 0
 
     # pylint: disable=no-self-use
     def _encode_remaining_length(
@@ -595,6 +651,23 @@ class MQTT:
         else:
             fixed_header.append(remaining_length)
 
+    @staticmethod
+    def _write_remaining_length(
+        buffer: bytearray, offset: int, remaining_length: int
+    ) -> int:
+        """Encode Remaining Length [2.2.3] into ``buffer`` at ``offset``,
+        returns the offset after it"""
+        while True:
+            encoded_byte = remaining_length % 0x80
+            remaining_length = remaining_length // 0x80
+            # if there is more data to encode, set the top bit of the byte
+            if remaining_length > 0:
+                encoded_byte |= 0x80
+            buffer[offset] = encoded_byte
+            offset += 1
+            if not remaining_length:
+                return offset
+
     def disconnect(self) -> None:
         """Disconnects the MiniMQTT client from the MQTT broker."""
         self._connected()
@@ -642,13 +715,149 @@ class MQTT:
     ) -> None:
         """Publishes a message to a topic provided.
 
+        QoS 1 messages are acknowledged by the broker with a PUBACK. ``publish()`` returns
+        once fewer than ``max_inflight`` messages are waiting for theirs, so with the default
+        of 1 it waits for the PUBACK of this message.
+        If no PUBACK arrives for ``recv_timeout`` seconds, `MMQTTException` is raised and
+        the messages waiting for one are given up on.
+
         :param str topic: Unique topic identifier.
         :param str|int|float|bytes msg: Data to send to the broker.
         :param bool retain: Whether the message is saved by the broker.
         :param int qos: Quality of Service level for the message, defaults to zero.
 
         """
+        if self._offline_queue is not None:
+            topic_bytes, msg = self._prepare_publish(topic, msg, qos)
+            if self.is_connected() and not self._offline_queue:
+                try:
+                    self._publish(topic, topic_bytes, msg, retain, qos)
+                    return
+                except (OSError, RuntimeError, MMQTTException) as e:
+                    self._publish_failed(e)
+            # Queued behind the older messages, keeping them in order
+            self.logger.debug(f"Queueing PUBLISH to {topic} for later")
+            self._offline_queue.put(topic_bytes, msg, retain, qos)
+            if self.is_connected():
+                self._replay_queued(1)
+            return
+
         self._connected()
+        topic_bytes, msg = self._prepare_publish(topic, msg, qos)
+        self._publish(topic, topic_bytes, msg, retain, qos)
+
+    def _publish(
+        self, topic: str, topic_bytes: bytes, msg: bytes, retain: bool, qos: int
+    ) -> None:
+        """Sends a validated message, for QoS 1 waiting for PUBACKs as `publish()` does."""
+        self.logger.debug(
+            "Sending PUBLISH\nTopic: %s\nMsg: %s\
+                            \nQoS: %d\nRetain? %r",
+            topic,
+            msg,
+            qos,
+            retain,
+        )
+        if qos == 1:
+            self._wait_for_inflight(self._max_inflight - 1)
+        self._write_publish(topic_bytes, msg, retain, qos)
+        self._flush_send_buffer()
+        if qos == 0 and self.on_publish is not None:
+            self.on_publish(self, self.user_data, topic, self._pid)
+        if qos == 1:
+            self._inflight[self._pid] = topic
+            self._wait_for_inflight(self._max_inflight - 1)
+
+    def _publish_failed(self, error: Exception) -> None:
+        """Closes the connection after sending failed, so messages are queued until
+        `reconnect()`."""
+        self.logger.warning(f"Unable to publish, queueing messages: {error}")
+        self._close_socket()
+        self._is_connected = False
+
+    def _replay_queued(self, count: Optional[int] = None) -> None:
+        """Publishes up to ``count`` messages from the offline queue, by default as many
+        as its ``replay_rate`` allows. A message is removed from the queue once it is sent,
+        or for QoS 1 once ``publish()`` would have returned."""
+        queue = self._offline_queue
+        if count is None:
+            count = queue.replay_allowance(self.get_monotonic_time())
+        while count > 0 and self.is_connected():
+            message = queue.peek()
+            if message is None:
+                return
+            topic_bytes, msg, retain, qos = message
+            try:
+                self._publish(str(topic_bytes, "utf-8"), topic_bytes, msg, retain, qos)
+            except (OSError, RuntimeError, MMQTTException) as e:
+                self._publish_failed(e)
+                return
+            queue.pop()
+            count -= 1
+
+    def publish_many(
+        self,
+        messages: Iterable[Tuple[str, Union[str, int, float, bytes]]],
+        retain: bool = False,
+        qos: int = 0,
+    ) -> None:
+        """Publishes several messages, coalescing as many packets into each socket write as
+        fit into the send buffer. Meant for many small messages, like sensor readings.
+
+        For QoS 1, at most ``max_inflight`` messages are sent before waiting for PUBACKs.
+        Returns once fewer than ``max_inflight`` messages are waiting for theirs, use
+        `wait_for_publishes()` to wait for all of them.
+
+        :param messages: (topic, message) pairs to publish, as accepted by `publish()`.
+        :param bool retain: Whether the messages are saved by the broker.
+        :param int qos: Quality of Service level for the messages, defaults to zero.
+
+        With an ``offline_queue``, the messages are queued and then published one write
+        each, so none is lost if the connection fails.
+
+        """
+        if self._offline_queue is not None:
+            count = 0
+            for topic, msg in messages:
+                topic_bytes, msg = self._prepare_publish(topic, msg, qos)
+                count += self._offline_queue.put(topic_bytes, msg, retain, qos)
+            if self.is_connected():
+                self._replay_queued(count)
+            return
+
+        self._connected()
+        published = []
+        try:
+            for topic, msg in messages:
+                topic_bytes, msg = self._prepare_publish(topic, msg, qos)
+                self.logger.debug(
+                    "Queueing PUBLISH\nTopic: %s\nMsg: %s\nQoS: %d", topic, msg, qos
+                )
+                if qos == 1 and len(self._inflight) >= self._max_inflight:
+                    self._flush_send_buffer()
+                    self._wait_for_inflight(self._max_inflight - 1)
+                self._write_publish(topic_bytes, msg, retain, qos)
+                if qos == 1:
+                    self._inflight[self._pid] = topic
+                elif self.on_publish is not None:
+                    published.append((topic, self._pid))
+        finally:
+            self._flush_send_buffer()
+
+        for topic, pid in published:
+            self.on_publish(self, self.user_data, topic, pid)
+        if qos == 1:
+            self._wait_for_inflight(self._max_inflight - 1)
+
+    def wait_for_publishes(self) -> None:
+        """Waits until the broker has acknowledged every QoS 1 message sent so far."""
+        self._connected()
+        self._wait_for_inflight(0)
+
+    def _prepare_publish(
+        self, topic: str, msg: Union[str, int, float, bytes], qos: int
+    ) -> Tuple[bytes, bytes]:
+        """Validates a message to publish and returns the encoded topic and message."""
         self._valid_topic(topic)
         if "+" in topic or "#" in topic:
             raise MMQTTException("Publish topic can not contain wildcards.")
@@ -668,57 +877,86 @@ class MQTT:
         assert (
             0 <= qos <= 1
         ), "Quality of Service Level 2 is unsupported by this library."
+        return topic.encode("utf-8"), msg
 
-        # fixed header. [3.3.1.2], [3.3.1.3]
-        pub_hdr_fixed = bytearray([MQTT_PUBLISH | retain | qos << 1])
-
-        # variable header = 2-byte Topic length (big endian)
-        pub_hdr_var = bytearray(struct.pack(">H", len(topic.encode("utf-8"))))
-        pub_hdr_var.extend(topic.encode("utf-8"))  # Topic name
-
-        remaining_length = 2 + len(msg) + len(topic.encode("utf-8"))
+    def _write_publish(
+        self, topic: bytes, msg: bytes, retain: bool, qos: int
+    ) -> None:
+        """Appends a PUBLISH packet to the send buffer, sending what is buffered first
+        if it does not fit. The payload of a packet larger than the buffer is sent
+        directly after its headers instead of being copied.
+        """
+        # variable header = 2-byte Topic length (big endian), Topic name
+        remaining_length = 2 + len(topic) + len(msg)
         if qos > 0:
             # packet identifier where QoS level is 1 or 2. [3.3.2.2]
             remaining_length += 2
-            self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-            pub_hdr_var.append(self._pid >> 8)
-            pub_hdr_var.append(self._pid & 0xFF)
+            self._next_pid()
+        # fixed header [3.3.1.2], [3.3.1.3] with up to 4 bytes of remaining length
+        header_length = 1 + 1 + (remaining_length > 0x7F) + (remaining_length > 0x3FFF)
+        header_length += remaining_length > 0x1FFFFF
+        header_length += 2 + len(topic) + 2 * (qos > 0)
+
+        buffer = self._send_buffer
+        if len(buffer) - self._send_len < header_length + len(msg):
+            self._flush_send_buffer()
+            if len(buffer) < header_length:
+                buffer = bytearray(header_length)
+
+        offset = self._send_len
+        buffer[offset] = MQTT_PUBLISH | retain | qos << 1
+        offset = self._write_remaining_length(buffer, offset + 1, remaining_length)
+        struct.pack_into("!H", buffer, offset, len(topic))
+        offset += 2
+        buffer[offset : offset + len(topic)] = topic
+        offset += len(topic)
+        if qos > 0:
+            struct.pack_into("!H", buffer, offset, self._pid)
+            offset += 2
 
-        self._encode_remaining_length(pub_hdr_fixed, remaining_length)
+        if buffer is self._send_buffer and offset + len(msg) <= len(buffer):
+            buffer[offset : offset + len(msg)] = msg
+            self._send_len = offset + len(msg)
+        else:
+            # The headers did not fit the send buffer or the payload does not fit
+            # after them
+            self._sock.send(memoryview(buffer)[:offset])
+            if msg:
+                self._sock.send(msg)
+            self._send_len = 0
+            self._last_msg_sent_timestamp = self.get_monotonic_time()
+
+    def _flush_send_buffer(self) -> None:
+        """Sends the packets assembled in the send buffer with a single write."""
+        if self._send_len:
+            send_len, self._send_len = self._send_len, 0
+            self._sock.send(self._send_view[:send_len])
+            self._last_msg_sent_timestamp = self.get_monotonic_time()
+
+    def _wait_for_inflight(self, max_inflight: int) -> None:
+        """Processes incoming packets until at most ``max_inflight`` QoS 1 messages
+        are waiting for PUBACK.
+        """
+        stamp = self.get_monotonic_time()
+        while len(self._inflight) > max_inflight:
+            op = self._wait_for_msg()
+            if op == MQTT_PUBACK:
+                stamp = self.get_monotonic_time()
+            elif op is None:
+                if self.get_monotonic_time() - stamp > self._recv_timeout:
+                    # Give up on the unacknowledged messages, so later publishes do
+                    # not wait for them again
+                    self._inflight = {}
+                    raise MMQTTException(
+                        f"No data received from broker for {self._recv_timeout} seconds."
+                    )
 
-        self.logger.debug(
-            "Sending PUBLISH\nTopic: %s\nMsg: %s\
-                            \nQoS: %d\nRetain? %r",
-            topic,
-            msg,
-            qos,
-            retain,
-        )
-        self._sock.send(pub_hdr_fixed)
-        self._sock.send(pub_hdr_var)
-        self._sock.send(msg)
-        self._last_msg_sent_timestamp = self.get_monotonic_time()
-        if qos == 0 and self.on_publish is not None:
-            self.on_publish(self, self.user_data, topic, self._pid)
-        if qos == 1:
-            stamp = self.get_monotonic_time()
-            while True:
-                op = self._wait_for_msg()
-                if op == 0x40:
-                    sz = self._sock_exact_recv(1)
-                    assert sz == b"\x02"
-                    rcv_pid_buf = self._sock_exact_recv(2)
-                    rcv_pid = rcv_pid_buf[0] << 0x08 | rcv_pid_buf[1]
-                    if self._pid == rcv_pid:
-                        if self.on_publish is not None:
-                            self.on_publish(self, self.user_data, topic, rcv_pid)
-                        return
-
-                if op is None:
-                    if self.get_monotonic_time() - stamp > self._recv_timeout:
-                        raise MMQTTException(
-                            f"No data received from broker for {self._recv_timeout} seconds."
-                        )
+    def _next_pid(self) -> int:
+        """Advances to the next packet identifier that is not in use."""
+        self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
+        while self._pid in self._inflight:
+            self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
+        return self._pid
 
     def subscribe(self, topic: Optional[Union[tuple, str, list]], qos: int = 0) -> None:
         """Subscribes to a topic on the MQTT Broker.
@@ -736,6 +974,44 @@ class MQTT:
 
         """
         self._connected()
+        topics = self._subscribe_topics(topic, qos)
+        # Assemble packet
+        self.logger.debug("Sending SUBSCRIBE to broker...")
+        packet = self._build_subscribe_packet(topics)
+        packet_id_bytes = self._pid.to_bytes(2, "big")
+        self._sock.send(packet)
+        stamp = self.get_monotonic_time()
+        self._last_msg_sent_timestamp = stamp
+        while True:
+            op = self._wait_for_msg()
+            if op is None:
+                if self.get_monotonic_time() - stamp > self._recv_timeout:
+                    raise MMQTTException(
+                        f"No data received from broker for {self._recv_timeout} seconds."
+                    )
+            else:
+                if op == 0x90:
+                    remaining_len = self._decode_remaining_length()
+                    assert remaining_len > 0
+                    rc = self._sock_exact_recv(2)
+                    # Check packet identifier.
+                    assert rc[0] == packet_id_bytes[0] and rc[1] == packet_id_bytes[1]
+                    rc = self._sock_exact_recv(remaining_len - 2)
+                    self._handle_suback(topics, rc)
+                    return
+
+                if op not in (MQTT_PUBLISH, MQTT_PUBACK):
+                    # [3.8.4] The Server is permitted to start sending PUBLISH packets
+                    # matching the Subscription before the Server sends the SUBACK Packet.
+                    # PUBACKs of pipelined QoS 1 messages can arrive at any time as well.
+                    raise MMQTTException(
+                        f"invalid message received as response to SUBSCRIBE: {hex(op)}"
+                    )
+
+    def _subscribe_topics(
+        self, topic: Optional[Union[tuple, str, list]], qos: int
+    ) -> List[Tuple[str, int]]:
+        """Validates the arguments of `subscribe()` and returns (topic, qos) pairs."""
         topics = None
         if isinstance(topic, tuple):
             topic, qos = topic
@@ -751,32 +1027,54 @@ class MQTT:
                 self._valid_qos(q)
                 self._valid_topic(t)
                 topics.append((t, q))
-        # Assemble packet
-        self.logger.debug("Sending SUBSCRIBE to broker...")
+        return topics
+
+    def _build_subscribe_packet(self, topics: List[Tuple[str, int]]) -> bytearray:
+        """Assembles a SUBSCRIBE packet [MQTT 3.8] with the next packet identifier."""
         fixed_header = bytearray([MQTT_SUB])
         packet_length = 2 + (2 * len(topics)) + (1 * len(topics))
         packet_length += sum(len(topic.encode("utf-8")) for topic, qos in topics)
         self._encode_remaining_length(fixed_header, remaining_length=packet_length)
         self.logger.debug(f"Fixed Header: {fixed_header}")
-        self._sock.send(fixed_header)
-        self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-        packet_id_bytes = self._pid.to_bytes(2, "big")
-        var_header = packet_id_bytes
+        var_header = self._next_pid().to_bytes(2, "big")
         self.logger.debug(f"Variable Header: {var_header}")
-        self._sock.send(var_header)
+        packet = fixed_header + var_header
         # attaching topic and QOS level to the packet
-        payload = bytes()
-        for t, q in topics:
-            topic_size = len(t.encode("utf-8")).to_bytes(2, "big")
-            qos_byte = q.to_bytes(1, "big")
-            payload += topic_size + t.encode() + qos_byte
         for t, q in topics:
             self.logger.debug(f"SUBSCRIBING to topic {t} with QoS {q}")
-        self.logger.debug(f"payload: {payload}")
-        self._sock.send(payload)
-        stamp = self.get_monotonic_time()
-        self._last_msg_sent_timestamp = stamp
+            self._append_str(packet, t)
+            packet.append(q)
+        return packet
+
+    def _handle_suback(self, topics: List[Tuple[str, int]], rc: bytearray) -> None:
+        """Processes the return codes of a SUBACK packet [MQTT 3.9]."""
+        for i, code in enumerate(rc):
+            if code not in [0, 1, 2]:
+                raise MMQTTException(
+                    f"SUBACK Failure for topic {topics[i][0]}: {hex(code)}"
+                )
+
+        for t, q in topics:
+            if self.on_subscribe is not None:
+                self.on_subscribe(self, self.user_data, t, q)
+            self._subscribed_topics.append(t)
+
+    def unsubscribe(self, topic: Optional[Union[str, list]]) -> None:
+        """Unsubscribes from a MQTT topic.
+
+        :param str|list topic: Unique MQTT topic identifier string or list.
+
+        """
+        topics = self._unsubscribe_topics(topic)
+        # Assemble packet
+        self.logger.debug("Sending UNSUBSCRIBE to broker...")
+        packet = self._build_unsubscribe_packet(topics)
+        packet_id_bytes = self._pid.to_bytes(2, "big")
+        self._sock.send(packet)
+        self._last_msg_sent_timestamp = self.get_monotonic_time()
+        self.logger.debug("Waiting for UNSUBACK...")
         while True:
+            stamp = self.get_monotonic_time()
             op = self._wait_for_msg()
             if op is None:
                 if self.get_monotonic_time() - stamp > self._recv_timeout:
@@ -784,39 +1082,21 @@ class MQTT:
                         f"No data received from broker for {self._recv_timeout} seconds."
                     )
             else:
-                if op == 0x90:
-                    remaining_len = self._decode_remaining_length()
-                    assert remaining_len > 0
-                    rc = self._sock_exact_recv(2)
-                    # Check packet identifier.
-                    assert rc[0] == var_header[0] and rc[1] == var_header[1]
-                    rc = self._sock_exact_recv(remaining_len - 2)
-                    for i in range(0, remaining_len - 2):
-                        if rc[i] not in [0, 1, 2]:
-                            raise MMQTTException(
-                                f"SUBACK Failure for topic {topics[i][0]}: {hex(rc[i])}"
-                            )
-
-                    for t, q in topics:
-                        if self.on_subscribe is not None:
-                            self.on_subscribe(self, self.user_data, t, q)
-                        self._subscribed_topics.append(t)
-
+                if op == 176:
+                    rc = self._sock_exact_recv(3)
+                    assert rc[0] == 0x02
+                    # [MQTT-3.32]
+                    assert rc[1] == packet_id_bytes[0] and rc[2] == packet_id_bytes[1]
+                    self._handle_unsuback(topics)
                     return
 
-                if op != MQTT_PUBLISH:
-                    # [3.8.4] The Server is permitted to start sending PUBLISH packets
-                    # matching the Subscription before the Server sends the SUBACK Packet.
+                if op != MQTT_PUBACK:
                     raise MMQTTException(
-                        f"invalid message received as response to SUBSCRIBE: {hex(op)}"
+                        f"invalid message received as response to UNSUBSCRIBE: {hex(op)}"
                     )
 
-    def unsubscribe(self, topic: Optional[Union[str, list]]) -> None:
-        """Unsubscribes from a MQTT topic.
-
-        :param str|list topic: Unique MQTT topic identifier string or list.
-
-        """
+    def _unsubscribe_topics(self, topic: Optional[Union[str, list]]) -> List[str]:
+        """Validates the argument of `unsubscribe()` and returns the list of topics."""
         topics = None
         if isinstance(topic, str):
             self._valid_topic(topic)
@@ -831,51 +1111,29 @@ class MQTT:
                 raise MMQTTException(
                     "Topic must be subscribed to before attempting unsubscribe."
                 )
-        # Assemble packet
-        self.logger.debug("Sending UNSUBSCRIBE to broker...")
+        return topics
+
+    def _build_unsubscribe_packet(self, topics: List[str]) -> bytearray:
+        """Assembles an UNSUBSCRIBE packet [MQTT 3.10] with the next packet identifier."""
         fixed_header = bytearray([MQTT_UNSUB])
         packet_length = 2 + (2 * len(topics))
         packet_length += sum(len(topic.encode("utf-8")) for topic in topics)
         self._encode_remaining_length(fixed_header, remaining_length=packet_length)
         self.logger.debug(f"Fixed Header: {fixed_header}")
-        self._sock.send(fixed_header)
-        self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-        packet_id_bytes = self._pid.to_bytes(2, "big")
-        var_header = packet_id_bytes
+        var_header = self._next_pid().to_bytes(2, "big")
         self.logger.debug(f"Variable Header: {var_header}")
-        self._sock.send(var_header)
-        payload = bytes()
-        for t in topics:
-            topic_size = len(t.encode("utf-8")).to_bytes(2, "big")
-            payload += topic_size + t.encode()
+        packet = fixed_header + var_header
         for t in topics:
             self.logger.debug(f"UNSUBSCRIBING from topic {t}")
-        self._sock.send(payload)
-        self._last_msg_sent_timestamp = self.get_monotonic_time()
-        self.logger.debug("Waiting for UNSUBACK...")
-        while True:
-            stamp = self.get_monotonic_time()
-            op = self._wait_for_msg()
-            if op is None:
-                if self.get_monotonic_time() - stamp > self._recv_timeout:
-                    raise MMQTTException(
-                        f"No data received from broker for {self._recv_timeout} seconds."
-                    )
-            else:
-                if op == 176:
-                    rc = self._sock_exact_recv(3)
-                    assert rc[0] == 0x02
-                    # [MQTT-3.32]
-                    assert rc[1] == packet_id_bytes[0] and rc[2] == packet_id_bytes[1]
-                    for t in topics:
-                        if self.on_unsubscribe is not None:
-                            self.on_unsubscribe(self, self.user_data, t, self._pid)
-                        self._subscribed_topics.remove(t)
-                    return
+            self._append_str(packet, t)
+        return packet
 
-                raise MMQTTException(
-                    f"invalid message received as response to UNSUBSCRIBE: {hex(op)}"
-                )
+    def _handle_unsuback(self, topics: List[str]) -> None:
+        """Processes an UNSUBACK packet [MQTT 3.11]."""
+        for t in topics:
+            if self.on_unsubscribe is not None:
+                self.on_unsubscribe(self, self.user_data, t, self._pid)
+            self._subscribed_topics.remove(t)
 
     def _recompute_reconnect_backoff(self) -> None:
         """
@@ -937,6 +1195,8 @@ class MQTT:
             while subscribed_topics:
                 feed = subscribed_topics.pop()
                 self.subscribe(feed)
+        if self._offline_queue:
+            self._replay_queued()
 
         return ret
 
@@ -979,6 +1239,9 @@ class MQTT:
             rc = self._wait_for_msg()
             if rc is not None:
                 rcs.append(rc)
+            if self._offline_queue:
+                self._replay_queued()
+                self._connected()
             if self.get_monotonic_time() - stamp > timeout:
                 self.logger.debug(f"Loop timed out after {timeout} seconds")
                 break
@@ -1020,42 +1283,69 @@ class MQTT:
                 raise MMQTTException(f"Unexpected PINGRESP returned from broker: {sz}.")
             return pkt_type
 
+        if pkt_type == MQTT_PUBACK:
+            puback = self._sock_exact_recv(3)
+            if puback[0] != 0x02:
+                raise MMQTTException(f"Unexpected PUBACK length: {puback[0]}")
+            self._handle_puback(puback[1] << 0x08 | puback[2])
+            return pkt_type
+
         if pkt_type != MQTT_PUBLISH:
             return pkt_type
 
         # Handle only the PUBLISH packet type from now on.
+        # The whole packet is received at once and decoded in place.
         sz = self._decode_remaining_length()
+        pid = self._handle_publish(res[0], self._recv_packet(sz))
+        if res[0] & 0x06 == 0x02:
+            pkt = bytearray(b"\x40\x02\0\0")
+            struct.pack_into("!H", pkt, 2, pid)
+            self._sock.send(pkt)
+        elif res[0] & 6 == 4:
+            assert 0
+
+        return pkt_type
+
+    def _handle_puback(self, pid: int) -> None:
+        """Processes the PUBACK of a QoS 1 message [MQTT 3.4]."""
+        topic = self._inflight.pop(pid, None)
+        self.logger.debug(f"Got PUBACK for packet {pid}")
+        if topic is not None and self.on_publish is not None:
+            self.on_publish(self, self.user_data, topic, pid)
+
+    def _handle_publish(
+        self, header: int, packet: Union[memoryview, bytearray]
+    ) -> int:
+        """Decodes a PUBLISH packet [MQTT 3.3] and passes the message to the callbacks.
+        Returns its packet identifier, 0 for QoS 0.
+
+        :param int header: First byte of the fixed header.
+        :param packet: The rest of the packet after the remaining length.
+        """
+        sz = len(packet)
         # topic length MSB & LSB
-        topic_len_buf = self._sock_exact_recv(2)
-        topic_len = int((topic_len_buf[0] << 8) | topic_len_buf[1])
+        topic_len = packet[0] << 8 | packet[1] if sz > 1 else 0
 
         if topic_len > sz - 2:
             raise MMQTTException(
                 f"Topic length {topic_len} in PUBLISH packet exceeds remaining length {sz} - 2"
             )
 
-        topic_buf = self._sock_exact_recv(topic_len)
-        topic = str(topic_buf, "utf-8")
-        sz -= topic_len + 2
+        topic = str(packet[2 : 2 + topic_len], "utf-8")
+        offset = topic_len + 2
         pid = 0
-        if res[0] & 0x06:
-            pid_buf = self._sock_exact_recv(2)
-            pid = pid_buf[0] << 0x08 | pid_buf[1]
-            sz -= 0x02
-
-        # read message contents
-        raw_msg = self._sock_exact_recv(sz)
-        msg = raw_msg if self._use_binary_mode else str(raw_msg, "utf-8")
-        self.logger.debug("Receiving PUBLISH \nTopic: %s\nMsg: %s\n", topic, raw_msg)
-        self._handle_on_message(topic, msg)
-        if res[0] & 0x06 == 0x02:
-            pkt = bytearray(b"\x40\x02\0\0")
-            struct.pack_into("!H", pkt, 2, pid)
-            self._sock.send(pkt)
-        elif res[0] & 6 == 4:
-            assert 0
+        if header & 0x06:
+            pid = packet[offset] << 0x08 | packet[offset + 1]
+            offset += 0x02
 
-        return pkt_type
+        # message contents, copied out before the buffer is reused
+        if self._use_binary_mode:
+            msg = bytearray(packet[offset:])
+        else:
+            msg = str(packet[offset:], "utf-8")
+        self.logger.debug("Receiving PUBLISH \nTopic: %s\nMsg: %s\n", topic, msg)
+        self._handle_on_message(topic, msg)
+        return pid
 
     def _decode_remaining_length(self) -> int:
         """Decode Remaining Length [2.2.3]"""
@@ -1064,7 +1354,10 @@ class MQTT:
         while True:
             if sh > 28:
                 raise MMQTTException("invalid remaining length encoding")
-            b = self._sock_exact_recv(1)[0]
+            if self._backwards_compatible_sock:
+                b = self._sock_exact_recv(1)[0]
+            else:
+                b = self._recv_buffer[self._fill_recv_buffer(1)]
             n |= (b & 0x7F) << sh
             if not b & 0x80:
                 return n
@@ -1089,9 +1382,18 @@ class MQTT:
         stamp = self.get_monotonic_time()
         if not self._backwards_compatible_sock:
             # CPython, socketpool, esp32spi, wiznet5k
+            if bufsize <= len(self._recv_buffer):
+                start = self._fill_recv_buffer(bufsize, timeout)
+                return self._recv_buffer[start : start + bufsize]
+
+            # Too large for the buffer, take what is buffered and receive the rest directly
             rc = bytearray(bufsize)
+            recv_len = self._recv_end - self._recv_start
+            rc[:recv_len] = self._recv_view[self._recv_start : self._recv_end]
+            self._recv_start = self._recv_end = 0
             mv = memoryview(rc)
-            recv_len = self._sock.recv_into(rc, bufsize)
+            if not recv_len:
+                recv_len = self._sock.recv_into(rc, bufsize)
             to_read = bufsize - recv_len
             if to_read < 0:
                 raise MMQTTException(f"negative number of bytes to read: {to_read}")
@@ -1127,18 +1429,70 @@ class MQTT:
                     )
         return rc
 
-    def _send_str(self, string: str) -> None:
-        """Encodes a string and sends it to a socket.
+    def _fill_recv_buffer(self, bufsize: int, timeout: Optional[float] = None) -> int:
+        """Makes sure at least ``bufsize`` bytes are in the receive buffer, consumes them
+        and returns the index they start at. The bytes stay valid until the next read.
 
-        :param str string: String to write to the socket.
+        Every read asks the socket for as much as fits into the buffer, so packets that
+        arrive together are received with a single call.
+
+        :param int bufsize: number of bytes to receive, at most the size of the buffer
+        :param float timeout: timeout, in seconds. Defaults to recv_timeout
+        :return: index of the first byte in the receive buffer
+        """
+        start = self._recv_start
+        if self._recv_end - start < bufsize:
+            buffer_size = len(self._recv_buffer)
+            if buffer_size - start < bufsize:
+                # Move the unconsumed bytes to the front to make room
+                self._recv_end -= start
+                self._recv_buffer[: self._recv_end] = self._recv_buffer[
+                    start : start + self._recv_end
+                ]
+                start = self._recv_start = 0
+
+            stamp = self.get_monotonic_time()
+            read_timeout = timeout if timeout is not None else self._recv_timeout
+            while True:
+                self._recv_end += self._sock.recv_into(
+                    self._recv_view[self._recv_end :], buffer_size - self._recv_end
+                )
+                if self._recv_end - start >= bufsize:
+                    break
+                if self.get_monotonic_time() - stamp > read_timeout:
+                    raise MMQTTException(
+                        f"Unable to receive {bufsize - self._recv_end + start} bytes "
+                        f"within {read_timeout} seconds."
+                    )
+
+        self._recv_start = start + bufsize
+        if self._recv_start == self._recv_end:
+            self._recv_start = self._recv_end = 0
+        return start
+
+    def _recv_packet(self, bufsize: int) -> Union[memoryview, bytearray]:
+        """Receives the rest of a packet. If it fits, it is returned as a view of the
+        receive buffer, which is only valid until the next read.
+
+        :param int bufsize: number of bytes to receive
+        """
+        if self._backwards_compatible_sock or bufsize > len(self._recv_buffer):
+            return self._sock_exact_recv(bufsize)
+        start = self._fill_recv_buffer(bufsize)
+        return self._recv_view[start : start + bufsize]
+
+    @staticmethod
+    def _append_str(packet: bytearray, string: Union[str, bytes]) -> None:
+        """Appends a length-prefixed string to a packet.
+
+        :param bytearray packet: Packet to append to.
+        :param str|bytes string: String to append.
 
         """
         if isinstance(string, str):
-            self._sock.send(struct.pack("!H", len(string.encode("utf-8"))))
-            self._sock.send(str.encode(string, "utf-8"))
-        else:
-            self._sock.send(struct.pack("!H", len(string)))
-            self._sock.send(string)
+            string = string.encode("utf-8")
+        packet.extend(struct.pack("!H", len(string)))
+        packet.extend(string)
 
     @staticmethod
     def _valid_topic(topic: str) -> None:
@@ -0,0 +1,654 @@
+# SPDX-FileCopyrightText: 2024 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_minimqtt.async_minimqtt`
+================================================================================
+
+MQTT client for ``asyncio``, built on the protocol code of
+`adafruit_minimqtt.adafruit_minimqtt.MQTT`.
+
+Incoming packets are read and dispatched to the callbacks by a reader task, outgoing
+packets are written by a writer task and keep alive pings are sent by a timer task, so
+other tasks keep running while the client waits for the network.
+
+Example::
+
+    mqtt = AsyncMQTT(broker="test.mosquitto.org")
+    mqtt.on_message = lambda client, topic, message: print(topic, message)
+
+    async def main():
+        await mqtt.connect()
+        await mqtt.subscribe("sensors/#")
+        while True:
+            await mqtt.publish("sensors/temperature", read_temperature(), qos=1)
+            await asyncio.sleep(10)
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* Adafruit's asyncio library:
+  https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+
+* Adafruit's Connection Manager library:
+  https://github.com/adafruit/Adafruit_CircuitPython_ConnectionManager
+
+"""
+import asyncio
+import errno
+import struct
+
+try:
+    from typing import Callable, Iterable, Optional, Tuple, Union
+except ImportError:
+    pass
+
+from .adafruit_minimqtt import (
+    MQTT,
+    MMQTTException,
+    MQTT_DISCONNECT,
+    MQTT_PINGREQ,
+    MQTT_PINGRESP,
+    MQTT_PKT_TYPE_MASK,
+    MQTT_PUBACK,
+    MQTT_PUBLISH,
+)
+
+__version__ = "7.9.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MiniMQTT.git"
+
+try:
+    from ssl import SSLWantReadError, SSLWantWriteError
+
+    # Raised by CPython's TLS sockets instead of EAGAIN
+    _WOULD_BLOCK = (SSLWantReadError, SSLWantWriteError)
+except ImportError:
+    _WOULD_BLOCK = ()
+
+_CONNACK = 0x20
+_SUBACK = 0x90
+_UNSUBACK = 0xB0
+
+
+class _QueueSocket:
+    """Stands in for the socket of `MQTT`, so its packet assembly code
+    hands the packets to the writer task instead of sending them."""
+
+    def __init__(self, client: "AsyncMQTT") -> None:
+        self._client = client
+
+    def send(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Queues a packet for the writer task."""
+        self._client._queue_packet(data)  # pylint: disable=protected-access
+
+
+class _SocketStream:
+    """Stream over a socket from a socket pool, which has ``recv_into`` and ``send``
+    where the ``asyncio`` streams expect ``readinto`` and ``write``. The socket must be
+    non-blocking.
+
+    With the ``asyncio`` library the socket is polled by its event loop, with the one
+    of CPython it is watched with ``add_reader()`` and ``add_writer()``."""
+
+    def __init__(self, sock) -> None:
+        self._sock = sock
+        self._out = b""
+        core = getattr(asyncio, "core", None)
+        self._io_queue = getattr(core, "_io_queue", None)
+
+    async def _wait(self, write: bool) -> None:
+        """Waits until the socket is readable, or writable."""
+        if self._io_queue is not None:
+            if write:
+                await self._io_queue.queue_write(self._sock)
+            else:
+                await self._io_queue.queue_read(self._sock)
+            return
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        fileno = self._sock.fileno()
+
+        def wake():
+            # The waiting task may have been cancelled already
+            if not ready.done():
+                ready.set_result(None)
+
+        if write:
+            loop.add_writer(fileno, wake)
+        else:
+            loop.add_reader(fileno, wake)
+        try:
+            await ready
+        finally:
+            if write:
+                loop.remove_writer(fileno)
+            else:
+                loop.remove_reader(fileno)
+
+    async def readinto(self, buffer: memoryview) -> int:
+        """Reads what is available into ``buffer``, waiting until something is."""
+        while True:
+            # TLS sockets can have data buffered before the socket is readable
+            try:
+                return self._sock.recv_into(buffer)
+            except OSError as error:
+                if error.errno != errno.EAGAIN and not isinstance(error, _WOULD_BLOCK):
+                    raise
+            await self._wait(False)
+
+    def write(self, data: Union[bytes, bytearray]) -> None:
+        """Buffers ``data`` until `drain()`."""
+        self._out += data
+
+    async def drain(self) -> None:
+        """Sends the buffered data."""
+        data, self._out = memoryview(self._out), b""
+        while data:
+            try:
+                data = data[self._sock.send(data) :]
+                continue
+            except OSError as error:
+                if error.errno != errno.EAGAIN and not isinstance(error, _WOULD_BLOCK):
+                    raise
+            await self._wait(True)
+
+    def close(self) -> None:
+        """The socket is closed by the connection manager."""
+
+
+class AsyncMQTT(MQTT):
+    """MQTT Client for ``asyncio``. Takes the same arguments as `MQTT`.
+
+    Without a ``socket_pool`` the connection is opened with ``asyncio.open_connection``,
+    which cannot use TLS. With one, the socket, TLS or not, is created by the connection
+    manager and used without blocking. This requires sockets that can be polled, like
+    the native ``socketpool`` sockets of CircuitPython 9, or CPython's sockets.
+
+    The blocking methods of `MQTT` are coroutines here. There is no need to call `loop()`,
+    incoming messages are passed to the callbacks as soon as they arrive.
+    """
+
+    # pylint: disable=invalid-overridden-method,too-many-instance-attributes
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        if self._offline_queue is not None:
+            raise MMQTTException("offline_queue is not supported by AsyncMQTT")
+        if self._is_ssl and self._socket_pool is None:
+            raise MMQTTException("TLS requires a socket_pool")
+        self._reader = None
+        self._writer = None
+        self._pool_socket = None
+        self._tasks = []
+        # Packets waiting for the writer task
+        self._out_queue = []
+        self._out_queue_size = 0
+        self._out_ready = asyncio.Event()
+        self._out_drained = asyncio.Event()
+        # Set whenever an acknowledgement arrives, waiters check whether it is theirs
+        self._acked = asyncio.Event()
+        # (packet type, packet identifier) -> contents of CONNACK, SUBACK, UNSUBACK, PINGRESP
+        self._acks = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback) -> None:
+        await self.deinit()
+
+    async def deinit(self) -> None:
+        """De-initializes the MQTT client and disconnects from the mqtt broker."""
+        await self.disconnect()
+
+    async def connect(
+        self,
+        clean_session: bool = True,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        keep_alive: Optional[int] = None,
+    ) -> int:
+        """Initiates connection with the MQTT Broker and starts the reader, writer and
+        keep alive tasks.
+
+        :param bool clean_session: Establishes a persistent session.
+        :param str host: Hostname or IP address of the remote broker.
+        :param int port: Network port of the remote broker.
+        :param int keep_alive: Maximum period allowed for communication, in seconds.
+
+        """
+        if host:
+            self.broker = host
+        if port:
+            self.port = port
+        if keep_alive:
+            self.keep_alive = keep_alive
+
+        self.logger.debug("Attempting to establish MQTT connection...")
+        self._reader, self._writer = await self._open_connection()
+        self._sock = _QueueSocket(self)
+        self._recv_start = self._recv_end = 0
+        self._send_len = 0
+        self._inflight = {}
+        self._acks = {}
+        self._out_queue = []
+        self._out_queue_size = 0
+        self._tasks = [
+            asyncio.create_task(self._write_loop()),
+            asyncio.create_task(self._read_loop()),
+        ]
+
+        try:
+            self.logger.debug("Sending CONNECT to broker...")
+            self._queue_packet(self._build_connect_packet(clean_session))
+            result = self._handle_connack(await self._wait_for_ack(_CONNACK))
+        except Exception:
+            await self._close()
+            raise
+
+        if self.keep_alive:
+            self._tasks.append(asyncio.create_task(self._keep_alive_loop()))
+        return result
+
+    async def _open_connection(self) -> Tuple:
+        if self._socket_pool is None:
+            return await asyncio.open_connection(self.broker, self.port)
+
+        self._pool_socket = self._connection_manager.get_socket(
+            self.broker,
+            self.port,
+            proto="mqtt:",
+            timeout=self._socket_timeout,
+            is_ssl=self._is_ssl,
+            ssl_context=self._ssl_context,
+        )
+        self._pool_socket.setblocking(False)
+        stream = _SocketStream(self._pool_socket)
+        return stream, stream
+
+    async def disconnect(self) -> None:
+        """Disconnects the MiniMQTT client from the MQTT broker."""
+        self._connected()
+        self.logger.debug("Sending DISCONNECT packet to broker")
+        self._queue_packet(MQTT_DISCONNECT)
+        await self._drain()
+        await self._close()
+        self._subscribed_topics = []
+        if self.on_disconnect is not None:
+            self.on_disconnect(self, self.user_data, 0)
+
+    async def reconnect(self, resub_topics: bool = True) -> int:
+        """Attempts to reconnect to the MQTT broker.
+
+        :param bool resub_topics: Whether to resubscribe to previously subscribed topics.
+
+        """
+        self.logger.debug("Attempting to reconnect with MQTT broker")
+        subscribed_topics = self._subscribed_topics.copy()
+        if self.is_connected():
+            await self._close()
+        ret = await self.connect()
+        self.logger.debug("Reconnected with broker")
+        self._subscribed_topics = []
+        if resub_topics:
+            while subscribed_topics:
+                await self.subscribe(subscribed_topics.pop())
+        return ret
+
+    async def _close(self) -> None:
+        """Stops the tasks and closes the connection."""
+        self._is_connected = False
+        self._sock = None
+        # Wake everything that waits for the broker, so it can notice
+        self._acked.set()
+        self._out_drained.set()
+
+        current_task = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current_task:
+                task.cancel()
+        self._tasks = []
+
+        if self._pool_socket is not None:
+            self._connection_manager.close_socket(self._pool_socket)
+            self._pool_socket = None
+        elif self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+
+    async def _connection_lost(self, error: Exception) -> None:
+        if self._sock is None:
+            return
+        self.logger.warning(f"Connection to broker lost: {error!r}")
+        await self._close()
+        if self.on_disconnect is not None:
+            self.on_disconnect(self, self.user_data, 1)
+
+    async def ping(self) -> None:
+        """Pings the MQTT Broker and waits for its response."""
+        self._connected()
+        self.logger.debug("Sending PINGREQ")
+        self._acks.pop((MQTT_PINGRESP, 0), None)
+        self._queue_packet(MQTT_PINGREQ)
+        await self._wait_for_ack(MQTT_PINGRESP)
+
+    async def loop(self, timeout: float = 0) -> None:
+        """Messages are dispatched by the reader task, this only waits for ``timeout``
+        seconds. Kept so code written for `MQTT` keeps working.
+
+        :param float timeout: time to wait, in seconds.
+
+        """
+        self._connected()
+        await asyncio.sleep(timeout)
+
+    async def publish(
+        self,
+        topic: str,
+        msg: Union[str, int, float, bytes],
+        retain: bool = False,
+        qos: int = 0,
+    ) -> None:
+        """Publishes a message to a topic provided. For QoS 1, returns once the broker has
+        acknowledged the message. Up to ``max_inflight`` QoS 1 messages published by
+        different tasks are sent without waiting for each other's PUBACK.
+
+        :param str topic: Unique topic identifier.
+        :param str|int|float|bytes msg: Data to send to the broker.
+        :param bool retain: Whether the message is saved by the broker.
+        :param int qos: Quality of Service level for the message, defaults to zero.
+
+        """
+        self._connected()
+        topic_bytes, msg = self._prepare_publish(topic, msg, qos)
+        self.logger.debug(
+            "Sending PUBLISH\nTopic: %s\nMsg: %s\nQoS: %d\nRetain? %r",
+            topic,
+            msg,
+            qos,
+            retain,
+        )
+        if qos == 1:
+            await self._wait_for_inflight(self._max_inflight - 1)
+        self._write_publish(topic_bytes, msg, retain, qos)
+        self._flush_send_buffer()
+        if qos == 0:
+            if self.on_publish is not None:
+                self.on_publish(self, self.user_data, topic, self._pid)
+            await self._throttle()
+            return
+
+        pid = self._pid
+        self._inflight[pid] = topic
+        try:
+            await self._wait_until(lambda: pid not in self._inflight)
+        except MMQTTException:
+            # Give up on the message, so later publishes do not wait for it
+            self._inflight.pop(pid, None)
+            raise
+
+    async def publish_many(
+        self,
+        messages: Iterable[Tuple[str, Union[str, int, float, bytes]]],
+        retain: bool = False,
+        qos: int = 0,
+    ) -> None:
+        """Publishes several messages, coalescing as many packets into each socket write as
+        fit into the send buffer. For QoS 1, returns once all of them are acknowledged.
+
+        :param messages: (topic, message) pairs to publish, as accepted by `publish()`.
+        :param bool retain: Whether the messages are saved by the broker.
+        :param int qos: Quality of Service level for the messages, defaults to zero.
+
+        """
+        self._connected()
+        published = []
+        for topic, msg in messages:
+            topic_bytes, msg = self._prepare_publish(topic, msg, qos)
+            if qos == 1 and len(self._inflight) >= self._max_inflight:
+                self._flush_send_buffer()
+                await self._wait_for_inflight(self._max_inflight - 1)
+            self._write_publish(topic_bytes, msg, retain, qos)
+            if qos == 1:
+                self._inflight[self._pid] = topic
+            elif self.on_publish is not None:
+                published.append((topic, self._pid))
+        self._flush_send_buffer()
+
+        for topic, pid in published:
+            self.on_publish(self, self.user_data, topic, pid)
+        if qos == 1:
+            await self._wait_for_inflight(0)
+        else:
+            await self._throttle()
+
+    async def wait_for_publishes(self) -> None:
+        """Waits until the broker has acknowledged every QoS 1 message sent so far."""
+        self._connected()
+        await self._wait_for_inflight(0)
+
+    async def subscribe(
+        self, topic: Optional[Union[tuple, str, list]], qos: int = 0
+    ) -> None:
+        """Subscribes to a topic on the MQTT Broker, see `MQTT.subscribe()`.
+
+        :param str|tuple|list topic: Topic, (topic, qos) tuple or list of such tuples.
+        :param int qos: Quality of Service level for the topic, defaults to zero.
+
+        """
+        self._connected()
+        topics = self._subscribe_topics(topic, qos)
+        self.logger.debug("Sending SUBSCRIBE to broker...")
+        self._queue_packet(self._build_subscribe_packet(topics))
+        self._handle_suback(topics, await self._wait_for_ack(_SUBACK, self._pid))
+
+    async def unsubscribe(self, topic: Optional[Union[str, list]]) -> None:
+        """Unsubscribes from a MQTT topic.
+
+        :param str|list topic: Unique MQTT topic identifier string or list.
+
+        """
+        self._connected()
+        topics = self._unsubscribe_topics(topic)
+        self.logger.debug("Sending UNSUBSCRIBE to broker...")
+        self._queue_packet(self._build_unsubscribe_packet(topics))
+        await self._wait_for_ack(_UNSUBACK, self._pid)
+        self._handle_unsuback(topics)
+
+    async def _wait_for_inflight(self, max_inflight: int) -> None:
+        try:
+            await self._wait_until(lambda: len(self._inflight) <= max_inflight)
+        except MMQTTException:
+            # Give up on the unacknowledged messages, as `MQTT` does
+            self._inflight = {}
+            raise
+
+    async def _wait_for_ack(self, packet_type: int, pid: int = 0):
+        key = (packet_type, pid)
+        await self._wait_until(lambda: key in self._acks)
+        return self._acks.pop(key)
+
+    async def _wait_until(self, condition: Callable[[], bool]) -> None:
+        """Waits for acknowledgements from the broker until ``condition`` is met."""
+        while not condition():
+            if self._sock is None:
+                raise MMQTTException("Connection to broker lost")
+            self._acked.clear()
+            try:
+                await asyncio.wait_for(self._acked.wait(), self._recv_timeout)
+            except asyncio.TimeoutError:
+                raise MMQTTException(  # pylint: disable=raise-missing-from
+                    f"No data received from broker for {self._recv_timeout} seconds."
+                )
+
+    # Writing
+
+    def _queue_packet(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        # The send buffer is reused right away, so the data is copied
+        self._out_queue.append(bytes(data))
+        self._out_queue_size += len(data)
+        self._out_ready.set()
+        self._last_msg_sent_timestamp = self.get_monotonic_time()
+
+    async def _drain(self) -> None:
+        """Waits until the writer task has written every queued packet."""
+        while self._out_queue and self._sock is not None:
+            self._out_drained.clear()
+            await self._out_drained.wait()
+
+    async def _throttle(self) -> None:
+        """Keeps publishers from queueing packets faster than they can be written."""
+        if self._out_queue_size > len(self._send_buffer):
+            await self._drain()
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                await self._out_ready.wait()
+                self._out_ready.clear()
+                while self._out_queue:
+                    queue, self._out_queue = self._out_queue, []
+                    self._out_queue_size = 0
+                    self._writer.write(queue[0] if len(queue) == 1 else b"".join(queue))
+                    await self._writer.drain()
+                self._out_drained.set()
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            await self._connection_lost(error)
+
+    # Reading
+
+    def _take(self, bufsize: int) -> Optional[int]:
+        """Consumes ``bufsize`` bytes of the receive buffer and returns the index they
+        start at, or returns None if fewer are buffered."""
+        start = self._recv_start
+        if self._recv_end - start < bufsize:
+            return None
+        self._recv_start = start + bufsize
+        if self._recv_start == self._recv_end:
+            self._recv_start = self._recv_end = 0
+        return start
+
+    async def _read_some(self, buffer: memoryview) -> int:
+        """Reads what the stream has available into ``buffer``."""
+        while True:
+            if hasattr(self._reader, "readinto"):
+                length = await self._reader.readinto(buffer)
+                if length is None:  # Nothing available after all
+                    continue
+            else:
+                data = await self._reader.read(len(buffer))
+                length = len(data)
+                buffer[:length] = data
+            if not length:
+                raise MMQTTException("Connection closed by broker")
+            return length
+
+    async def _fill(self, bufsize: int) -> int:
+        """Async version of `MQTT._fill_recv_buffer()`."""
+        start = self._take(bufsize)
+        if start is not None:
+            return start
+
+        start = self._recv_start
+        if len(self._recv_buffer) - start < bufsize:
+            # Move the unconsumed bytes to the front to make room
+            self._recv_end -= start
+            self._recv_buffer[: self._recv_end] = self._recv_buffer[
+                start : start + self._recv_end
+            ]
+            self._recv_start = 0
+        while self._recv_end - self._recv_start < bufsize:
+            self._recv_end += await self._read_some(self._recv_view[self._recv_end :])
+        return self._take(bufsize)
+
+    async def _read_packet(self, bufsize: int) -> Union[memoryview, bytearray]:
+        """Async version of `MQTT._recv_packet()`."""
+        if bufsize <= len(self._recv_buffer):
+            start = await self._fill(bufsize)
+            return self._recv_view[start : start + bufsize]
+
+        packet = bytearray(bufsize)
+        received = self._recv_end - self._recv_start
+        packet[:received] = self._recv_view[self._recv_start : self._recv_end]
+        self._recv_start = self._recv_end = 0
+        view = memoryview(packet)
+        while received < bufsize:
+            received += await self._read_some(view[received:])
+        return packet
+
+    async def _read_loop(self) -> None:
+        buffer = self._recv_buffer
+        try:
+            while True:
+                start = self._take(1)
+                header = buffer[start if start is not None else await self._fill(1)]
+
+                # Decode Remaining Length [2.2.3]
+                remaining_length = 0
+                shift = 0
+                while True:
+                    if shift > 21:
+                        raise MMQTTException("invalid remaining length encoding")
+                    start = self._take(1)
+                    byte = buffer[start if start is not None else await self._fill(1)]
+                    remaining_length |= (byte & 0x7F) << shift
+                    if not byte & 0x80:
+                        break
+                    shift += 7
+
+                self._handle_packet(header, await self._read_packet(remaining_length))
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            await self._connection_lost(error)
+
+    def _handle_packet(self, header: int, packet: Union[memoryview, bytearray]) -> None:
+        pkt_type = header & MQTT_PKT_TYPE_MASK
+        self.logger.debug(f"Got message type: {hex(pkt_type)} pkt: {hex(header)}")
+        if pkt_type == MQTT_PUBLISH:
+            pid = self._handle_publish(header, packet)
+            if header & 0x06 == 0x02:
+                self._queue_packet(struct.pack("!BBH", MQTT_PUBACK, 2, pid))
+            return
+
+        if pkt_type == MQTT_PUBACK:
+            self._handle_puback(packet[0] << 8 | packet[1])
+        elif pkt_type in (_SUBACK, _UNSUBACK):
+            self._acks[(pkt_type, packet[0] << 8 | packet[1])] = bytes(packet[2:])
+        elif pkt_type == _CONNACK:
+            # Laid out as MQTT._handle_connack() expects it, with the length first
+            self._acks[(pkt_type, 0)] = bytes((len(packet),)) + bytes(packet)
+        elif pkt_type == MQTT_PINGRESP:
+            self._acks[(pkt_type, 0)] = None
+        else:
+            return
+        self._acked.set()
+
+    # Keep alive
+
+    async def _keep_alive_loop(self) -> None:
+        try:
+            while True:
+                idle = self.get_monotonic_time() - self._last_msg_sent_timestamp
+                if idle < self.keep_alive:
+                    await asyncio.sleep(self.keep_alive - idle)
+                    continue
+                self.logger.debug(
+                    "KeepAlive period elapsed - requesting a PINGRESP from the server..."
+                )
+                await self.ping()
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            await self._connection_lost(error)
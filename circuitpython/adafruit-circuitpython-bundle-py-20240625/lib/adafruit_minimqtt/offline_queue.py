@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: 2024 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_minimqtt.offline_queue`
+================================================================================
+
+Keeps messages published while the broker is unreachable, so
+`adafruit_minimqtt.adafruit_minimqtt.MQTT` can send them once it is connected again.
+
+Messages are kept in RAM. When the RAM queue is full, they are appended to a ring
+file of fixed size, which survives a reset. Writing to flash on CircuitPython
+requires the filesystem to be remounted writable, see ``storage.remount()``.
+
+Example::
+
+    queue = OfflineQueue(max_messages=16, filename="/mqtt_queue.bin")
+    mqtt = MQTT(broker="broker.local", socket_pool=pool, offline_queue=queue)
+
+"""
+import struct
+
+try:
+    from typing import Optional, Tuple
+except ImportError:
+    pass
+
+__version__ = "7.9.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MiniMQTT.git"
+
+_MAGIC = b"MQQ\x01"
+# magic, capacity, start, used, count
+_FILE_HEADER = "<4sIIII"
+# flags (retain | qos << 1), topic length, message length
+_RECORD_HEADER = "<BHI"
+
+
+class _RingFile:
+    """Records stored back to back in the data area of a file of fixed size,
+    wrapping around at its end. The header is rewritten after every change."""
+
+    def __init__(self, filename: str, file_size: int) -> None:
+        self._header_size = struct.calcsize(_FILE_HEADER)
+        self._record_header_size = struct.calcsize(_RECORD_HEADER)
+        self.capacity = file_size - self._header_size
+        if self.capacity <= self._record_header_size:
+            raise ValueError("file_size is too small")
+        self.start = 0
+        self.used = 0
+        self.count = 0
+        self._next_size = 0
+
+        try:
+            self._file = open(filename, "r+b")  # pylint: disable=consider-using-with
+            header = self._file.read(self._header_size)
+            if len(header) == self._header_size:
+                magic, capacity, start, used, count = struct.unpack(
+                    _FILE_HEADER, header
+                )
+                if magic == _MAGIC and capacity == self.capacity and used <= capacity:
+                    self.start, self.used, self.count = start, used, count
+                    return
+            self._file.close()
+        except OSError:
+            pass
+
+        # Allocate the whole file up front, so running out of space shows right away
+        self._file = open(filename, "w+b")  # pylint: disable=consider-using-with
+        self._write_header()
+        zeros = bytes(min(self.capacity, 512))
+        remaining = self.capacity
+        while remaining > 0:
+            self._file.write(zeros[:remaining])
+            remaining -= len(zeros)
+        self._file.flush()
+
+    def _write_header(self) -> None:
+        self._file.seek(0)
+        self._file.write(
+            struct.pack(
+                _FILE_HEADER, _MAGIC, self.capacity, self.start, self.used, self.count
+            )
+        )
+        self._file.flush()
+
+    def _write_at(self, position: int, data: bytes) -> int:
+        position %= self.capacity
+        first = min(len(data), self.capacity - position)
+        self._file.seek(self._header_size + position)
+        self._file.write(memoryview(data)[:first])
+        if first < len(data):
+            self._file.seek(self._header_size)
+            self._file.write(memoryview(data)[first:])
+        return position + len(data)
+
+    def _read_at(self, position: int, size: int) -> bytes:
+        position %= self.capacity
+        first = min(size, self.capacity - position)
+        self._file.seek(self._header_size + position)
+        data = self._file.read(first)
+        if first < size:
+            self._file.seek(self._header_size)
+            data += self._file.read(size - first)
+        return data
+
+    def append(self, topic: bytes, msg: bytes, flags: int) -> bool:
+        """Appends a record, returns False if it does not fit."""
+        size = self._record_header_size + len(topic) + len(msg)
+        if self.used + size > self.capacity:
+            return False
+        position = self._write_at(
+            self.start + self.used,
+            struct.pack(_RECORD_HEADER, flags, len(topic), len(msg)),
+        )
+        position = self._write_at(position, topic)
+        self._write_at(position, msg)
+        self.used += size
+        self.count += 1
+        self._write_header()
+        return True
+
+    def peek(self) -> Tuple[bytes, bytes, int]:
+        """Reads the oldest record."""
+        flags, topic_length, msg_length = struct.unpack(
+            _RECORD_HEADER, self._read_at(self.start, self._record_header_size)
+        )
+        position = self.start + self._record_header_size
+        topic = self._read_at(position, topic_length)
+        msg = self._read_at(position + topic_length, msg_length)
+        self._next_size = self._record_header_size + topic_length + msg_length
+        return topic, msg, flags
+
+    def pop(self) -> None:
+        """Removes the oldest record."""
+        if not self._next_size:
+            self.peek()
+        self.start = (self.start + self._next_size) % self.capacity
+        self.used -= self._next_size
+        self.count -= 1
+        self._next_size = 0
+        if not self.count:
+            self.start = self.used = 0
+        self._write_header()
+
+    def clear(self) -> None:
+        """Removes every record."""
+        self.start = self.used = self.count = self._next_size = 0
+        self._write_header()
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
+
+
+class OfflineQueue:
+    """Bounded queue of messages waiting to be published.
+
+    Messages stay in order: once messages had to be written to the file, new ones go to
+    the file too until it is empty again. When both are full, new messages are dropped.
+
+    :param int max_messages: how many messages are kept in RAM.
+    :param str filename: path of the ring file messages spill to when the RAM queue is
+        full, or None to only use RAM. An existing queue file is resumed.
+    :param int file_size: size of the ring file, in bytes.
+    :param float replay_rate: how many queued messages per second are published once
+        connected again, or 0 for no limit.
+
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 32,
+        filename: Optional[str] = None,
+        file_size: int = 16384,
+        replay_rate: float = 10,
+    ) -> None:
+        if max_messages < 0:
+            raise ValueError("max_messages must not be negative")
+        self._max_messages = max_messages
+        self._messages = []
+        self._file = _RingFile(filename, file_size) if filename else None
+        self.replay_rate = replay_rate
+        self._allowance = 1.0
+        self._allowance_stamp = None
+
+        self.queued = 0
+        """Number of messages added to the queue."""
+        self.dropped = 0
+        """Number of messages dropped because the queue was full."""
+        self.replayed = 0
+        """Number of queued messages published."""
+
+    def __len__(self) -> int:
+        return len(self._messages) + (self._file.count if self._file else 0)
+
+    def put(self, topic: bytes, msg: bytes, retain: bool = False, qos: int = 0) -> bool:
+        """Adds a message to the end of the queue. Returns False if it was dropped.
+
+        :param bytes topic: Encoded topic.
+        :param bytes msg: Encoded message.
+        :param bool retain: Whether the message is saved by the broker.
+        :param int qos: Quality of Service level for the message.
+
+        """
+        flags = retain | qos << 1
+        spilled = self._file is not None and self._file.count
+        if not spilled and len(self._messages) < self._max_messages:
+            self._messages.append((topic, msg, flags))
+        elif self._file is None or not self._append_to_file(topic, msg, flags):
+            self.dropped += 1
+            return False
+        self.queued += 1
+        return True
+
+    def _append_to_file(self, topic: bytes, msg: bytes, flags: int) -> bool:
+        try:
+            return self._file.append(topic, msg, flags)
+        except OSError:
+            # Read-only or full filesystem
+            return False
+
+    def peek(self) -> Optional[Tuple[bytes, bytes, bool, int]]:
+        """Returns the oldest message as (topic, message, retain, qos), or None if the
+        queue is empty."""
+        if self._messages:
+            topic, msg, flags = self._messages[0]
+        elif self._file is not None and self._file.count:
+            topic, msg, flags = self._file.peek()
+        else:
+            return None
+        return topic, msg, bool(flags & 1), flags >> 1
+
+    def pop(self) -> None:
+        """Removes the oldest message, after it was published."""
+        if self._messages:
+            self._messages.pop(0)
+        elif self._file is not None and self._file.count:
+            self._file.pop()
+        else:
+            return
+        self.replayed += 1
+        self._allowance = max(self._allowance - 1, 0)
+
+    def clear(self) -> None:
+        """Removes every queued message."""
+        self._messages = []
+        if self._file is not None:
+            self._file.clear()
+
+    def replay_allowance(self, now: float) -> int:
+        """Returns how many messages may be published now without exceeding
+        ``replay_rate``. Unused allowance accumulates for up to a second.
+
+        :param float now: current monotonic time, in seconds.
+
+        """
+        if not self.replay_rate:
+            return len(self)
+        if self._allowance_stamp is not None:
+            self._allowance = min(
+                self._allowance + (now - self._allowance_stamp) * self.replay_rate,
+                max(self.replay_rate, 1),
+            )
+        self._allowance_stamp = now
+        return int(self._allowance)
+
+    def deinit(self) -> None:
+        """Closes the queue file. Messages in RAM are lost."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
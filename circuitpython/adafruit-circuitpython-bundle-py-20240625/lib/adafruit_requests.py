@@ -50,7 +50,7 @@ SEEK_END = 2
 
 if not sys.implementation.name == "circuitpython":
     from types import TracebackType
-    from typing import IO, Any, Dict, Optional, Type
+    from typing import IO, Any, Dict, Optional, Tuple, Type
 
     from circuitpython_typing.socket import (
         SocketpoolModuleType,
@@ -95,18 +95,29 @@ class Response:
         self._cached = None
         self._headers = {}
 
-        # _start_index and _receive_buffer are used when parsing headers.
-        # _receive_buffer will grow by 32 bytes everytime it is too small.
+        # Buffered bytes are _receive_buffer[_start:_received_length]. Consumed
+        # bytes are only reclaimed when the buffer fills, and the buffer doubles
+        # in size, up to the session's max_receive_buffer_size, when the data
+        # being looked at fills it completely.
+        self._start = 0
         self._received_length = 0
-        self._receive_buffer = bytearray(32)
+        self._receive_buffer = bytearray(64)
+        self._max_receive_buffer_size = (
+            session._max_receive_buffer_size  # pylint: disable=protected-access
+            if session
+            else None
+        )
         self._remaining = None
         self._chunked = False
 
-        http = self._readto(b" ")
-        if not http:
+        start, end = self._readto_range(b" ")
+        if start == end:
             session._connection_manager.close_socket(self.socket)
             raise RuntimeError("Unable to read HTTP response.")
-        self.status_code: int = int(bytes(self._readto(b" ")))
+        start, end = self._readto_range(b" ")
+        self.status_code: int = int(
+            str(memoryview(self._receive_buffer)[start:end], "utf-8")
+        )
         """The status code returned by the server"""
         self.reason: bytearray = self._readto(b"\r\n")
         """The status reason returned by the server"""
@@ -128,52 +139,73 @@ class Response:
     def _recv_into(self, buf: bytearray, size: int = 0) -> int:
         return self.socket.recv_into(buf, size)
 
-    def _readto(self, stop: bytes) -> bytearray:
+    def _readto_range(self, stop: bytes) -> Tuple[int, int]:
+        """Buffer bytes until stop is found and consume them. Returns the start and
+        end index in _receive_buffer of the data up to but not including stop. The
+        range is only valid until the next read from the response."""
         buf = self._receive_buffer
+        start = self._start
         end = self._received_length
+        search = start
         while True:
-            i = buf.find(stop, 0, end)
+            i = buf.find(stop, search, end)
             if i >= 0:
-                # Stop was found. Return everything up to but not including stop.
-                result = buf[:i]
-                new_start = i + len(stop)
-                # Remove everything up to and including stop from the buffer.
-                new_end = end - new_start
-                buf[:new_end] = buf[new_start:end]
-                self._received_length = new_end
-                return result
+                # Stop was found. Everything up to and including it is consumed.
+                self._start = i + len(stop)
+                if self._start == end:
+                    self._start = self._received_length = 0
+                return start, i
+            # Only the tail of the data could hold the start of a split stop.
+            search = max(start, end - len(stop) + 1)
 
             # Not found so load more bytes.
-            # If our buffer is full, then make it bigger to load more.
+            # If our buffer is full, reclaim the consumed front or make it bigger.
             if end == len(buf):
-                new_buf = bytearray(len(buf) + 32)
-                new_buf[: len(buf)] = buf
-                buf = new_buf
-                self._receive_buffer = buf
+                if start > 0:
+                    buf[: end - start] = buf[start:end]
+                    end -= start
+                    search -= start
+                    start = 0
+                else:
+                    new_size = len(buf) * 2
+                    if self._max_receive_buffer_size:
+                        new_size = min(new_size, self._max_receive_buffer_size)
+                    if new_size <= len(buf):
+                        raise ValueError(
+                            "Response line exceeds max_receive_buffer_size"
+                        )
+                    new_buf = bytearray(new_size)
+                    new_buf[:end] = buf[:end]
+                    buf = new_buf
+                    self._receive_buffer = buf
+                self._start = start
+                self._received_length = end
 
             read = self._recv_into(memoryview(buf)[end:])
             if read == 0:
-                self._received_length = 0
-                return buf[:end]
+                self._start = self._received_length = 0
+                return start, end
             end += read
+            self._received_length = end
+
+    def _readto(self, stop: bytes) -> bytearray:
+        start, end = self._readto_range(stop)
+        return self._receive_buffer[start:end]
 
     def _read_from_buffer(
         self, buf: Optional[bytearray] = None, nbytes: Optional[int] = None
     ) -> int:
-        if self._received_length == 0:
+        start = self._start
+        read = self._received_length - start
+        if read == 0:
             return 0
-        read = self._received_length
         if nbytes < read:
             read = nbytes
-        membuf = memoryview(self._receive_buffer)
         if buf:
-            buf[:read] = membuf[:read]
-        if read < self._received_length:
-            new_end = self._received_length - read
-            self._receive_buffer[:new_end] = membuf[read : self._received_length]
-            self._received_length = new_end
-        else:
-            self._received_length = 0
+            buf[:read] = memoryview(self._receive_buffer)[start : start + read]
+        self._start += read
+        if self._start == self._received_length:
+            self._start = self._received_length = 0
         return read
 
     def _readinto(self, buf: bytearray) -> int:
@@ -188,8 +220,13 @@ class Response:
                 # Consume trailing \r\n for chunks 2+
                 if self._remaining == 0:
                     self._throw_away(2)
-                chunk_header = bytes(self._readto(b"\r\n")).split(b";", 1)[0]
-                http_chunk_size = int(bytes(chunk_header), 16)
+                start, end = self._readto_range(b"\r\n")
+                extension = self._receive_buffer.find(b";", start, end)
+                if extension >= 0:
+                    end = extension
+                http_chunk_size = int(
+                    str(memoryview(self._receive_buffer)[start:end], "utf-8"), 16
+                )
                 if http_chunk_size == 0:
                     self._chunked = False
                     self._parse_headers()
@@ -248,14 +285,17 @@ class Response:
         Expects first line of HTTP request/response to have been read already.
         """
         while True:
-            header = self._readto(b"\r\n")
-            if not header:
+            start, end = self._readto_range(b"\r\n")
+            if start == end:
                 break
-            title, content = bytes(header).split(b": ", 1)
+            separator = self._receive_buffer.find(b": ", start, end)
+            if separator < 0:
+                raise ValueError("Malformed header")
+            header = memoryview(self._receive_buffer)
+            # enforce that all headers are lowercase
+            title = str(header[start:separator], "utf-8").lower()
+            content = str(header[separator + 2 : end], "utf-8")
             if title and content:
-                # enforce that all headers are lowercase
-                title = str(title, "utf-8").lower()
-                content = str(content, "utf-8")
                 if title == "content-length":
                     self._remaining = int(content)
                 if title == "transfer-encoding":
@@ -354,10 +394,14 @@ class Session:
         socket_pool: SocketpoolModuleType,
         ssl_context: Optional[SSLContextType] = None,
         session_id: Optional[str] = None,
+        max_receive_buffer_size: Optional[int] = None,
     ) -> None:
         self._connection_manager = get_connection_manager(socket_pool)
         self._ssl_context = ssl_context
         self._session_id = session_id
+        # Largest the buffer holding a response's status line, headers and chunk
+        # headers may grow to. None means no limit.
+        self._max_receive_buffer_size = max_receive_buffer_size
         self._last_response = None
 
     def _build_boundary_data(self, files: dict):  # pylint: disable=too-many-locals
@@ -79,6 +79,35 @@ def image_to_data(image: Image) -> Any:
     return numpy.dstack(((color >> 8) & 0xFF, color & 0xFF)).flatten().tolist()
 
 
+_TABLES_565 = None  # type: Optional[Tuple[bytes, bytes, bytes, bytes]]
+
+
+def _pixels_to_565(data: bytes, channels: int) -> bytearray:
+    """Convert 8-bit RGB or RGBA pixels, as returned by ``Image.tobytes()``, to
+    16-bit 565 RGB bytes."""
+    global _TABLES_565  # pylint: disable=global-statement
+    if _TABLES_565 is None:
+        _TABLES_565 = (
+            bytes(value & 0xF8 for value in range(256)),
+            bytes(value >> 5 for value in range(256)),
+            bytes((value & 0x1C) << 3 for value in range(256)),
+            bytes(value >> 3 for value in range(256)),
+        )
+    red_high, green_high, green_low, blue_low = _TABLES_565
+    green = data[1::channels]
+    count = len(green)
+    # Each byte of both sums is at most 0xFF, so adding the bytes of all pixels as
+    # one big integer never carries from one pixel into the next
+    high = int.from_bytes(data[0::channels].translate(red_high), "big")
+    high += int.from_bytes(green.translate(green_high), "big")
+    low = int.from_bytes(green.translate(green_low), "big")
+    low += int.from_bytes(data[2::channels].translate(blue_low), "big")
+    pixels = bytearray(2 * count)
+    pixels[0::2] = high.to_bytes(count, "big")
+    pixels[1::2] = low.to_bytes(count, "big")
+    return pixels
+
+
 class DummyPin:
     """Can be used in place of a ``DigitalInOut()`` when you don't want to skip it."""
 
@@ -141,6 +170,8 @@ class Display:  # pylint: disable-msg=no-member
         if rotation not in (0, 90, 180, 270):
             raise ValueError("Rotation must be 0/90/180/270")
         self._rotation = rotation
+        # The last image passed to image() with cache=True: (image, rotation, rotated)
+        self._rotated_image = None  # type: Optional[Tuple[Image, int, Image]]
         self.init()
 
     def write(
@@ -200,16 +231,28 @@ class Display:  # pylint: disable-msg=no-member
             self._block(x, y, x, y, self._encode_pixel(color))
         return None
 
+    # pylint: disable-msg=too-many-arguments
     def image(
         self,
         img: Image,
         rotation: Optional[int] = None,
         x: int = 0,
         y: int = 0,
+        *,
+        band_height: Optional[int] = None,
+        cache: bool = False
     ) -> None:
         """Set buffer to value of Python Imaging Library image. The image should
-        be in 1 bit mode and a size not exceeding the display size when drawn at
-        the supplied origin."""
+        be in RGB or RGBA mode and a size not exceeding the display size when drawn
+        at the supplied origin.
+
+        The image is converted and sent in bands of ``band_height`` rows, so only one
+        band is held in memory at a time. By default a band holds as many pixels as
+        the buffer used by `fill_rectangle`, a whole 320x240 frame on CPython.
+
+        With ``cache`` set, the rotated copy of the image is kept and reused when the
+        same image is shown again with the same rotation. Only set it for images that
+        are not drawn on in between."""
         if rotation is None:
             rotation = self.rotation
         if not img.mode in ("RGB", "RGBA"):
@@ -217,7 +260,13 @@ class Display:  # pylint: disable-msg=no-member
         if rotation not in (0, 90, 180, 270):
             raise ValueError("Rotation must be 0/90/180/270")
         if rotation != 0:
-            img = img.rotate(rotation, expand=True)
+            cached = self._rotated_image
+            if cache and cached and cached[0] is img and cached[1] == rotation:
+                img = cached[2]
+            else:
+                rotated = img.rotate(rotation, expand=True)
+                self._rotated_image = (img, rotation, rotated) if cache else None
+                img = rotated
         imwidth, imheight = img.size
         if x + imwidth > self.width or y + imheight > self.height:
             raise ValueError(
@@ -225,19 +274,19 @@ class Display:  # pylint: disable-msg=no-member
                     self.width, self.height
                 )
             )
-        if numpy:
-            pixels = bytes(image_to_data(img))
-        else:
-            # Slower but doesn't require numpy
-            pixels = bytearray(imwidth * imheight * 2)
-            for i in range(imwidth):
-                for j in range(imheight):
-                    pix = color565(img.getpixel((i, j)))
-                    pixels[2 * (j * imwidth + i)] = pix >> 8
-                    pixels[2 * (j * imwidth + i) + 1] = pix & 0xFF
-        self._block(x, y, x + imwidth - 1, y + imheight - 1, pixels)
+        if band_height is None:
+            band_height = _BUFFER_SIZE // imwidth
+        band_height = max(1, min(band_height, imheight))
+        channels = len(img.mode)
+        self._block(x, y, x + imwidth - 1, y + imheight - 1, b"")
+        for top in range(0, imheight, band_height):
+            bottom = min(top + band_height, imheight)
+            if top == 0 and bottom == imheight:
+                band = img
+            else:
+                band = img.crop((0, top, imwidth, bottom))
+            self.write(None, _pixels_to_565(band.tobytes(), channels))
 
-    # pylint: disable-msg=too-many-arguments
     def fill_rectangle(
         self, x: int, y: int, width: int, height: int, color: Union[int, Tuple]
     ) -> None:
@@ -29,7 +29,7 @@ except ImportError:
 
 try:
     # Used only for typing
-    from typing import Optional
+    from typing import List, Optional, Tuple
     import busio
     import digitalio
 except ImportError:
@@ -74,6 +74,9 @@ class _SSD1306(framebuf.FrameBuffer):
         page_addressing: bool
     ):
         super().__init__(buffer, width, height, _FRAMEBUF_FORMAT)
+        # MicroPython's framebuf does not track changes, show() then sends everything
+        if hasattr(self, "track_dirty"):
+            self.track_dirty()
         self.width = width
         self.height = height
         self.external_vcc = external_vcc
@@ -119,6 +122,7 @@ class _SSD1306(framebuf.FrameBuffer):
         #   96, 16:         0x60         0x02
         #   64, 48:         0x80         0x12
         #   64, 32:         0x80         0x12
+        self._start_line = 0
         for cmd in (
             SET_DISP,  # off
             # address setting
@@ -188,6 +192,10 @@ class _SSD1306(framebuf.FrameBuffer):
         """Derived class must implement this"""
         raise NotImplementedError
 
+    def write_data(self, start: int, end: int) -> None:
+        """Derived class must implement this"""
+        raise NotImplementedError
+
     def poweron(self) -> None:
         "Reset device and turn on the display."
         if self.reset_pin:
@@ -202,21 +210,96 @@ class _SSD1306(framebuf.FrameBuffer):
 
     def show(self) -> None:
         """Update the display"""
-        if not self.page_addressing:
-            xpos0 = 0
-            xpos1 = self.width - 1
-            if self.width != 128:
-                # narrow displays use centered columns
-                col_offset = (128 - self.width) // 2
-                xpos0 += col_offset
-                xpos1 += col_offset
-            self.write_cmd(SET_COL_ADDR)
-            self.write_cmd(xpos0)
-            self.write_cmd(xpos1)
-            self.write_cmd(SET_PAGE_ADDR)
-            self.write_cmd(0)
-            self.write_cmd(self.pages - 1)
-        self.write_framebuf()
+        # MicroPython's framebuf has no ring_scroll()
+        ring_offset = getattr(self, "ring_offset", 0)
+        if ring_offset != self._start_line:
+            if self.height == 64:
+                # The display RAM has 64 rows, so the start line wraps around like the
+                # rows of the frame buffer
+                self.write_cmd(SET_DISP_START_LINE | ring_offset)
+                self._start_line = ring_offset
+            else:
+                self.ring_normalize()
+        areas = self._dirty_pages()
+        if areas is None:
+            if not self.page_addressing:
+                self._set_window(0, self.width - 1, 0, self.pages - 1)
+            self.write_framebuf()
+        else:
+            for xpos0, xpos1, page0, page1 in areas:
+                self._write_area(xpos0, xpos1, page0, page1)
+        if hasattr(self, "clear_dirty"):
+            self.clear_dirty()
+
+    def _dirty_pages(self) -> Optional[List[Tuple[int, int, int, int]]]:
+        """The changed areas as (first column, last column, first page, last page),
+        or None if the whole frame buffer should be sent."""
+        rects = self.dirty_rects() if hasattr(self, "dirty_rects") else None
+        if rects is None:
+            return None
+        areas = []
+        for x, y, width, height in rects:
+            area = [x, x + width - 1, y // 8, (y + height - 1) // 8]
+            # Areas sharing a page are merged, the display is written in whole pages
+            merged = True
+            while merged:
+                merged = False
+                for other in areas:
+                    if area[2] <= other[3] and other[2] <= area[3]:
+                        areas.remove(other)
+                        area = [
+                            min(area[0], other[0]),
+                            max(area[1], other[1]),
+                            min(area[2], other[2]),
+                            max(area[3], other[3]),
+                        ]
+                        merged = True
+                        break
+            areas.append(area)
+        size = sum((area[1] - area[0] + 1) * (area[3] - area[2] + 1) for area in areas)
+        if size * 4 >= self.width * self.pages * 3:
+            # Not worth the extra commands
+            return None
+        return areas
+
+    def _set_window(self, xpos0: int, xpos1: int, page0: int, page1: int) -> None:
+        """Set the columns and pages written by the following data in Horizontal
+        Addressing Mode"""
+        if self.width != 128:
+            # narrow displays use centered columns
+            col_offset = (128 - self.width) // 2
+            xpos0 += col_offset
+            xpos1 += col_offset
+        self.write_cmd(SET_COL_ADDR)
+        self.write_cmd(xpos0)
+        self.write_cmd(xpos1)
+        self.write_cmd(SET_PAGE_ADDR)
+        self.write_cmd(page0)
+        self.write_cmd(page1)
+
+    def _write_area(self, xpos0: int, xpos1: int, page0: int, page1: int) -> None:
+        """Send the columns ``xpos0`` to ``xpos1`` of pages ``page0`` to ``page1``"""
+        if self.page_addressing:
+            column = (
+                self.page_column_start[0] | (self.page_column_start[1] & 0x0F) << 4
+            ) + xpos0
+            # The column address wraps around like the one set for whole pages
+            column %= 128
+            for page in range(page0, page1 + 1):
+                self.write_cmd(0xB0 + page)
+                self.write_cmd(column & 0x0F)
+                self.write_cmd(0x10 | (column >> 4) & 0x0F)
+                start = page * self.width
+                self.write_data(start + xpos0, start + xpos1 + 1)
+        else:
+            self._set_window(xpos0, xpos1, page0, page1)
+            if xpos0 == 0 and xpos1 == self.width - 1:
+                # Whole rows are contiguous in the frame buffer
+                self.write_data(page0 * self.width, (page1 + 1) * self.width)
+            else:
+                for page in range(page0, page1 + 1):
+                    start = page * self.width
+                    self.write_data(start + xpos0, start + xpos1 + 1)
 
 
 class SSD1306_I2C(_SSD1306):
@@ -286,6 +369,18 @@ class SSD1306_I2C(_SSD1306):
             with self.i2c_device:
                 self.i2c_device.write(self.buffer)
 
+    def write_data(self, start: int, end: int) -> None:
+        """Send bytes ``start`` to ``end`` of the frame buffer in one I2C transaction"""
+        # The data/command byte goes in front of the data, in place of the byte
+        # before it, which is put back afterwards
+        saved = self.buffer[start]
+        self.buffer[start] = 0x40  # Co=0, D/C=1
+        try:
+            with self.i2c_device:
+                self.i2c_device.write(self.buffer, start=start, end=end + 1)
+        finally:
+            self.buffer[start] = saved
+
 
 # pylint: disable-msg=too-many-arguments
 class SSD1306_SPI(_SSD1306):
@@ -350,3 +445,9 @@ class SSD1306_SPI(_SSD1306):
         self.dc_pin.value = 1
         with self.spi_device as spi:
             spi.write(self.buffer)
+
+    def write_data(self, start: int, end: int) -> None:
+        """Send bytes ``start`` to ``end`` of the frame buffer via SPI"""
+        self.dc_pin.value = 1
+        with self.spi_device as spi:
+            spi.write(self.buffer, start=start, end=end)